@@ -0,0 +1,29 @@
+from timeit import Timer
+from typing import List, Tuple
+
+from src.sys.time.duration import Duration
+
+_CASES: List[Tuple[str, str]] = [
+    ("Duration(micros=1)", "Duration(micros=1)"),
+    ("Duration.zero()", "Duration.zero()"),
+    ("a + b", "a + b"),
+    ("a - b", "a - b"),
+    ("a += b", "c = a; c += b"),
+    ("a < b", "a < b"),
+    ("a >= b", "a >= b"),
+    ("a == b", "a == b"),
+    ("a / 2", "a / 2"),
+    ("a % b", "a % b"),
+    ("a.is_positive", "a.is_positive"),
+]
+
+
+def run(number: int = 1_000_000, repeat: int = 5):
+    namespace = {"Duration": Duration, "a": Duration(micros=700), "b": Duration(micros=3)}
+    for name, statement in _CASES:
+        best = min(Timer(stmt=statement, globals=namespace).repeat(repeat=repeat, number=number))
+        print(f"{name:<22}{best * 10 ** 9 / number:8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,60 @@
+from time import perf_counter
+from typing import List, Optional
+
+from src.log import NullLogger
+from src.saga.task import Task
+from src.sys.processor import Processor
+from src.sys.thread import Executable, KernelThread
+from src.sys.time.duration import Duration
+from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
+
+
+class _Endless(Executable):
+    def ticked(self, time_delta: TimeDelta): pass
+
+    def next_event_in(self) -> Optional[Duration]:
+        return None
+
+    def is_finished(self) -> bool:
+        return False
+
+    def get_current_tasks(self) -> List[Task]:
+        return []
+
+    def register_waits(self, timer: WaitTimer): pass
+
+
+def _processor_with(threads: int) -> Processor:
+    logger = NullLogger()
+    processor = Processor(
+        processing_interval=Duration.one_micro(),
+        yielding=False,
+        context_switch_cost=Duration.zero(),
+        logger=logger
+    )
+    for _ in range(threads):
+        processor.assign(KernelThread(_Endless(), logger=logger))
+    return processor
+
+
+# every thread gets one micro of processing and one of switching, so two ticks rotate the run queue by one thread
+def run(queue_lengths: List[int] = [10, 100, 1_000, 10_000, 100_000], rotations: int = 200_000):
+    delta = TimeDelta(duration=Duration.one_micro())
+    for length in queue_lengths:
+        processor = _processor_with(length)
+        for _ in range(2 * length * 10):
+            delta.advance()
+            processor.ticked(delta)
+
+        started = perf_counter()
+        for _ in range(2 * rotations):
+            delta.advance()
+            processor.ticked(delta)
+        elapsed = perf_counter() - started
+
+        print(f"{length:>8} threads{elapsed * 10 ** 9 / rotations:10.1f} ns/rotation")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,19 +1,18 @@
-from src.generate_sagas import generate_and_export
+from src.cache import ReportCache
+from src.cost import CostModel
+from src.saga.dataset import GeneratedDataset
+from src.saga.orchestration import Engine
 from src.sys.system import ProcessingMode
 from src.start_simulation import run_simulation
 
-sagas, _ = generate_and_export(number=2000)
+dataset = GeneratedDataset(number=2000, seed=2000)
 
-# sagas_file_name = "2000sagas.json"
+# sagas_file_name = "2000sagas.sagas"
 # output_dir = "out"
-# path = Path(__file__).parent.joinpath(output_dir).joinpath(sagas_file_name)
-# with open(file=path, mode="r") as file:
-#     serialised_sagas = file.read()
-# _sagas: List[SimpleSaga] = decode(serialised_sagas)
-# print(f"Have read {len(sagas)} sagas from {sagas_file_name}")
+# dataset = StoreDataset(path=str(Path(__file__).parent.joinpath(output_dir).joinpath(sagas_file_name)))
 
 run_simulation(
-    sagas=sagas,
+    sagas=dataset,
     processors=[4, 8, 20, 40, 80],
     number_of_sagas_sets=[1500, 1000, 700, 500, 200, 100, 50],
     thread_orchestrators_modes=[
@@ -21,5 +20,9 @@ run_simulation(
         ProcessingMode.FIXED_POOL_SIZE,
         ProcessingMode.OVERLOADED_PROCESSORS
     ],
-    coroutine_orchestrator=True
+    coroutine_orchestrator=True,
+    engine=Engine.EVENTS,
+    batched=True,
+    cache=ReportCache(directory="out/cache"),
+    cost_model=CostModel(history_path="out/timings.jsonl")
 )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.log import Report
+from src.sys.time.duration import Duration
+
+
+@dataclass(frozen=True)
+class TickAccuracy:
+    tick_length: Duration
+    simulation_duration_error: float
+    processing_percentage_error: float
+    waiting_percentage_error: float
+    overhead_percentage_error: float
+
+    @staticmethod
+    def of(tick_length: Duration, exact: Report, coarse: Report) -> TickAccuracy:
+        return TickAccuracy(
+            tick_length=tick_length,
+            simulation_duration_error=_relative_error(
+                exact.simulation_duration.micros,
+                coarse.simulation_duration.micros
+            ),
+            processing_percentage_error=_relative_error(
+                exact.processor_task_handling_percentage,
+                coarse.processor_task_handling_percentage
+            ),
+            waiting_percentage_error=_relative_error(
+                exact.processor_waiting_percentage,
+                coarse.processor_waiting_percentage
+            ),
+            overhead_percentage_error=_relative_error(
+                exact.processor_overhead_work_percentage,
+                coarse.processor_overhead_work_percentage
+            )
+        )
+
+    def __str__(self):
+        return f"Tick of {self.tick_length.micros}µs compared to 1µs: " \
+               f"simulation duration error={self.simulation_duration_error:.2%}, " \
+               f"processing error={self.processing_percentage_error:.2%}, " \
+               f"waiting error={self.waiting_percentage_error:.2%}, " \
+               f"overhead error={self.overhead_percentage_error:.2%}"
+
+
+def _relative_error(exact: float, coarse: float) -> float:
+    if exact == 0:
+        return 0.0 if coarse == 0 else float("inf")
+    return abs(coarse - exact) / abs(exact)
@@ -0,0 +1,73 @@
+from os import makedirs, remove, scandir, utime, DirEntry
+from os.path import join, isdir
+from typing import Optional, Union, List
+
+from jsonpickle import decode, encode
+
+from src.log import Report
+
+SimulationResult = Union[Report, str]
+
+
+class ReportCache:
+    def __init__(self, directory: str = "out/cache", max_bytes: int = 64 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError(f"Cache size should be positive, got {max_bytes}")
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+
+    def get(self, key: str) -> Optional[SimulationResult]:
+        path = self._path(key)
+        try:
+            with open(path, mode="r") as file:
+                result = decode(file.read())
+        except FileNotFoundError:
+            return None
+        # a truncated or corrupt file, any other decoding failure is a bug in what was stored and propagates
+        except (OSError, ValueError):
+            self._discard(path)
+            return None
+
+        if not isinstance(result, (Report, str)):
+            print(f"Discarding cached entry {path} holding {type(result).__name__} instead of a simulation result")
+            self._discard(path)
+            return None
+        utime(path)
+        return result
+
+    def put(self, key: str, result: SimulationResult):
+        makedirs(self.directory, exist_ok=True)
+        with open(self._path(key), mode="w") as file:
+            file.write(encode(result))
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime_ns)
+        size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if size <= self.max_bytes:
+                return
+            size -= entry.stat().st_size
+            self._discard(entry.path)
+
+    def _entries(self) -> List[DirEntry]:
+        if not isdir(self.directory):
+            return []
+        with scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.is_file() and entry.name.endswith(_EXTENSION)]
+
+    def _path(self, key: str) -> str:
+        return join(self.directory, key + _EXTENSION)
+
+    @staticmethod
+    def _discard(path: str):
+        try:
+            remove(path)
+        except FileNotFoundError:
+            pass
+
+
+_EXTENSION = ".report.json"
@@ -0,0 +1,111 @@
+from dataclasses import dataclass, asdict
+from heapq import heapify, heappop, heappush
+from json import dumps, loads
+from math import log, log2
+from os import makedirs
+from os.path import dirname, exists
+from typing import List, Optional, Dict, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SimulationCost:
+    orchestrator: str
+    engine: str
+    number_of_sagas: int
+    processors: int
+    operation_micros: int
+    tick_micros: int = 1
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.orchestrator, self.engine
+
+    def features(self) -> List[float]:
+        return [
+            1.0,
+            log(max(self.number_of_sagas, 1)),
+            log(max(self.operation_micros, 1)),
+            log(self.processors),
+            log(self.tick_micros)
+        ]
+
+    def prior_seconds(self) -> float:
+        return _PRIOR_FACTORS.get(self.key, 1.0) * _PRIOR_SECONDS_PER_SIMULATED_MICRO * self.operation_micros * \
+            log2(2 + self.processors) / self.tick_micros
+
+
+class CostModel:
+    def __init__(self, history_path: Optional[str] = None):
+        self.history_path: Optional[str] = history_path
+        self._samples: Dict[Tuple[str, str], List[Tuple[SimulationCost, float]]] = {}
+        if history_path is not None and exists(history_path):
+            with open(history_path, mode="r") as history:
+                for line in history:
+                    self._add_sample(**loads(line))
+
+    def estimate(self, cost: SimulationCost) -> float:
+        samples = self._samples.get(cost.key, [])
+        if len(samples) >= _SAMPLES_TO_FIT:
+            return self._fitted(samples, cost)
+        if not samples:
+            samples = [sample for key_samples in self._samples.values() for sample in key_samples]
+        if not samples:
+            return cost.prior_seconds()
+
+        ratio = sum(seconds / sample.prior_seconds() for sample, seconds in samples) / len(samples)
+        return ratio * cost.prior_seconds()
+
+    def record(self, cost: SimulationCost, seconds: float):
+        self._add_sample(seconds=seconds, **asdict(cost))
+        if self.history_path is None:
+            return
+
+        if dirname(self.history_path):
+            makedirs(dirname(self.history_path), exist_ok=True)
+        with open(self.history_path, mode="a") as history:
+            history.write(dumps({**asdict(cost), "seconds": seconds}) + "\n")
+
+    def _add_sample(self, seconds: float, **cost):
+        sample = SimulationCost(**cost)
+        self._samples.setdefault(sample.key, []).append((sample, max(seconds, _MIN_SECONDS)))
+
+    @staticmethod
+    def _fitted(samples: List[Tuple[SimulationCost, float]], cost: SimulationCost) -> float:
+        features = np.array([sample.features() for sample, _ in samples])
+        seconds = np.log([seconds for _, seconds in samples])
+        # ridge keeps the fit defined while the history covers only a few distinct configurations
+        regularisation = _RIDGE * np.eye(features.shape[1])
+        regularisation[0, 0] = 0
+        weights = np.linalg.solve(features.T @ features + regularisation, features.T @ seconds)
+        return float(np.exp(np.array(cost.features()) @ weights))
+
+
+def predicted_makespan(estimates: List[float], workers: int) -> float:
+    loads_per_worker = [0.0] * max(workers, 1)
+    heapify(loads_per_worker)
+    for estimate in sorted(estimates, reverse=True):
+        heappush(loads_per_worker, heappop(loads_per_worker) + estimate)
+    return max(loads_per_worker)
+
+
+_PRIOR_SECONDS_PER_SIMULATED_MICRO = 2e-10
+# geometric means of the recorded seconds over the plain prior, timed on 40 generated sagas with 2 to 20 processors;
+# the tick engine steps through every micro a processor works and yielding processors spin while threads wait
+_PRIOR_FACTORS: Dict[Tuple[str, str], float] = {
+    ("OVERLOADED_PROCESSORS", "TICKS"): 850,
+    ("OVERLOADED_PROCESSORS", "EVENTS"): 0.6,
+    ("OVERLOADED_PROCESSORS", "BATCHED"): 0.65,
+    ("YIELDING_PROCESSORS", "TICKS"): 1100,
+    ("YIELDING_PROCESSORS", "EVENTS"): 75,
+    ("YIELDING_PROCESSORS", "BATCHED"): 130,
+    ("FIXED_POOL_SIZE", "TICKS"): 900,
+    ("FIXED_POOL_SIZE", "EVENTS"): 0.45,
+    ("FIXED_POOL_SIZE", "BATCHED"): 0.4,
+    ("coroutines", "TICKS"): 900,
+    ("coroutines", "EVENTS"): 0.45
+}
+_SAMPLES_TO_FIT = 4
+_RIDGE = 1e-3
+_MIN_SECONDS = 1e-6
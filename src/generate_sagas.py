@@ -2,20 +2,18 @@ from os import makedirs
 from os.path import dirname
 from pathlib import Path
 
-from jsonpickle import encode
 from typing import List, Optional, Tuple
 
-from src.saga.generation import generate_saga
+from src.saga.generation import generate_sagas
 from src.saga.simple_saga import SimpleSaga
+from src.saga.store import OperationStore
 
 
 def _export(s: List[SimpleSaga], name: Optional[str] = None) -> str:
-    serialised = encode(s, indent=4)
-
     addition_to_name = f"-{name}" if name is not None else ""
 
     output_dir = "../out"
-    file_name = f"{len(s)}sagas{addition_to_name}.json"
+    file_name = f"{len(s)}sagas{addition_to_name}.sagas"
     path = Path(__file__).parent.joinpath(output_dir).joinpath(file_name)
 
     print(f"Writing to file {path}")
@@ -24,18 +22,17 @@ def _export(s: List[SimpleSaga], name: Optional[str] = None) -> str:
     except FileExistsError:
         pass  # ignoring
 
-    with open(file=path, mode="w") as file:
-        file.write(serialised)
+    OperationStore.from_sagas(s).save(str(path))
 
     return file_name
 
 
-def generate_and_export(number: int = 2000, name: Optional[str] = None) -> Tuple[List[SimpleSaga], str]:
-    sagas = [
-        generate_saga()
-        for _
-        in range(number)
-    ]
+def generate_and_export(
+        number: int = 2000,
+        name: Optional[str] = None,
+        seed: Optional[int] = None
+) -> Tuple[List[SimpleSaga], str]:
+    sagas = generate_sagas(number=number, seed=seed)
     print(f"Generated {number} sagas")
 
     output_file = _export(sagas, name)
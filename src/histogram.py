@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from src.sys.time.duration import Duration
+
+
+# log-bucketed like an HDR histogram: every power of two is split into the same number of linear sub-buckets,
+# so any value is kept within 1/128 of itself and the memory is bounded by the number of distinct buckets
+class LatencyHistogram:
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count: int = 0
+        self._max: int = 0
+
+    def record(self, latency: Duration):
+        self.record_micros(latency.micros)
+
+    def record_micros(self, micros: int):
+        micros = max(micros, 0)
+        bucket = _bucket_of(micros)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.count += 1
+        if micros > self._max:
+            self._max = micros
+
+    def merge(self, other: LatencyHistogram):
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+        self.count += other.count
+        self._max = max(self._max, other._max)
+
+    # the highest value equivalent to the one at the percentile, never above the largest recorded one
+    def percentile(self, percentile: float) -> Optional[Duration]:
+        if self.count == 0:
+            return None
+        if not 0 < percentile <= 100:
+            raise ValueError(f"Percentile should be in (0, 100], got {percentile}")
+
+        rank = max(1, int(-(-percentile * self.count // 100)))
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return Duration(micros=min(_highest_in_bucket(bucket), self._max))
+        return self.max
+
+    @property
+    def max(self) -> Optional[Duration]:
+        return Duration(micros=self._max) if self.count else None
+
+    def __eq__(self, other: LatencyHistogram) -> bool:
+        if not isinstance(other, type(self)):
+            return False
+        return self._counts == other._counts and self._max == other._max
+
+
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+
+# values below twice the sub-buckets have buckets of their own, above the top bits select the sub-bucket
+def _bucket_of(micros: int) -> int:
+    shift = max(micros.bit_length() - _SUB_BUCKET_BITS - 1, 0)
+    return shift * _SUB_BUCKETS + (micros >> shift)
+
+
+def _highest_in_bucket(bucket: int) -> int:
+    shift = max(bucket // _SUB_BUCKETS - 1, 0)
+    top = bucket - shift * _SUB_BUCKETS
+    return ((top + 1) << shift) - 1
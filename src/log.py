@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from enum import Enum
 from random import shuffle
 from typing import Dict, Optional, Callable, TypeVar, Any, Tuple, List, NewType, Set, Collection, Union, ValuesView
@@ -9,25 +10,39 @@ from uuid import UUID
 
 from termcolor import colored
 
+from src.histogram import LatencyHistogram
 from src.sys.time.duration import Duration
+from src.trace import TraceWriter
+
+
+class LoggingLevel(Enum):
+    FULL = 1
+    COUNTING = 2
+    NONE = 3
 
 
 class LogContext:
-    _logger: Dict[int, TimeLogger] = {}
+    _logger: Dict[int, Logger] = {}
     T = TypeVar('T')
 
+    # a logger built ahead with new_logger is used as given, so the simulated components can log to it directly
     @staticmethod
     def run_logging(
             log_name: str,
             action: Callable[[], T],
             publish_report_every: Optional[Duration] = None,
-            report_publisher: Optional[Callable[[Report], Any]] = None
+            report_publisher: Optional[Callable[[Report], Any]] = None,
+            level: LoggingLevel = LoggingLevel.FULL,
+            trace: Optional[TraceWriter] = None,
+            logger: Optional[Logger] = None
     ) -> T:
         thread_number = threading.get_ident()
-        LogContext._logger[thread_number] = TimeLogger(
+        LogContext._logger[thread_number] = logger if logger is not None else LogContext.new_logger(
+            level=level,
             name=log_name,
             publish_report_every=publish_report_every,
-            report_publisher=report_publisher
+            report_publisher=report_publisher,
+            trace=trace
         )
 
         try:
@@ -39,13 +54,46 @@ class LogContext:
         return result
 
     @staticmethod
-    def logger() -> Optional[TimeLogger]:
+    def logger() -> Optional[Logger]:
         return LogContext._logger.get(threading.get_ident())
 
     @staticmethod
     def shift_time():
         LogContext.logger().shift_time()
 
+    @staticmethod
+    def new_logger(
+            level: LoggingLevel,
+            name: str,
+            publish_report_every: Optional[Duration] = None,
+            report_publisher: Optional[Callable[[Report], Any]] = None,
+            trace: Optional[TraceWriter] = None
+    ) -> Logger:
+        logger = LogContext._new_logger(
+            level=level,
+            name=name,
+            publish_report_every=publish_report_every,
+            report_publisher=report_publisher
+        )
+        return TracingLogger(logger=logger, writer=trace) if trace is not None else logger
+
+    @staticmethod
+    def _new_logger(
+            level: LoggingLevel,
+            name: str,
+            publish_report_every: Optional[Duration],
+            report_publisher: Optional[Callable[[Report], Any]]
+    ) -> Logger:
+        if level is LoggingLevel.NONE:
+            return NullLogger()
+        if level is LoggingLevel.COUNTING:
+            return CountingLogger(
+                name=name,
+                publish_report_every=publish_report_every,
+                report_publisher=report_publisher
+            )
+        return TimeLogger(name=name, publish_report_every=publish_report_every, report_publisher=report_publisher)
+
 
 Percentage = NewType('Percentage', float)
 ProcessorNumber = NewType('ProcessorNumber', int)
@@ -56,6 +104,99 @@ class _Action(Enum):
     PROCESSING = 2
     OVERHEAD = 3
 
+    # members are singletons, so identity hashing is consistent with equality and much cheaper than Enum's
+    __hash__ = object.__hash__
+
+
+ActionSums = Dict[Tuple[ProcessorNumber, _Action], Duration]
+
+
+@dataclass
+class SchedulingLog:
+    max_queue_length: int = 0
+    queued_micros: int = 0
+    voluntary_switches: int = 0
+    involuntary_switches: int = 0
+    delays: LatencyHistogram = field(default_factory=LatencyHistogram)
+    lifetimes: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def queued(self, queue_length: int):
+        if queue_length > self.max_queue_length:
+            self.max_queue_length = queue_length
+
+    def dispatched(self, delay: Duration):
+        self.queued_micros += delay.micros
+        self.delays.record_micros(delay.micros)
+
+    def switched(self, voluntary: bool):
+        if voluntary:
+            self.voluntary_switches += 1
+        else:
+            self.involuntary_switches += 1
+
+    def finished(self, lifetime: Duration):
+        self.lifetimes.record_micros(lifetime.micros)
+
+    def merge(self, other: SchedulingLog):
+        self.max_queue_length = max(self.max_queue_length, other.max_queue_length)
+        self.queued_micros += other.queued_micros
+        self.voluntary_switches += other.voluntary_switches
+        self.involuntary_switches += other.involuntary_switches
+        self.delays.merge(other.delays)
+        self.lifetimes.merge(other.lifetimes)
+
+
+@dataclass
+class ProcessorLog:
+    processor_number: ProcessorNumber
+    duration: Duration
+    sums: ActionSums
+    latencies: Optional[LatencyHistogram] = None
+    scheduling: Optional[SchedulingLog] = None
+
+    # the rest of the duration is waiting
+    @staticmethod
+    def of(
+            processor_number: ProcessorNumber,
+            duration: Duration,
+            processing: Duration,
+            overhead: Duration,
+            latencies: Optional[LatencyHistogram] = None,
+            scheduling: Optional[SchedulingLog] = None
+    ) -> ProcessorLog:
+        action_to_duration = {
+            _Action.PROCESSING: processing,
+            _Action.OVERHEAD: overhead,
+            _Action.WAITING: duration - processing - overhead
+        }
+        return ProcessorLog(
+            processor_number=processor_number,
+            duration=duration,
+            sums={
+                (processor_number, action): action_duration
+                for action, action_duration
+                in action_to_duration.items()
+                if action_duration.is_positive
+            },
+            latencies=latencies,
+            scheduling=scheduling
+        )
+
+
+# the run queue of a processor holds the threads waiting for it, the delay is the time one spent there
+@dataclass
+class SchedulingReport:
+    avg_run_queue_length: float
+    max_run_queue_length: int
+    voluntary_context_switches: int
+    involuntary_context_switches: int
+    scheduling_delay_p50: Optional[Duration]
+    scheduling_delay_p99: Optional[Duration]
+    scheduling_delay_max: Optional[Duration]
+    thread_lifetime_p50: Optional[Duration]
+    thread_lifetime_p99: Optional[Duration]
+    thread_lifetime_max: Optional[Duration]
+
 
 @dataclass
 class Report:
@@ -71,8 +212,186 @@ class Report:
     avg_processor_overhead_work: Duration
     processor_overhead_work_percentage: Percentage
 
+    # from the instant a saga entered the system till it finished, None while no saga finished
+    latency_p50: Optional[Duration] = None
+    latency_p90: Optional[Duration] = None
+    latency_p99: Optional[Duration] = None
+    latency_p999: Optional[Duration] = None
+    latency_max: Optional[Duration] = None
+
+    scheduling: Optional[SchedulingReport] = None
+
+
+class Logger(ABC):
+    @abstractmethod
+    def close(self): pass
+
+    @abstractmethod
+    def shift_time(self): pass
+
+    @abstractmethod
+    def set_tick_length(self, tick_length: Duration): pass
+
+    @abstractmethod
+    def time_to_next_report(self) -> Optional[Duration]: pass
+
+    @abstractmethod
+    def log_processor_tick(self, proc_number: ProcessorNumber): pass
+
+    @abstractmethod
+    def log_task_processing(self, name: str, identifier: UUID, saga: Optional[str] = None): pass
+
+    @abstractmethod
+    def log_overhead_tick(self): pass
+
+    # an idle processor is not ticked from the current tick on, but keeps waiting till it is active again
+    @abstractmethod
+    def log_processor_idle(self, proc_number: ProcessorNumber): pass
+
+    @abstractmethod
+    def log_processor_active(self, proc_number: ProcessorNumber): pass
+
+    # a saga finished in the current tick, it entered the system at the given instant
+    @abstractmethod
+    def log_saga_finished(self, started: Duration): pass
+
+    @abstractmethod
+    def log_thread_queued(self, proc_number: ProcessorNumber, queue_length: int): pass
+
+    @abstractmethod
+    def log_thread_dispatched(self, proc_number: ProcessorNumber, delay: Duration): pass
+
+    # voluntary when the thread yielded, involuntary when its timeslice ran out
+    @abstractmethod
+    def log_context_switch(self, proc_number: ProcessorNumber, voluntary: bool): pass
+
+    @abstractmethod
+    def log_thread_finished(self, proc_number: ProcessorNumber, lifetime: Duration): pass
+
+    @abstractmethod
+    def sums(self) -> ActionSums: pass
+
+    @abstractmethod
+    def latencies(self) -> LatencyHistogram: pass
+
+    @abstractmethod
+    def scheduling(self) -> Dict[ProcessorNumber, SchedulingLog]: pass
+
+    # accounts processors simulated apart as if they were ticked here; the ones finished earlier wait till the end
+    @abstractmethod
+    def merge(self, logs: List[ProcessorLog]): pass
+
+    # a fresh logger of the same level for processors simulated apart, its logs are merged back rather than published;
+    # None when the run cannot be logged apart
+    @abstractmethod
+    def detached(self) -> Optional[Logger]: pass
+
+
+class ContextLogger(Logger):
+    def close(self):
+        LogContext.logger().close()
+
+    def shift_time(self):
+        LogContext.logger().shift_time()
 
-class TimeLogger:
+    def set_tick_length(self, tick_length: Duration):
+        LogContext.logger().set_tick_length(tick_length)
+
+    def time_to_next_report(self) -> Optional[Duration]:
+        return LogContext.logger().time_to_next_report()
+
+    def log_processor_tick(self, proc_number: ProcessorNumber):
+        LogContext.logger().log_processor_tick(proc_number=proc_number)
+
+    def log_task_processing(self, name: str, identifier: UUID, saga: Optional[str] = None):
+        LogContext.logger().log_task_processing(name=name, identifier=identifier, saga=saga)
+
+    def log_overhead_tick(self):
+        LogContext.logger().log_overhead_tick()
+
+    def log_processor_idle(self, proc_number: ProcessorNumber):
+        LogContext.logger().log_processor_idle(proc_number=proc_number)
+
+    def log_processor_active(self, proc_number: ProcessorNumber):
+        LogContext.logger().log_processor_active(proc_number=proc_number)
+
+    def log_saga_finished(self, started: Duration):
+        LogContext.logger().log_saga_finished(started=started)
+
+    def log_thread_queued(self, proc_number: ProcessorNumber, queue_length: int):
+        LogContext.logger().log_thread_queued(proc_number=proc_number, queue_length=queue_length)
+
+    def log_thread_dispatched(self, proc_number: ProcessorNumber, delay: Duration):
+        LogContext.logger().log_thread_dispatched(proc_number=proc_number, delay=delay)
+
+    def log_context_switch(self, proc_number: ProcessorNumber, voluntary: bool):
+        LogContext.logger().log_context_switch(proc_number=proc_number, voluntary=voluntary)
+
+    def log_thread_finished(self, proc_number: ProcessorNumber, lifetime: Duration):
+        LogContext.logger().log_thread_finished(proc_number=proc_number, lifetime=lifetime)
+
+    def sums(self) -> ActionSums:
+        return LogContext.logger().sums()
+
+    def latencies(self) -> LatencyHistogram:
+        return LogContext.logger().latencies()
+
+    def scheduling(self) -> Dict[ProcessorNumber, SchedulingLog]:
+        return LogContext.logger().scheduling()
+
+    def merge(self, logs: List[ProcessorLog]):
+        LogContext.logger().merge(logs)
+
+    def detached(self) -> Optional[Logger]:
+        return LogContext.logger().detached()
+
+
+class NullLogger(Logger):
+    def close(self): pass
+
+    def shift_time(self): pass
+
+    def set_tick_length(self, tick_length: Duration): pass
+
+    def time_to_next_report(self) -> Optional[Duration]:
+        return None
+
+    def log_processor_tick(self, proc_number: ProcessorNumber): pass
+
+    def log_task_processing(self, name: str, identifier: UUID, saga: Optional[str] = None): pass
+
+    def log_overhead_tick(self): pass
+
+    def log_processor_idle(self, proc_number: ProcessorNumber): pass
+
+    def log_processor_active(self, proc_number: ProcessorNumber): pass
+
+    def log_saga_finished(self, started: Duration): pass
+
+    def log_thread_queued(self, proc_number: ProcessorNumber, queue_length: int): pass
+
+    def log_thread_dispatched(self, proc_number: ProcessorNumber, delay: Duration): pass
+
+    def log_context_switch(self, proc_number: ProcessorNumber, voluntary: bool): pass
+
+    def log_thread_finished(self, proc_number: ProcessorNumber, lifetime: Duration): pass
+
+    def sums(self) -> ActionSums:
+        return {}
+
+    def latencies(self) -> LatencyHistogram:
+        return LatencyHistogram()
+
+    def scheduling(self) -> Dict[ProcessorNumber, SchedulingLog]:
+        return {}
+
+    def merge(self, logs: List[ProcessorLog]): pass
+
+    def detached(self) -> Optional[Logger]:
+        return NullLogger()
+
+
+class TimeLogger(Logger):
     def __init__(
             self,
             name: str,
@@ -83,10 +402,15 @@ class TimeLogger:
         self.name: str = name
         self._publish_report_every: Duration = publish_report_every
         self._duration: Duration = Duration(micros=1)
+        self._tick_length: Duration = Duration.one_micro()
+        self._next_report_at: Optional[Duration] = publish_report_every
 
         self._ticked_processor: Optional[ProcessorNumber] = None
-        self._proc_to_last_action_duration: Dict[ProcessorNumber, Tuple[_Action, Duration]] = {}
+        self._proc_to_last_action_micros: Dict[ProcessorNumber, Tuple[_Action, int]] = {}
         self._proc_and_action_to_sum_duration: Dict[Tuple[ProcessorNumber, _Action], Duration] = {}
+        self._proc_to_idle_since_micros: Dict[ProcessorNumber, int] = {}
+        self._latencies: LatencyHistogram = LatencyHistogram()
+        self._scheduling: Dict[ProcessorNumber, SchedulingLog] = {}
 
     def close(self):
         self._account_last_actions()
@@ -98,24 +422,89 @@ class TimeLogger:
         if self._ticked_processor is not None:
             self._handle_log_action(action=_Action.WAITING)
 
-        self._duration = self._duration + Duration(micros=1)
+        self._duration = self._duration + self._tick_length
 
-        if self._publish_report_every is not None and \
-                (self._duration % self._publish_report_every) == Duration.zero():
+        # a tick longer than one micro can step over the report instant, it is then reported at the tick crossing it
+        if self._next_report_at is not None and self._duration >= self._next_report_at:
+            every = self._publish_report_every.micros
+            self._next_report_at = Duration.of((self._duration.micros // every + 1) * every)
             self._account_last_actions()
 
             report = self._generate_report()
             self._publisher(report)
 
+    def set_tick_length(self, tick_length: Duration):
+        self._tick_length = tick_length
+
+    def time_to_next_report(self) -> Optional[Duration]:
+        if self._next_report_at is None:
+            return None
+        return self._next_report_at - self._duration
+
     def log_processor_tick(self, proc_number: ProcessorNumber):
         if self._ticked_processor is not None:
             self._handle_log_action(action=_Action.WAITING)
 
         self._ticked_processor = proc_number
 
-    def log_task_processing(self, name: str, identifier: UUID):
+    def log_task_processing(self, name: str, identifier: UUID, saga: Optional[str] = None):
         self._log_task(identifier=identifier, action=_Action.PROCESSING)
 
+    def log_processor_idle(self, proc_number: ProcessorNumber):
+        self._proc_to_idle_since_micros[proc_number] = self._duration.micros
+
+    def log_processor_active(self, proc_number: ProcessorNumber):
+        self._account_idle_processors()
+        self._proc_to_idle_since_micros.pop(proc_number, None)
+
+    # the log starts at 1µs, the current tick ends a tick length after its start
+    def log_saga_finished(self, started: Duration):
+        self._latencies.record_micros(self._duration.micros - 1 + self._tick_length.micros - started.micros)
+
+    def sums(self) -> ActionSums:
+        self._account_last_actions()
+        return dict(self._proc_and_action_to_sum_duration)
+
+    def log_thread_queued(self, proc_number: ProcessorNumber, queue_length: int):
+        _scheduling_of(self._scheduling, proc_number).queued(queue_length)
+
+    def log_thread_dispatched(self, proc_number: ProcessorNumber, delay: Duration):
+        _scheduling_of(self._scheduling, proc_number).dispatched(delay)
+
+    def log_context_switch(self, proc_number: ProcessorNumber, voluntary: bool):
+        _scheduling_of(self._scheduling, proc_number).switched(voluntary)
+
+    def log_thread_finished(self, proc_number: ProcessorNumber, lifetime: Duration):
+        _scheduling_of(self._scheduling, proc_number).finished(lifetime)
+
+    def latencies(self) -> LatencyHistogram:
+        return self._latencies
+
+    def scheduling(self) -> Dict[ProcessorNumber, SchedulingLog]:
+        return self._scheduling
+
+    def merge(self, logs: List[ProcessorLog]):
+        self._account_last_actions()
+
+        duration = max([log.duration for log in logs], default=Duration.zero())
+        for log in logs:
+            for (proc_number, action), sum_duration in log.sums.items():
+                self._add_to_sum(proc_number, action, sum_duration)
+            if log.duration < duration:
+                self._add_to_sum(log.processor_number, _Action.WAITING, duration - log.duration)
+            if log.latencies is not None:
+                self._latencies.merge(log.latencies)
+            if log.scheduling is not None:
+                _scheduling_of(self._scheduling, log.processor_number).merge(log.scheduling)
+
+        self._duration = self._duration + duration
+
+    # a report published every period needs every processor, so such runs are not split
+    def detached(self) -> Optional[Logger]:
+        if self._publish_report_every is not None:
+            return None
+        return TimeLogger(name=self.name, report_publisher=_unpublished)
+
     def log_overhead_tick(self):
         self._log_task(identifier="overhead", action=_Action.OVERHEAD)
 
@@ -129,104 +518,410 @@ class TimeLogger:
         proc_number = self._ticked_processor
         self._ticked_processor = None
 
-        last_action_and_its_duration = self._proc_to_last_action_duration.get(proc_number)
-        if last_action_and_its_duration is None:
-            self._proc_to_last_action_duration[proc_number] = action, Duration(micros=1)
+        tick_micros = self._tick_length.micros
+        last_action_and_its_micros = self._proc_to_last_action_micros.get(proc_number)
+        if last_action_and_its_micros is None:
+            self._proc_to_last_action_micros[proc_number] = action, tick_micros
             return
 
-        (last_action, last_action_duration) = last_action_and_its_duration
+        (last_action, last_action_micros) = last_action_and_its_micros
 
         if last_action == action:
-            last_action_duration += Duration(micros=1)
+            self._proc_to_last_action_micros[proc_number] = action, last_action_micros + tick_micros
             return
 
-        self._proc_to_last_action_duration[proc_number] = action, Duration(micros=1)
+        self._proc_to_last_action_micros[proc_number] = action, tick_micros
+        self._add_to_sum(proc_number, last_action, Duration.of(last_action_micros))
+
+    def _account_last_actions(self):
+        self._account_idle_processors()
+        for processor_number, (action, micros) in self._proc_to_last_action_micros.items():
+            self._add_to_sum(processor_number, action, Duration.of(micros))
+        self._proc_to_last_action_micros.clear()
+
+    def _account_idle_processors(self):
+        now = self._duration.micros
+        for processor_number, since in self._proc_to_idle_since_micros.items():
+            if now > since:
+                self._add_to_sum(processor_number, _Action.WAITING, Duration.of(now - since))
+                self._proc_to_idle_since_micros[processor_number] = now
+
+    def _add_to_sum(self, proc_number: ProcessorNumber, action: _Action, duration: Duration):
+        action_sum_duration = self._proc_and_action_to_sum_duration.get((proc_number, action), Duration.zero())
+        self._proc_and_action_to_sum_duration[proc_number, action] = action_sum_duration + duration
 
-        last_action_sum_duration = self._proc_and_action_to_sum_duration.get(
-            (proc_number, last_action),
-            Duration(micros=0)
+    def _generate_report(self) -> Report:
+        return _report(
+            name=self.name,
+            duration=self._duration,
+            sums=self._proc_and_action_to_sum_duration,
+            latencies=self._latencies,
+            scheduling=self._scheduling
         )
-        self._proc_and_action_to_sum_duration[proc_number, last_action] = \
-            last_action_sum_duration + last_action_duration
 
-    def _account_last_actions(self):
-        for processor_number, (action, duration) in self._proc_to_last_action_duration.items():
-            action_sum_duration = self._proc_and_action_to_sum_duration.get(
-                (processor_number, action),
-                Duration(micros=0)
-            )
-            self._proc_and_action_to_sum_duration[processor_number, action] = \
-                action_sum_duration + duration
-        self._proc_to_last_action_duration.clear()
+    @staticmethod
+    def _avg_percentage(percentages: Union[Collection[Percentage], ValuesView[Percentage]]) -> Percentage:
+        sum_of_all = 0
+        for percentage in percentages:
+            sum_of_all += percentage
+        return Percentage(sum_of_all / len(percentages))
+
+
+# only sums the micros every processor spent on each action, which is all its reports are made of
+class CountingLogger(Logger):
+    def __init__(
+            self,
+            name: str,
+            publish_report_every: Optional[Duration] = None,
+            report_publisher: Optional[Callable[[Report], Any]] = None
+    ):
+        self._publisher = report_publisher if report_publisher is not None else lambda report: print_coloured(report)
+        self.name: str = name
+        self._publish_report_every: Optional[Duration] = publish_report_every
+        self._next_report_at: Optional[int] = publish_report_every.micros if publish_report_every is not None else None
+        self._micros: int = 1
+        self._tick_micros: int = 1
+
+        self._ticked_processor: Optional[ProcessorNumber] = None
+        self._proc_and_action_to_micros: Dict[Tuple[ProcessorNumber, _Action], int] = {}
+        self._proc_to_idle_since_micros: Dict[ProcessorNumber, int] = {}
+        self._latencies: LatencyHistogram = LatencyHistogram()
+        self._scheduling: Dict[ProcessorNumber, SchedulingLog] = {}
+
+    def close(self):
+        self._publisher(self._generate_report())
+
+    def shift_time(self):
+        if self._ticked_processor is not None:
+            self._count(_Action.WAITING)
+
+        self._micros += self._tick_micros
+
+        if self._next_report_at is not None and self._micros >= self._next_report_at:
+            every = self._publish_report_every.micros
+            self._next_report_at = (self._micros // every + 1) * every
+            self._publisher(self._generate_report())
+
+    def set_tick_length(self, tick_length: Duration):
+        self._tick_micros = tick_length.micros
+
+    def time_to_next_report(self) -> Optional[Duration]:
+        if self._next_report_at is None:
+            return None
+        return Duration.of(self._next_report_at - self._micros)
+
+    def log_processor_tick(self, proc_number: ProcessorNumber):
+        if self._ticked_processor is not None:
+            self._count(_Action.WAITING)
+
+        self._ticked_processor = proc_number
+
+    def log_task_processing(self, name: str, identifier: UUID, saga: Optional[str] = None):
+        self._count(_Action.PROCESSING)
+
+    def log_overhead_tick(self):
+        self._count(_Action.OVERHEAD)
+
+    def log_processor_idle(self, proc_number: ProcessorNumber):
+        self._proc_to_idle_since_micros[proc_number] = self._micros
+
+    def log_processor_active(self, proc_number: ProcessorNumber):
+        self._count_idle_processors()
+        self._proc_to_idle_since_micros.pop(proc_number, None)
+
+    def log_saga_finished(self, started: Duration):
+        self._latencies.record_micros(self._micros - 1 + self._tick_micros - started.micros)
+
+    def log_thread_queued(self, proc_number: ProcessorNumber, queue_length: int):
+        _scheduling_of(self._scheduling, proc_number).queued(queue_length)
+
+    def log_thread_dispatched(self, proc_number: ProcessorNumber, delay: Duration):
+        _scheduling_of(self._scheduling, proc_number).dispatched(delay)
+
+    def log_context_switch(self, proc_number: ProcessorNumber, voluntary: bool):
+        _scheduling_of(self._scheduling, proc_number).switched(voluntary)
+
+    def log_thread_finished(self, proc_number: ProcessorNumber, lifetime: Duration):
+        _scheduling_of(self._scheduling, proc_number).finished(lifetime)
+
+    def sums(self) -> ActionSums:
+        self._count_idle_processors()
+        return {key: Duration.of(micros) for key, micros in self._proc_and_action_to_micros.items()}
+
+    def latencies(self) -> LatencyHistogram:
+        return self._latencies
+
+    def scheduling(self) -> Dict[ProcessorNumber, SchedulingLog]:
+        return self._scheduling
+
+    def merge(self, logs: List[ProcessorLog]):
+        self._count_idle_processors()
+
+        micros = max([log.duration.micros for log in logs], default=0)
+        for log in logs:
+            for key, sum_duration in log.sums.items():
+                self._add_micros(key, sum_duration.micros)
+            if log.duration.micros < micros:
+                self._add_micros((log.processor_number, _Action.WAITING), micros - log.duration.micros)
+            if log.latencies is not None:
+                self._latencies.merge(log.latencies)
+            if log.scheduling is not None:
+                _scheduling_of(self._scheduling, log.processor_number).merge(log.scheduling)
+
+        self._micros += micros
+
+    def detached(self) -> Optional[Logger]:
+        if self._publish_report_every is not None:
+            return None
+        return CountingLogger(name=self.name, report_publisher=_unpublished)
+
+    def _count(self, action: _Action):
+        proc_number = self._ticked_processor
+        if proc_number is None:
+            raise ValueError("Task ticked when processor is not ticked before. "
+                             "Or the task ticked more then once / a few tasks ticked after a processor is ticked")
+        self._ticked_processor = None
+        self._add_micros((proc_number, action), self._tick_micros)
+
+    def _add_micros(self, key: Tuple[ProcessorNumber, _Action], micros: int):
+        self._proc_and_action_to_micros[key] = self._proc_and_action_to_micros.get(key, 0) + micros
+
+    def _count_idle_processors(self):
+        now = self._micros
+        for processor_number, since in self._proc_to_idle_since_micros.items():
+            if now > since:
+                self._add_micros((processor_number, _Action.WAITING), now - since)
+                self._proc_to_idle_since_micros[processor_number] = now
 
     def _generate_report(self) -> Report:
-        processor_work_ratio = self._processors_work_ratio()
-
-        return Report(
-            log_name=self.name,
-            simulation_duration=self._duration,
-            avg_processor_task_handling=self._avg_time_per_action(_Action.PROCESSING),
-            processor_task_handling_percentage=processor_work_ratio.get(_Action.PROCESSING, 0),
-            avg_processor_waiting=self._avg_time_per_action(_Action.WAITING),
-            processor_waiting_percentage=processor_work_ratio.get(_Action.WAITING, 0),
-            avg_processor_overhead_work=self._avg_time_per_action(_Action.OVERHEAD),
-            processor_overhead_work_percentage=processor_work_ratio.get(_Action.OVERHEAD, 0)
+        return _report(
+            name=self.name,
+            duration=Duration.of(self._micros),
+            sums=self.sums(),
+            latencies=self._latencies,
+            scheduling=self._scheduling
         )
 
-    def _avg_time_per_action(self, action: _Action) -> Duration:
-        return Duration.avg(
-            *[
-                self._proc_and_action_to_sum_duration.get((processor_num, action), Duration(micros=0))
-                for processor_num
-                in self._numbers_of_processors()
+
+def _scheduling_of(scheduling: Dict[ProcessorNumber, SchedulingLog], proc_number: ProcessorNumber) -> SchedulingLog:
+    log = scheduling.get(proc_number)
+    if log is None:
+        log = scheduling[proc_number] = SchedulingLog()
+    return log
+
+
+def _report(
+        name: str,
+        duration: Duration,
+        sums: ActionSums,
+        latencies: LatencyHistogram,
+        scheduling: Dict[ProcessorNumber, SchedulingLog]
+) -> Report:
+    processor_work_ratio = _processors_work_ratio(sums)
+
+    return Report(
+        log_name=name,
+        simulation_duration=duration,
+        avg_processor_task_handling=_avg_time_per_action(sums, _Action.PROCESSING),
+        processor_task_handling_percentage=processor_work_ratio.get(_Action.PROCESSING, 0),
+        avg_processor_waiting=_avg_time_per_action(sums, _Action.WAITING),
+        processor_waiting_percentage=processor_work_ratio.get(_Action.WAITING, 0),
+        avg_processor_overhead_work=_avg_time_per_action(sums, _Action.OVERHEAD),
+        processor_overhead_work_percentage=processor_work_ratio.get(_Action.OVERHEAD, 0),
+        latency_p50=latencies.percentile(50),
+        latency_p90=latencies.percentile(90),
+        latency_p99=latencies.percentile(99),
+        latency_p999=latencies.percentile(99.9),
+        latency_max=latencies.max,
+        scheduling=_scheduling_report(duration, sums, scheduling)
+    )
+
+
+# the time averaged length of a run queue is the time threads spent in it over the elapsed time
+def _scheduling_report(
+        duration: Duration,
+        sums: ActionSums,
+        scheduling: Dict[ProcessorNumber, SchedulingLog]
+) -> Optional[SchedulingReport]:
+    if not scheduling:
+        return None
+
+    delays = LatencyHistogram()
+    lifetimes = LatencyHistogram()
+    for log in scheduling.values():
+        delays.merge(log.delays)
+        lifetimes.merge(log.lifetimes)
+    processors_number = len(_numbers_of_processors(sums) | set(scheduling))
+    queued_micros = sum(log.queued_micros for log in scheduling.values())
+    elapsed_micros = max(duration.micros - 1, 1)
+
+    return SchedulingReport(
+        avg_run_queue_length=queued_micros / elapsed_micros / processors_number,
+        max_run_queue_length=max(log.max_queue_length for log in scheduling.values()),
+        voluntary_context_switches=sum(log.voluntary_switches for log in scheduling.values()),
+        involuntary_context_switches=sum(log.involuntary_switches for log in scheduling.values()),
+        scheduling_delay_p50=delays.percentile(50),
+        scheduling_delay_p99=delays.percentile(99),
+        scheduling_delay_max=delays.max,
+        thread_lifetime_p50=lifetimes.percentile(50),
+        thread_lifetime_p99=lifetimes.percentile(99),
+        thread_lifetime_max=lifetimes.max
+    )
+
+
+def _avg_time_per_action(sums: ActionSums, action: _Action) -> Duration:
+    return Duration.avg(
+        *[
+            sums.get((processor_num, action), Duration(micros=0))
+            for processor_num
+            in _numbers_of_processors(sums)
+        ]
+    )
+
+
+def _processors_work_ratio(sums: ActionSums) -> Dict[_Action, Percentage]:
+    numbers_of_processors = _numbers_of_processors(sums)
+    processors_number = len(numbers_of_processors)
+
+    processor_and_action_to_processing_percentage: Dict[Tuple[ProcessorNumber, _Action], Percentage] = {}
+    for processor_number in numbers_of_processors:
+        processor_action_to_sum_duration: Dict[_Action, Duration] = dict([
+            (
+                action,
+                sums.get((processor_number, action), Duration.zero())
+            )
+            for action
+            in _Action
+        ])
+        sum_duration_of_all_actions = Duration.sum(*processor_action_to_sum_duration.values())
+
+        for action, sum_duration_of_action in processor_action_to_sum_duration.items():
+            processor_and_action_to_processing_percentage[processor_number, action] = \
+                Percentage(float(sum_duration_of_action.micros) * 100 / sum_duration_of_all_actions.micros)
+
+    action_to_percentage: Dict[_Action, Percentage] = {}
+    for action in _Action:
+        sum_of_action_percentage_of_processors = sum(
+            [
+                processor_and_action_to_processing_percentage[proc_number, action]
+                for proc_number
+                in numbers_of_processors
             ]
         )
+        action_to_percentage[action] = \
+            Percentage(sum_of_action_percentage_of_processors / processors_number) \
+                if processors_number != 0 \
+                else Percentage(0)
 
-    def _processors_work_ratio(self) -> Dict[_Action, Percentage]:
-        numbers_of_processors = self._numbers_of_processors()
-        processors_number = len(numbers_of_processors)
-
-        processor_and_action_to_processing_percentage: Dict[Tuple[ProcessorNumber, _Action], Percentage] = {}
-        for processor_number in numbers_of_processors:
-            processor_action_to_sum_duration: Dict[_Action, Duration] = dict([
-                (
-                    action,
-                    self._proc_and_action_to_sum_duration.get((processor_number, action), Duration.zero())
-                )
-                for action
-                in _Action
-            ])
-            sum_duration_of_all_actions = Duration.sum(*processor_action_to_sum_duration.values())
-
-            for action, sum_duration_of_action in processor_action_to_sum_duration.items():
-                processor_and_action_to_processing_percentage[processor_number, action] = \
-                    Percentage(float(sum_duration_of_action.micros) * 100 / sum_duration_of_all_actions.micros)
-
-        action_to_percentage: Dict[_Action, Percentage] = {}
-        for action in _Action:
-            sum_of_action_percentage_of_processors = sum(
-                [
-                    processor_and_action_to_processing_percentage[proc_number, action]
-                    for proc_number
-                    in numbers_of_processors
-                ]
-            )
-            action_to_percentage[action] = \
-                Percentage(sum_of_action_percentage_of_processors / processors_number) \
-                    if processors_number != 0 \
-                    else Percentage(0)
+    return action_to_percentage
 
-        return action_to_percentage
 
-    def _numbers_of_processors(self) -> Set[ProcessorNumber]:
-        return set([proc_num for proc_num, action in self._proc_and_action_to_sum_duration.keys()])
+def _numbers_of_processors(sums: ActionSums) -> Set[ProcessorNumber]:
+    return set([proc_num for proc_num, action in sums.keys()])
 
-    @staticmethod
-    def _avg_percentage(percentages: Union[Collection[Percentage], ValuesView[Percentage]]) -> Percentage:
-        sum_of_all = 0
-        for percentage in percentages:
-            sum_of_all += percentage
-        return Percentage(sum_of_all / len(percentages))
+
+# writes what every ticked processor did as spans, consecutive ticks of the same action and saga make one span,
+# an idle processor is not ticked so it leaves a gap
+class TracingLogger(Logger):
+    def __init__(self, logger: Logger, writer: TraceWriter):
+        self._logger: Logger = logger
+        self._writer: TraceWriter = writer
+        self._tick_start: int = 0
+        self._tick_length: int = 1
+        self._ticked_processor: Optional[ProcessorNumber] = None
+        # action, saga, start and end of the span a processor is in
+        self._spans: Dict[ProcessorNumber, List[Any]] = {}
+
+    def close(self):
+        try:
+            for processor_number, (action, saga, start, end) in self._spans.items():
+                self._writer.write_span(processor_number, action.name.lower(), start, end - start, saga)
+            self._spans.clear()
+        finally:
+            self._writer.close()
+        self._logger.close()
+
+    def shift_time(self):
+        if self._ticked_processor is not None:
+            self._record(_Action.WAITING, None)
+        self._logger.shift_time()
+        self._tick_start += self._tick_length
+
+    def set_tick_length(self, tick_length: Duration):
+        self._tick_length = tick_length.micros
+        self._logger.set_tick_length(tick_length)
+
+    def time_to_next_report(self) -> Optional[Duration]:
+        return self._logger.time_to_next_report()
+
+    def log_processor_tick(self, proc_number: ProcessorNumber):
+        if self._ticked_processor is not None:
+            self._record(_Action.WAITING, None)
+        self._logger.log_processor_tick(proc_number=proc_number)
+        self._ticked_processor = proc_number
+
+    def log_task_processing(self, name: str, identifier: UUID, saga: Optional[str] = None):
+        self._logger.log_task_processing(name=name, identifier=identifier, saga=saga)
+        self._record(_Action.PROCESSING, saga)
+
+    def log_overhead_tick(self):
+        self._logger.log_overhead_tick()
+        self._record(_Action.OVERHEAD, None)
+
+    def log_processor_idle(self, proc_number: ProcessorNumber):
+        self._logger.log_processor_idle(proc_number=proc_number)
+
+    def log_processor_active(self, proc_number: ProcessorNumber):
+        self._logger.log_processor_active(proc_number=proc_number)
+
+    def log_saga_finished(self, started: Duration):
+        self._logger.log_saga_finished(started=started)
+
+    def log_thread_queued(self, proc_number: ProcessorNumber, queue_length: int):
+        self._logger.log_thread_queued(proc_number=proc_number, queue_length=queue_length)
+
+    def log_thread_dispatched(self, proc_number: ProcessorNumber, delay: Duration):
+        self._logger.log_thread_dispatched(proc_number=proc_number, delay=delay)
+
+    def log_context_switch(self, proc_number: ProcessorNumber, voluntary: bool):
+        self._logger.log_context_switch(proc_number=proc_number, voluntary=voluntary)
+
+    def log_thread_finished(self, proc_number: ProcessorNumber, lifetime: Duration):
+        self._logger.log_thread_finished(proc_number=proc_number, lifetime=lifetime)
+
+    def sums(self) -> ActionSums:
+        return self._logger.sums()
+
+    def latencies(self) -> LatencyHistogram:
+        return self._logger.latencies()
+
+    def scheduling(self) -> Dict[ProcessorNumber, SchedulingLog]:
+        return self._logger.scheduling()
+
+    # processors simulated apart are not traced, only the time they took is
+    def merge(self, logs: List[ProcessorLog]):
+        self._logger.merge(logs)
+        self._tick_start += max([log.duration.micros for log in logs], default=0)
+
+    # the spans of processors simulated apart would be lost
+    def detached(self) -> Optional[Logger]:
+        return None
+
+    def _record(self, action: _Action, saga: Optional[str]):
+        proc_number = self._ticked_processor
+        if proc_number is None:
+            return
+        self._ticked_processor = None
+
+        tick_start = self._tick_start
+        span = self._spans.get(proc_number)
+        if span is not None and span[3] == tick_start and span[0] is action and span[1] == saga:
+            span[3] = tick_start + self._tick_length
+            return
+
+        if span is not None:
+            self._writer.write_span(proc_number, span[0].name.lower(), span[2], span[3] - span[2], span[1])
+        self._spans[proc_number] = [action, saga, tick_start, tick_start + self._tick_length]
 
 
 _available_colours: List[str] = ["red", "green", "yellow", "blue", "magenta", "cyan", "white"]
@@ -235,6 +930,10 @@ _last_color_position: List[int] = [0]
 _assigned_colours: Dict[str, str] = {}
 
 
+# reports of processors simulated apart are merged into the report of the run
+def _unpublished(report: Report): pass
+
+
 def print_coloured(report: Report):
     colour = _assigned_colours.get(report.log_name)
     if colour is None:
@@ -0,0 +1,50 @@
+import cProfile
+import tracemalloc
+from enum import Enum
+from pstats import Stats
+from typing import Callable, List, Optional, TypeVar
+
+
+class Profiling(Enum):
+    OFF = 1
+    CPU = 2
+    CPU_AND_MEMORY = 3
+
+
+T = TypeVar('T')
+
+
+# allocations are traced only while the action runs, so the snapshot holds what it allocated and kept
+def profiled(action: Callable[[], T], profile_path: str, snapshot_path: Optional[str] = None) -> T:
+    if snapshot_path is not None:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return action()
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+        if snapshot_path is not None:
+            tracemalloc.take_snapshot().dump(snapshot_path)
+            tracemalloc.stop()
+
+
+def profile_summary(profile_path: str, snapshot_path: Optional[str] = None, top: int = 10) -> str:
+    stats = Stats(profile_path)
+    lines: List[str] = [f"Top functions by cumulative time of {stats.total_tt:.3f}s in {profile_path}:"]
+    by_cumulative_time = sorted(stats.stats.items(), key=lambda function_stats: function_stats[1][3], reverse=True)
+    for (file, line, function), (_, calls, own_time, cumulative_time, _) in by_cumulative_time[:top]:
+        lines.append(
+            f"  {cumulative_time:.3f}s cumulative, {own_time:.3f}s own, {calls} calls: {file}:{line}({function})")
+
+    if snapshot_path is not None:
+        snapshot = tracemalloc.Snapshot.load(snapshot_path).filter_traces([
+            tracemalloc.Filter(inclusive=False, filename_pattern=cProfile.__file__),
+            tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)
+        ])
+        allocations = snapshot.statistics("lineno")
+        total_kib = sum(allocation.size for allocation in allocations) / 1024
+        lines.append(f"Top allocation sites of {total_kib:.1f} KiB kept in {snapshot_path}:")
+        lines.extend(f"  {allocation}" for allocation in allocations[:top])
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import sqrt, ceil
+from statistics import mean, stdev
+from typing import Sequence
+
+from src.log import Report
+
+
+@dataclass(frozen=True)
+class Estimate:
+    mean: float
+    low: float
+    high: float
+
+    # 95% Student's t interval of the mean
+    @staticmethod
+    def of(samples: Sequence[float]) -> Estimate:
+        if not samples:
+            raise ValueError("Estimate needs at least one sample")
+        average = mean(samples)
+        if len(samples) == 1:
+            return Estimate(mean=average, low=float("-inf"), high=float("inf"))
+
+        half_width = _t_critical(len(samples) - 1) * stdev(samples) / sqrt(len(samples))
+        return Estimate(mean=average, low=average - half_width, high=average + half_width)
+
+    @property
+    def width(self) -> float:
+        return self.high - self.low
+
+    @property
+    def relative_width(self) -> float:
+        if self.mean == 0:
+            return 0.0 if self.width == 0 else float("inf")
+        return self.width / abs(self.mean)
+
+    def __str__(self):
+        return f"{self.mean:.6g} [{self.low:.6g}, {self.high:.6g}]"
+
+
+@dataclass(frozen=True)
+class ReplicatedReport:
+    log_name: str
+    replications: int
+    simulation_duration: Estimate
+    processor_task_handling_percentage: Estimate
+    processor_waiting_percentage: Estimate
+    processor_overhead_work_percentage: Estimate
+
+    @staticmethod
+    def of(log_name: str, reports: Sequence[Report]) -> ReplicatedReport:
+        return ReplicatedReport(
+            log_name=log_name,
+            replications=len(reports),
+            simulation_duration=Estimate.of([report.simulation_duration.micros for report in reports]),
+            processor_task_handling_percentage=Estimate.of(
+                [report.processor_task_handling_percentage for report in reports]),
+            processor_waiting_percentage=Estimate.of([report.processor_waiting_percentage for report in reports]),
+            processor_overhead_work_percentage=Estimate.of(
+                [report.processor_overhead_work_percentage for report in reports])
+        )
+
+
+# the interval narrows with the square root of replications, the sample deviation is taken as it is
+def replications_needed(estimate: Estimate, replications: int, relative_width: float) -> int:
+    if estimate.relative_width <= relative_width:
+        return replications
+    if estimate.relative_width == float("inf"):
+        return replications + 1
+    return max(replications + 1, ceil(replications * (estimate.relative_width / relative_width) ** 2))
+
+
+def _t_critical(degrees_of_freedom: int) -> float:
+    if degrees_of_freedom <= len(_T_CRITICAL_95):
+        return _T_CRITICAL_95[degrees_of_freedom - 1]
+    return 1.96
+
+
+_T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from itertools import count
+from random import Random
+from typing import Iterator, Optional, Tuple
+
+from src.sys.time.duration import Duration
+
+
+class ArrivalProcess(ABC):
+    # instants since the start of a simulation at which sagas arrive, in non-decreasing order
+    @abstractmethod
+    def instants(self) -> Iterator[Duration]: pass
+
+
+@dataclass(frozen=True)
+class PoissonArrivals(ArrivalProcess):
+    rate: float
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        _check_rate(self.rate)
+
+    def instants(self) -> Iterator[Duration]:
+        rand = Random(self.seed)
+        micros = 0.0
+        while True:
+            micros += rand.expovariate(self.rate) * _MICROS_IN_SECOND
+            yield Duration(micros=round(micros))
+
+
+@dataclass(frozen=True)
+class ConstantArrivals(ArrivalProcess):
+    rate: float
+
+    def __post_init__(self):
+        _check_rate(self.rate)
+
+    def instants(self) -> Iterator[Duration]:
+        for arrival in count(1):
+            yield Duration(micros=round(arrival * _MICROS_IN_SECOND / self.rate))
+
+
+# the same average rate, but sagas come together in bursts
+@dataclass(frozen=True)
+class BurstyArrivals(ArrivalProcess):
+    rate: float
+    burst_size: int
+
+    def __post_init__(self):
+        _check_rate(self.rate)
+        if self.burst_size < 1:
+            raise ValueError(f"Burst size should be positive, got {self.burst_size}")
+
+    def instants(self) -> Iterator[Duration]:
+        for burst in count(1):
+            instant = Duration(micros=round(burst * self.burst_size * _MICROS_IN_SECOND / self.rate))
+            for _ in range(self.burst_size):
+                yield instant
+
+
+@dataclass(frozen=True)
+class ReplayedArrivals(ArrivalProcess):
+    timestamps: Tuple[Duration, ...]
+
+    def instants(self) -> Iterator[Duration]:
+        return iter(sorted(self.timestamps))
+
+
+def _check_rate(rate: float):
+    if rate <= 0:
+        raise ValueError(f"Arrival rate should be positive, got {rate}")
+
+
+_MICROS_IN_SECOND = 10 ** 6
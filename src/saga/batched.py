@@ -0,0 +1,343 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.histogram import LatencyHistogram
+from src.log import ProcessorLog, ProcessorNumber, SchedulingLog
+from src.saga.store import OperationStore
+from src.sys.system import ProcessingMode
+from src.sys.time.constants import thread_timeslice, thread_context_switch_overhead, thread_creation_cost, \
+    thread_deallocation_cost
+from src.sys.time.duration import Duration
+
+
+# Runs threaded simulations of the same sagas for several processor counts at once. Threads never leave their
+# processor, so every processor of every configuration is an independent lane. All lanes advance together,
+# each one to its own next event, with the state of all threads and processors kept in NumPy arrays.
+class BatchedThreadedOrchestrator:
+    def __init__(
+            self,
+            processors_numbers: Sequence[int],
+            processing_mode: ProcessingMode,
+            processing_interval: Optional[Duration] = None
+    ):
+        if not processors_numbers or min(processors_numbers) <= 0:
+            raise ValueError(f"Processors numbers should be positive, got {processors_numbers}")
+        self.processors_numbers: List[int] = list(processors_numbers)
+        self.processing_mode = processing_mode
+        self._processing_interval: int = (
+            processing_interval if processing_interval is not None else thread_timeslice()).micros
+        self._context_switch_cost: int = thread_context_switch_overhead().micros
+        self._creation_cost: int = thread_creation_cost().micros
+        self._deallocation_cost: int = thread_deallocation_cost().micros
+
+    def process(self, store: OperationStore) -> List[List[ProcessorLog]]:
+        _check_tasks_end_with_processing(store)
+        state = _State(
+            threads=self._threads(store),
+            store=store,
+            creation_cost=self._creation_cost,
+            deallocation_cost=self._deallocation_cost
+        )
+        state.run(
+            processing_interval=self._processing_interval,
+            context_switch_cost=self._context_switch_cost,
+            yielding=self.processing_mode is ProcessingMode.YIELDING_PROCESSORS
+        )
+
+        logs: List[List[ProcessorLog]] = []
+        lane = 0
+        for processors in self.processors_numbers:
+            logs.append([state.log(lane + processor, ProcessorNumber(processor)) for processor in range(processors)])
+            lane += processors
+        return logs
+
+    def name(self) -> str:
+        return f"threaded_orchestrator_in_{self.processing_mode}_mode"
+
+    # operations of every thread are a range of one sequence of store operations, threads of a lane are adjacent
+    def _threads(self, store: OperationStore) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        operation_offsets = store.task_offsets[store.saga_offsets]
+        sagas = len(store.saga_offsets) - 1
+
+        sequences: List[np.ndarray] = []
+        starts: List[int] = []
+        ends: List[int] = []
+        lane_sizes: List[int] = []
+        length = 0
+        for processors in self.processors_numbers:
+            for processor in range(processors):
+                assigned_sagas = range(processor, sagas, processors)
+                if self.processing_mode is ProcessingMode.FIXED_POOL_SIZE:
+                    chain = [np.arange(operation_offsets[saga], operation_offsets[saga + 1]) for saga in assigned_sagas]
+                    sequence = np.concatenate(chain) if chain else np.empty(0, dtype=np.int64)
+                    sequences.append(sequence)
+                    starts.append(length)
+                    ends.append(length + len(sequence))
+                    length += len(sequence)
+                    lane_sizes.append(1)
+                    continue
+
+                for saga in assigned_sagas:
+                    sequence = np.arange(operation_offsets[saga], operation_offsets[saga + 1])
+                    sequences.append(sequence)
+                    starts.append(length)
+                    ends.append(length + len(sequence))
+                    length += len(sequence)
+                lane_sizes.append(len(assigned_sagas))
+
+        sequence = np.concatenate(sequences) if sequences else np.empty(0, dtype=np.int64)
+        return (
+            np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64),
+            np.array(lane_sizes, dtype=np.int64),
+            sequence.astype(np.int64)
+        )
+
+
+class _State:
+    def __init__(
+            self,
+            threads: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+            store: OperationStore,
+            creation_cost: int,
+            deallocation_cost: int
+    ):
+        starts, ends, lane_sizes, sequence = threads
+        threads_number = len(starts)
+        lanes_number = len(lane_sizes)
+
+        operation_offsets = store.task_offsets[store.saga_offsets]
+        saga_ends = np.zeros(len(store.durations), dtype=np.bool_)
+        saga_ends[operation_offsets[1:][operation_offsets[1:] > operation_offsets[:-1]] - 1] = True
+
+        # one extra thread never waits, it bounds the last lane for reductions over the threads of every lane
+        self.durations: np.ndarray = np.append(store.durations[sequence], 1)
+        self.to_process: np.ndarray = np.append(store.to_process[sequence], True)
+        self.saga_end: np.ndarray = np.append(saga_ends[sequence], False)
+        self.position: np.ndarray = np.append(starts, 0)
+        self.end: np.ndarray = np.append(ends, 0)
+        self.remaining: np.ndarray = np.zeros(threads_number + 1, dtype=np.int64)
+        self.wake_at: np.ndarray = np.full(threads_number + 1, _NEVER, dtype=np.int64)
+        self.init_cool_down: np.ndarray = np.full(threads_number + 1, creation_cost, dtype=np.int64)
+        self.destruct_cool_down: np.ndarray = np.full(threads_number + 1, deallocation_cost, dtype=np.int64)
+
+        self.first: np.ndarray = np.concatenate([[0], np.cumsum(lane_sizes)[:-1]]).astype(np.int64)
+        self.lane_of: np.ndarray = np.append(np.repeat(np.arange(lanes_number), lane_sizes), 0)
+        self.count: np.ndarray = lane_sizes.copy()
+        thread_numbers = np.arange(threads_number)
+        last = self.first + lane_sizes - 1
+        self.next: np.ndarray = np.append(np.where(thread_numbers == last[self.lane_of[:-1]],
+                                                   self.first[self.lane_of[:-1]], thread_numbers + 1), 0)
+        self.previous: np.ndarray = np.append(np.where(thread_numbers == self.first[self.lane_of[:-1]],
+                                                       last[self.lane_of[:-1]], thread_numbers - 1), 0)
+
+        self.slot: np.ndarray = self.first.copy()
+        self.assigned: np.ndarray = lane_sizes > 0
+        self.processing_duration: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self.context_switch_duration: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self.yielding: np.ndarray = np.zeros(lanes_number, dtype=np.bool_)
+        self.now: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self.processing: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self.overhead: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self._completions: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._latencies: Optional[List[LatencyHistogram]] = None
+
+        # every thread is created and queued at the start, the first one of a lane is dispatched right away
+        self.queued_at: np.ndarray = np.zeros(threads_number + 1, dtype=np.int64)
+        self.max_queue_length: np.ndarray = np.where(lane_sizes > 1, lane_sizes - 1, lane_sizes)
+        self.voluntary_switches: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self.involuntary_switches: np.ndarray = np.zeros(lanes_number, dtype=np.int64)
+        self._had_threads: np.ndarray = lane_sizes > 0
+        self._dispatches: List[Tuple[np.ndarray, np.ndarray]] = [
+            (np.flatnonzero(self._had_threads), np.zeros(int(self._had_threads.sum()), dtype=np.int64))]
+        self._thread_ends: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._scheduling: Optional[List[SchedulingLog]] = None
+
+        self._start_operations(np.flatnonzero(self.position[:-1] < self.end[:-1]))
+
+    def run(self, processing_interval: int, context_switch_cost: int, yielding: bool):
+        active = np.flatnonzero(self.count > 0)
+        while active.size:
+            thread = np.where(self.assigned[active], self.slot[active], self.next[self.slot[active]])
+            dispatched = ~self.assigned[active]
+            self._dispatch(active[dispatched], thread[dispatched])
+            self.slot[active] = thread
+            self.assigned[active] = True
+
+            in_init = self.init_cool_down[thread] > 0
+            executable_finished = self.position[thread] >= self.end[thread]
+            waiting = ~executable_finished & ~self.to_process[np.minimum(self.position[thread], self.end[thread])]
+            destructing = ~in_init & executable_finished & (self.destruct_cool_down[thread] > 0)
+            doing_system_operation = in_init | destructing
+            processing = ~doing_system_operation & ~executable_finished & ~waiting
+
+            thread_event = np.where(
+                in_init,
+                self.init_cool_down[thread],
+                np.where(
+                    processing,
+                    self.remaining[thread],
+                    np.where(destructing, self.destruct_cool_down[thread], _NEVER)
+                )
+            )
+            processing_duration = self.processing_duration[active]
+            has_more_threads = self.count[active] > 1
+            should_switch = processing_duration >= processing_interval
+            if yielding:
+                should_switch |= self.yielding[active] | (~doing_system_operation & waiting)
+            switching = has_more_threads & should_switch
+            event = np.where(
+                switching,
+                context_switch_cost - self.context_switch_duration[active] + 1,
+                np.where(has_more_threads, np.minimum(thread_event, processing_interval - processing_duration),
+                         thread_event)
+            )
+            wake_up = np.minimum.reduceat(self.wake_at, self.first)[active] - self.now[active]
+            step = np.minimum(event, wake_up)
+            step[step >= _NEVER // 2] = 1
+            self.now[active] += step
+
+            self._switch(active[switching], step[switching], context_switch_cost, processing_interval)
+            running = ~switching
+            self._tick(
+                lanes=active[running],
+                thread=thread[running],
+                step=step[running],
+                in_init=in_init[running],
+                processing=processing[running],
+                destructing=destructing[running],
+                doing_system_operation=doing_system_operation[running]
+            )
+            self._wake_up_due()
+            active = active[self.count[active] > 0]
+
+    def log(self, lane: int, processor_number: ProcessorNumber) -> ProcessorLog:
+        return ProcessorLog.of(
+            processor_number=processor_number,
+            duration=Duration(micros=int(self.now[lane])),
+            processing=Duration(micros=int(self.processing[lane])),
+            overhead=Duration(micros=int(self.overhead[lane])),
+            latencies=self._latencies_of(lane),
+            scheduling=self._scheduling_of(lane)
+        )
+
+    # every saga entered at the start, so its latency is the instant its last operation finished
+    def _latencies_of(self, lane: int) -> LatencyHistogram:
+        if self._latencies is None:
+            self._latencies = [LatencyHistogram() for _ in range(len(self.now))]
+            for lanes, instants in self._completions:
+                for completed_lane, instant in zip(lanes.tolist(), instants.tolist()):
+                    self._latencies[completed_lane].record_micros(instant)
+            self._completions = []
+        return self._latencies[lane]
+
+    def _scheduling_of(self, lane: int) -> Optional[SchedulingLog]:
+        if not self._had_threads[lane]:
+            return None
+        if self._scheduling is None:
+            self._scheduling = [
+                SchedulingLog(
+                    max_queue_length=int(self.max_queue_length[lane_number]),
+                    voluntary_switches=int(self.voluntary_switches[lane_number]),
+                    involuntary_switches=int(self.involuntary_switches[lane_number])
+                )
+                for lane_number
+                in range(len(self.now))
+            ]
+            for lanes, delays in self._dispatches:
+                for dispatched_lane, delay in zip(lanes.tolist(), delays.tolist()):
+                    self._scheduling[dispatched_lane].queued_micros += delay
+                    self._scheduling[dispatched_lane].delays.record_micros(delay)
+            for lanes, lifetimes in self._thread_ends:
+                for ended_lane, lifetime in zip(lanes.tolist(), lifetimes.tolist()):
+                    self._scheduling[ended_lane].lifetimes.record_micros(lifetime)
+            self._dispatches = []
+            self._thread_ends = []
+        return self._scheduling[lane]
+
+    def _dispatch(self, lanes: np.ndarray, thread: np.ndarray):
+        if lanes.size:
+            self._dispatches.append((lanes, self.now[lanes] - self.queued_at[thread]))
+
+    def _switch(self, lanes: np.ndarray, step: np.ndarray, context_switch_cost: int, processing_interval: int):
+        self.overhead[lanes] += step
+        self.context_switch_duration[lanes] += step
+        self.yielding[lanes] = True
+
+        switched = lanes[self.context_switch_duration[lanes] > context_switch_cost]
+        voluntary = self.processing_duration[switched] < processing_interval
+        self.voluntary_switches[switched[voluntary]] += 1
+        self.involuntary_switches[switched[~voluntary]] += 1
+        self.queued_at[self.slot[switched]] = self.now[switched]
+        self.max_queue_length[switched] = np.maximum(self.max_queue_length[switched], self.count[switched])
+        self.yielding[switched] = False
+        self.processing_duration[switched] = 0
+        self.context_switch_duration[switched] = 0
+        self.assigned[switched] = False
+
+    def _tick(
+            self,
+            lanes: np.ndarray,
+            thread: np.ndarray,
+            step: np.ndarray,
+            in_init: np.ndarray,
+            processing: np.ndarray,
+            destructing: np.ndarray,
+            doing_system_operation: np.ndarray
+    ):
+        self.processing_duration[lanes] += np.where(doing_system_operation, 0, step)
+        self.overhead[lanes] += np.where(in_init | destructing, step, 0)
+        self.init_cool_down[thread[in_init]] -= step[in_init]
+        self.destruct_cool_down[thread[destructing]] -= step[destructing]
+
+        self.processing[lanes[processing]] += step[processing]
+        processed = thread[processing]
+        self.remaining[processed] -= step[processing]
+        self._finish_operations(processed[self.remaining[processed] <= 0])
+
+        finished = (self.position[thread] >= self.end[thread]) & (self.destruct_cool_down[thread] <= 0)
+        self._unassign(lanes[finished], thread[finished])
+
+    def _unassign(self, lanes: np.ndarray, thread: np.ndarray):
+        if lanes.size:
+            self._thread_ends.append((lanes, self.now[lanes]))
+        following = self.next[thread]
+        self.next[self.previous[thread]] = following
+        self.previous[following] = self.previous[thread]
+        self.count[lanes] -= 1
+        self.processing_duration[lanes] = 0
+        self.context_switch_duration[lanes] = 0
+        self.slot[lanes] = following
+        self.assigned[lanes] = self.count[lanes] > 0
+        self._dispatch(lanes[self.assigned[lanes]], following[self.assigned[lanes]])
+
+    def _wake_up_due(self):
+        due = np.flatnonzero(self.wake_at <= self.now[self.lane_of])
+        if due.size:
+            self.wake_at[due] = _NEVER
+            self._finish_operations(due)
+
+    def _finish_operations(self, thread: np.ndarray):
+        completed = thread[self.saga_end[self.position[thread]]]
+        if completed.size:
+            lanes = self.lane_of[completed]
+            self._completions.append((lanes, self.now[lanes]))
+        self.position[thread] += 1
+        self._start_operations(thread[self.position[thread] < self.end[thread]])
+
+    def _start_operations(self, thread: np.ndarray):
+        operation = self.position[thread]
+        to_process = self.to_process[operation]
+        self.remaining[thread[to_process]] = self.durations[operation[to_process]]
+        waiting = thread[~to_process]
+        self.wake_at[waiting] = self.now[self.lane_of[waiting]] + self.durations[operation[~to_process]]
+
+
+# a task completed by a wake up is never left by its saga, so such sagas would never finish
+def _check_tasks_end_with_processing(store: OperationStore):
+    if not np.all(store.to_process[store.task_offsets[1:] - 1]):
+        raise ValueError("Batched simulation expects the last operation of every task to be processed")
+
+
+_NEVER = np.iinfo(np.int64).max // 4
@@ -1,53 +1,167 @@
-from typing import List, Optional
+from functools import partial
+from heapq import heappush, heappop
+from typing import List, Optional, Sequence, Iterator, Dict
 
 from src.sys.thread import Executable
 from src.saga.task import Task
+from src.sys.time.duration import Duration
 from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer, NotifyingTimer
 
 
+# executables run round-robin in their initial order: the current one keeps running until it waits or finishes,
+# then the first ready one after it takes over. Ready positions at or after the current one and the ones wrapped
+# around before it are kept in two heaps, and executables report becoming ready through their timer.
+# An open coroutine takes executables added later at the end of the round, finished ones are released.
 class CoroutineSaga(Executable):
-    def __init__(self, executables: List[Executable], name: str = "_❔coroutine❔_"):
+    def __init__(self, executables: Sequence[Executable], name: str = "_❔coroutine❔_", closed: bool = True):
         if any([type(executable) is CoroutineSaga for executable in executables]):
             raise ValueError("Coroutine executable specified as input for a new coroutine")
-        self._executables: List[Executable] = executables
         self._name = name
+        self._closed = closed
+        self._timer: Optional[WaitTimer] = None
+
+        unfinished = [position for position, executable in enumerate(executables) if not executable.is_finished()]
+        self._executables: Dict[int, Executable] = {position: executables[position] for position in unfinished}
+        self._next: Dict[int, int] = {}
+        self._previous: Dict[int, int] = {}
+        for position, following in zip(unfinished, unfinished[1:] + unfinished[:1]):
+            self._next[position] = following
+            self._previous[following] = position
+        self._current: Optional[int] = unfinished[0] if unfinished else None
+        self._last: Optional[int] = unfinished[-1] if unfinished else None
+        self._following_position: int = len(executables)
+
+        self._ready: Dict[int, bool] = {position: False for position in unfinished}
+        self._ready_ahead: List[int] = []
+        self._ready_behind: List[int] = []
+        for position in unfinished:
+            self._mark_ready_if_can_run(position)
+
+    def add(self, executable: Executable):
+        if self._closed:
+            raise ValueError(f"Executable {executable} added to a closed coroutine")
+        if type(executable) is CoroutineSaga:
+            raise ValueError("Coroutine executable added to a coroutine")
+        if executable.is_finished():
+            return
+
+        position = self._following_position
+        self._following_position += 1
+        self._executables[position] = executable
+        self._ready[position] = False
+        if self._current is None:
+            self._next[position] = position
+            self._previous[position] = position
+            self._current = position
+        else:
+            following = self._next[self._last]
+            self._next[position] = following
+            self._previous[position] = self._last
+            self._next[self._last] = position
+            self._previous[following] = position
+        self._last = position
+
+        if self._timer is not None:
+            self._register_waits_of(position)
+        self._mark_ready_if_can_run(position)
+
+    def close(self):
+        self._closed = True
 
     def is_finished(self) -> bool:
-        return self._get_current_executable() is None
+        return self._current is None and self._closed
+
+    def register_waits(self, timer: WaitTimer):
+        self._timer = timer
+        for position in self._positions():
+            self._register_waits_of(position)
 
     def get_current_tasks(self) -> List[Task]:
         tasks: List[Task] = []
-        for executable in self._executables:
-            tasks = tasks + executable.get_current_tasks()
+        for position in self._positions():
+            tasks.extend(self._executables[position].get_current_tasks())
         return tasks
 
-    def ticked(self, time_delta: TimeDelta):
-        if self.is_finished():
-            return
+    def current_task(self) -> Optional[Task]:
+        for position in self._positions():
+            task = self._executables[position].current_task()
+            if task is not None:
+                return task
+        return None
 
-        for i in range(len(self._executables)):
-            executable = self._get_current_executable()
-            if self._handle_if_finished(executable):
-                continue
+    def has_runnable_task(self) -> bool:
+        return bool(self._ready_ahead or self._ready_behind)
 
-            if all([task.is_waiting() for task in executable.get_current_tasks()]):
-                self._executables.append(
-                    self._executables.pop(0)
-                )
-                continue
+    def ticked(self, time_delta: TimeDelta):
+        position = self._next_ready()
+        if position is None:
+            return
 
-            executable.ticked(time_delta=time_delta)
-            self._handle_if_finished(executable)
+        self._current = position
+        executable = self._executables[position]
+        executable.ticked(time_delta=time_delta)
+
+        if executable.is_finished():
+            self._unmark_current_ready()
+            self._remove_current()
+        elif not executable.has_runnable_task():
+            self._unmark_current_ready()
+
+    def next_event_in(self) -> Optional[Duration]:
+        position = self._ready_ahead[0] if self._ready_ahead else next(iter(self._ready_behind), None)
+        if position is None:
+            return None
+        return self._executables[position].next_event_in()
+
+    def _next_ready(self) -> Optional[int]:
+        if not self._ready_ahead:
+            self._ready_ahead, self._ready_behind = self._ready_behind, self._ready_ahead
+        return next(iter(self._ready_ahead), None)
+
+    def _register_waits_of(self, position: int):
+        self._executables[position].register_waits(
+            NotifyingTimer(self._timer, on_wake=partial(self._mark_ready_if_can_run, position))
+        )
+
+    def _mark_ready_if_can_run(self, position: int):
+        if self._ready[position] or not self._executables[position].has_runnable_task():
+            return
+        self._ready[position] = True
+        heappush(self._ready_ahead if position >= self._current else self._ready_behind, position)
+
+    def _unmark_current_ready(self):
+        heappop(self._ready_ahead)
+        self._ready[self._current] = False
+
+    def _remove_current(self):
+        position = self._current
+        following = self._next.pop(position)
+        previous = self._previous.pop(position)
+        del self._executables[position]
+        del self._ready[position]
+        if following == position:
+            self._current = None
+            self._last = None
             return
 
-    def _handle_if_finished(self, executable) -> bool:
-        if not executable.is_finished():
-            return False
-        self._executables.pop(0)
-        return True
+        self._next[previous] = following
+        self._previous[following] = previous
+        if self._last == position:
+            self._last = previous
+        self._current = following
+        if following < position:
+            self._ready_ahead, self._ready_behind = self._ready_behind, self._ready_ahead
 
-    def _get_current_executable(self) -> Optional[Executable]:
-        return next(iter(self._executables), None)
+    def _positions(self) -> Iterator[int]:
+        if self._current is None:
+            return
+        position = self._current
+        while True:
+            yield position
+            position = self._next[position]
+            if position == self._current:
+                return
 
     def __str__(self) -> str:
         return self._name
@@ -56,7 +170,7 @@ class CoroutineSaga(Executable):
         return self._name
 
     def _as_str(self):
-        return f"{self._name}<{self._executables}>"
+        return f"{self._name}<{[self._executables[position] for position in self._positions()]}>"
 
 
 class CoroutineSagaFactory:
@@ -65,7 +179,8 @@ class CoroutineSagaFactory:
 
     def new(
             self,
-            executables: List[Executable]
+            executables: List[Executable],
+            closed: bool = True
     ) -> CoroutineSaga:
         self.last_id += 1
-        return CoroutineSaga(executables=executables, name=f"coroutine{self.last_id}")
+        return CoroutineSaga(executables=executables, name=f"coroutine{self.last_id}", closed=closed)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from random import Random
+from typing import List, Tuple, Optional
+
+from jsonpickle import decode
+
+from src.saga.generation import generate_sagas
+from src.saga.simple_saga import SimpleSaga
+from src.saga.store import OperationStore
+
+
+class Dataset(ABC):
+    @abstractmethod
+    def load(self) -> List[SimpleSaga]: pass
+
+    @abstractmethod
+    def __len__(self) -> int: pass
+
+    def store(self) -> OperationStore:
+        return OperationStore.from_sagas(self.load(), keep_names=False)
+
+    def fingerprint(self) -> str:
+        return self.store().digest()
+
+    # replication 0 is the dataset itself, others are independent samples of the same kind
+    def replica(self, replication: int) -> Dataset:
+        if replication == 0:
+            return self
+        raise ValueError(f"{type(self).__name__} holds fixed sagas and cannot be replicated")
+
+
+@dataclass(frozen=True)
+class GeneratedDataset(Dataset):
+    number: int
+    seed: int
+
+    def load(self) -> List[SimpleSaga]:
+        return generate_sagas(number=self.number, seed=self.seed)
+
+    def __len__(self) -> int:
+        return self.number
+
+    def replica(self, replication: int) -> GeneratedDataset:
+        if replication == 0:
+            return self
+        return GeneratedDataset(number=self.number, seed=Random(f"{self.seed}/{replication}").getrandbits(32))
+
+
+@dataclass(frozen=True)
+class FileDataset(Dataset):
+    path: str
+
+    def load(self) -> List[SimpleSaga]:
+        with open(file=self.path, mode="r") as file:
+            return decode(file.read())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+
+@dataclass(frozen=True)
+class StoreDataset(Dataset):
+    path: str
+    number: Optional[int] = None
+
+    def load(self) -> List[SimpleSaga]:
+        return OperationStore.load(self.path, number_of_sagas=self.number).to_sagas()
+
+    def __len__(self) -> int:
+        return OperationStore.load(self.path, number_of_sagas=self.number).number_of_sagas
+
+    def store(self) -> OperationStore:
+        return OperationStore.load(self.path, number_of_sagas=self.number)
+
+
+@dataclass(frozen=True)
+class InMemoryDataset(Dataset):
+    sagas: Tuple[SimpleSaga, ...]
+
+    def load(self) -> List[SimpleSaga]:
+        return list(self.sagas)
+
+    def __len__(self) -> int:
+        return len(self.sagas)
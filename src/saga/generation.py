@@ -1,20 +1,26 @@
-from random import randint
-from typing import List
-from uuid import uuid4
+from random import randint, Random
+from typing import List, Optional, Iterator
+from uuid import uuid4, UUID
 
+from src.log import Logger
 from src.saga.simple_saga import SimpleSaga
 from src.saga.task import Task, SystemOperation
 from src.sys.time.duration import Duration
 
 
-def _generate_command() -> Task:
-    command_id = uuid4()
+def _new_id(rand: Optional[Random]) -> UUID:
+    return uuid4() if rand is None else UUID(int=rand.getrandbits(128), version=4)
+
+
+def _generate_command(rand: Optional[Random] = None, logger: Optional[Logger] = None) -> Task:
+    command_id = _new_id(rand)
     request = SystemOperation(
         to_process=True,
         name=f"HTTP request[{command_id}]",
         duration=Duration.rand_between(
             start=Duration(millis=1),
-            end=Duration(millis=7)
+            end=Duration(millis=7),
+            rand=rand
         )
     )
     wait = SystemOperation(
@@ -22,7 +28,8 @@ def _generate_command() -> Task:
         name=f"wait for HTTP response[{command_id}]",
         duration=Duration.rand_between(
             start=Duration(millis=50),
-            end=Duration(millis=700)
+            end=Duration(millis=700),
+            rand=rand
         )
     )
     response = SystemOperation(
@@ -30,21 +37,37 @@ def _generate_command() -> Task:
         name=f"HTTP response[{command_id}]",
         duration=Duration.rand_between(
             start=Duration(millis=2),
-            end=Duration(millis=10)
+            end=Duration(millis=10),
+            rand=rand
         )
     )
     return Task(
         operations=[request, wait, response],
-        name=f"command[{command_id}]"
+        name=f"command[{command_id}]",
+        logger=logger
     )
 
 
-def _generate_commands() -> List[Task]:
-    return [_generate_command() for _ in range(randint(3, 4))]
+def _generate_commands(rand: Optional[Random] = None, logger: Optional[Logger] = None) -> List[Task]:
+    number_of_commands = randint(3, 4) if rand is None else rand.randint(3, 4)
+    return [_generate_command(rand, logger) for _ in range(number_of_commands)]
 
 
-def generate_saga() -> SimpleSaga:
+def generate_saga(rand: Optional[Random] = None, logger: Optional[Logger] = None) -> SimpleSaga:
     return SimpleSaga(
-        tasks=_generate_commands(),
-        name=f"saga{uuid4()}"
+        tasks=_generate_commands(rand, logger),
+        name=f"saga{_new_id(rand)}",
+        logger=logger
     )
+
+
+def generate_sagas(number: int, seed: Optional[int] = None) -> List[SimpleSaga]:
+    rand = Random(seed) if seed is not None else None
+    return [generate_saga(rand) for _ in range(number)]
+
+
+# endless, sagas are generated only as they are taken
+def generate_saga_stream(seed: Optional[int] = None, logger: Optional[Logger] = None) -> Iterator[SimpleSaga]:
+    rand = Random(seed) if seed is not None else None
+    while True:
+        yield generate_saga(rand, logger)
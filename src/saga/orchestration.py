@@ -1,37 +1,271 @@
+from enum import Enum
+from itertools import cycle
 from math import ceil
 from abc import ABC, abstractmethod
-from typing import List
+from io import BytesIO
+from multiprocessing import Pool, cpu_count, current_process
+from pickle import Pickler, Unpickler, UnpicklingError
+from typing import List, Optional, Iterator, Callable, Any, BinaryIO
 
-from src.log import LogContext
+from src.histogram import LatencyHistogram
+from src.log import LogContext, Logger, ProcessorLog, ProcessorNumber, ActionSums, SchedulingLog
+from src.saga.arrival import ArrivalProcess
 from src.saga.coroutine_saga import CoroutineSagaFactory, CoroutineSaga
 from src.saga.simple_saga import SimpleSaga
+from src.saga.streaming import StreamReport, Admissions
 from src.sys.system import SystemFactory, ProcessingMode, System
 from src.sys.time.duration import Duration
 from src.sys.thread import Executable
-from src.sys.time.time import TimeDelta
+from src.sys.time.time import TimeDelta, earliest
+from src.sys.time.timer import WaitTimer
 
 
-def _run(executables: List[Executable], system: System) -> Duration:
+class Engine(Enum):
+    TICKS = 1
+    EVENTS = 2
+
+
+# bump whenever a change alters simulated results, so cached reports of older versions are not reused
+ENGINE_VERSION = 4
+
+
+def _run(executables: List[Executable], system: System, tick_length: Duration = Duration.one_micro()) -> Duration:
+    timer = WaitTimer()
     system.publish(executables)
+    system.register_waits(timer)
     result = Duration.zero()
-    tick_length = Duration(micros=1)
+    delta = TimeDelta(duration=tick_length)
+    logger = LogContext.logger()
+    logged_tick_length = Duration.one_micro()
 
     while not system.work_is_done():
-        delta = TimeDelta(duration=tick_length)
-        system.tick(delta)
-        result += tick_length
+        step = _fast_forward_step(system, timer, logger) if system.is_blocked() else None
+        if step is None or step <= tick_length:
+            step = tick_length
+            delta.advance()
+            current_delta = delta
+        else:
+            current_delta = TimeDelta(duration=step)
 
-        for executable in executables:
-            for current_task in executable.get_current_tasks():
-                if not current_task.is_waiting():
-                    continue
-                current_task.wait(time_delta=delta)
+        if step != logged_tick_length:
+            logger.set_tick_length(step)
+            logged_tick_length = step
+        timer.shift(step)
+        system.tick(current_delta)
+        result += step
+        timer.wake_up_due()
 
         LogContext.shift_time()
 
     return result
 
 
+# while every processor is idle or blocked, nothing changes before the next wake up, timeslice end or report,
+# so the ticks up to it are skipped and credited at once
+def _fast_forward_step(system: System, timer: WaitTimer, logger: Logger) -> Optional[Duration]:
+    return earliest([system.next_event_in(), timer.next_wake_up_in(), logger.time_to_next_report()])
+
+
+def _run_events(
+        executables: List[Executable],
+        system: System,
+        tick_length: Duration = Duration.one_micro()
+) -> Duration:
+    timer = WaitTimer()
+    system.publish(executables)
+    system.register_waits(timer)
+    result = Duration.zero()
+    logger = LogContext.logger()
+
+    while not system.work_is_done():
+        step = earliest([system.next_event_in(), timer.next_wake_up_in(), logger.time_to_next_report()])
+        if step is None or step < tick_length:
+            step = tick_length
+
+        delta = TimeDelta(duration=step)
+        logger.set_tick_length(step)
+        timer.shift(step)
+        system.tick(delta)
+        result += step
+        timer.wake_up_due()
+
+        logger.shift_time()
+
+    return result
+
+
+# sagas are submitted as they arrive till the horizon; once arrivals run out the system is closed and drained
+def _run_open(
+        sagas: Iterator[Executable],
+        arrivals: Iterator[Duration],
+        system: System,
+        submit: Callable[[Executable], None],
+        close: Callable[[], None],
+        horizon: Duration,
+        admissions: Admissions,
+        tick_length: Duration = Duration.one_micro()
+) -> Duration:
+    timer = WaitTimer()
+    system.register_waits(timer)
+    result = Duration.zero()
+    logger = LogContext.logger()
+    next_arrival = next(arrivals, None)
+    closed = False
+
+    while result < horizon:
+        while next_arrival is not None and next_arrival <= result:
+            saga = next(sagas, None)
+            if saga is None:
+                next_arrival = None
+                break
+            saga.arrive(next_arrival)
+            submit(admissions.admit(saga, arrived_at=next_arrival))
+            next_arrival = next(arrivals, None)
+
+        if next_arrival is None and not closed:
+            close()
+            closed = True
+        if closed and system.work_is_done():
+            break
+
+        step = earliest([
+            system.next_event_in(),
+            timer.next_wake_up_in(),
+            logger.time_to_next_report(),
+            next_arrival - result if next_arrival is not None else None,
+            horizon - result
+        ])
+        if step is None or step < tick_length:
+            step = tick_length
+
+        delta = TimeDelta(duration=step)
+        logger.set_tick_length(step)
+        timer.shift(step)
+        system.tick(delta)
+        result += step
+        timer.wake_up_due()
+        admissions.complete_finished(result)
+
+        logger.shift_time()
+
+    return result
+
+
+# the components of a partition log to the run's logger, in the worker they log to the partition's logger instead
+class _PartitionPickler(Pickler):
+    def __init__(self, file: BinaryIO, logger: Logger):
+        super().__init__(file)
+        self._logger = logger
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return _RUN_LOGGER if obj is self._logger else None
+
+
+class _PartitionUnpickler(Unpickler):
+    def __init__(self, file: BinaryIO, logger: Logger):
+        super().__init__(file)
+        self._logger = logger
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid != _RUN_LOGGER:
+            raise UnpicklingError(f"Unknown persistent id {pid}")
+        return self._logger
+
+
+_RUN_LOGGER = "run_logger"
+
+
+def _pickled_partition(system: System, executables: List[Executable], logger: Logger) -> bytes:
+    file = BytesIO()
+    _PartitionPickler(file, logger).dump((system, executables))
+    return file.getvalue()
+
+
+def _run_partition(
+        engine: Engine,
+        partition: bytes,
+        logger: Logger,
+        tick_length: Duration
+) -> ProcessorLog:
+    system, executables = _PartitionUnpickler(BytesIO(partition), logger).load()
+    sums: List[ActionSums] = []
+    latencies: List[LatencyHistogram] = []
+    scheduling: List[Optional[SchedulingLog]] = []
+    processor_number = ProcessorNumber(system.processor_numbers()[0])
+
+    def run() -> Duration:
+        duration = _run_with(engine=engine, executables=executables, system=system, tick_length=tick_length)
+        sums.append(logger.sums())
+        latencies.append(logger.latencies())
+        scheduling.append(logger.scheduling().get(processor_number))
+        return duration
+
+    partition_duration = LogContext.run_logging(log_name="partition", action=run, logger=logger)
+    return ProcessorLog(
+        processor_number=processor_number,
+        duration=partition_duration,
+        sums=sums[0],
+        latencies=latencies[0],
+        scheduling=scheduling[0]
+    )
+
+
+def _run_partitioned(
+        engine: Engine,
+        executables: List[Executable],
+        system: System,
+        workers: int,
+        logger: Logger,
+        partition_logger: Logger,
+        tick_length: Duration
+) -> Duration:
+    partitions = system.partitions(executables)
+    with Pool(processes=min(workers, len(partitions))) as pool:
+        logs: List[ProcessorLog] = pool.starmap(
+            _run_partition,
+            [
+                (engine, _pickled_partition(partition, partition_executables, logger), partition_logger, tick_length)
+                for partition, partition_executables
+                in partitions
+            ]
+        )
+
+    logger.merge(logs)
+    return max([log.duration for log in logs])
+
+
+def _run_with(
+        engine: Engine,
+        executables: List[Executable],
+        system: System,
+        workers: int = 1,
+        tick_length: Duration = Duration.one_micro()
+) -> Duration:
+    logger = LogContext.logger()
+    partition_logger = logger.detached() if workers > 1 else None
+    if partition_logger is not None:
+        return _run_partitioned(
+            engine=engine,
+            executables=executables,
+            system=system,
+            workers=workers,
+            logger=logger,
+            partition_logger=partition_logger,
+            tick_length=tick_length
+        )
+    if engine is Engine.EVENTS:
+        return _run_events(executables=executables, system=system, tick_length=tick_length)
+    return _run(executables=executables, system=system, tick_length=tick_length)
+
+
+# every processing mode pins threads to processors, so by default each processor is simulated by a process of its own;
+# pool workers are daemonic and cannot start processes, so there every processor is simulated in the worker itself
+def _workers_for(workers: Optional[int], processors: int) -> int:
+    if current_process().daemon:
+        return 1
+    return min(workers if workers is not None else cpu_count(), processors)
+
+
 class Orchestrator(ABC):
     @abstractmethod
     def process(self, sagas: List[SimpleSaga]) -> Duration:
@@ -41,40 +275,104 @@ class Orchestrator(ABC):
     def name(self) -> str:
         pass
 
+    # open system: sagas keep arriving while the ones submitted before are processed
+    @abstractmethod
+    def stream(
+            self,
+            sagas: Iterator[SimpleSaga],
+            arrivals: ArrivalProcess,
+            horizon: Duration,
+            warm_up: Duration = Duration.zero()
+    ) -> StreamReport:
+        pass
+
 
 class ThreadedOrchestrator(Orchestrator):
     def __init__(
             self,
             processors_number: int,
             processing_mode: ProcessingMode,
-            system_factory: SystemFactory = SystemFactory()
+            system_factory: SystemFactory = SystemFactory(),
+            engine: Engine = Engine.TICKS,
+            logger: Optional[Logger] = None,
+            workers: Optional[int] = None,
+            tick_length: Duration = Duration.one_micro()
     ):
+        _check_tick_length(tick_length)
         self._system = system_factory.create(
             processors_count=processors_number,
-            processing_mode=processing_mode
+            processing_mode=processing_mode,
+            logger=logger
         )
         self.processing_mode = processing_mode
+        self._processors_number = processors_number
+        self._engine = engine
+        self._workers = workers
+        self._tick_length = tick_length
 
     def process(self, sagas: List[SimpleSaga]) -> Duration:
-        return _run(executables=sagas, system=self._system)
+        return _run_with(
+            engine=self._engine,
+            executables=sagas,
+            system=self._system,
+            workers=_workers_for(self._workers, self._processors_number),
+            tick_length=self._tick_length
+        )
+
+    def stream(
+            self,
+            sagas: Iterator[SimpleSaga],
+            arrivals: ArrivalProcess,
+            horizon: Duration,
+            warm_up: Duration = Duration.zero()
+    ) -> StreamReport:
+        _check_single_worker(self._workers)
+        admissions = Admissions(warm_up=warm_up)
+        self._system.open()
+        duration = _run_open(
+            sagas=sagas,
+            arrivals=arrivals.instants(),
+            system=self._system,
+            submit=self._system.submit,
+            close=self._system.close,
+            horizon=horizon,
+            admissions=admissions,
+            tick_length=self._tick_length
+        )
+        return admissions.report(log_name=self.name(), duration=duration)
 
     def name(self) -> str:
-        return f"threaded_orchestrator_in_{self.processing_mode}_mode"
+        return ThreadedOrchestrator.name_of(self.processing_mode)
+
+    @staticmethod
+    def name_of(processing_mode: ProcessingMode) -> str:
+        return f"threaded_orchestrator_in_{processing_mode}_mode"
 
 
 class CoroutinesOrchestrator(Orchestrator):
+    NAME = "coroutines_orchestrator"
+
     def __init__(
             self,
             processors_number: int,
             system_factory: SystemFactory = SystemFactory(),
-            coroutine_saga_factory: CoroutineSagaFactory = CoroutineSagaFactory()
+            coroutine_saga_factory: CoroutineSagaFactory = CoroutineSagaFactory(),
+            engine: Engine = Engine.TICKS,
+            logger: Optional[Logger] = None,
+            workers: Optional[int] = None,
+            tick_length: Duration = Duration.one_micro()
     ):
+        _check_tick_length(tick_length)
         self._processors_number = processors_number
         self._system = system_factory.create(
             processors_count=processors_number,
-            processing_mode=ProcessingMode.FIXED_POOL_SIZE
+            processing_mode=ProcessingMode.FIXED_POOL_SIZE,
+            logger=logger
         )
         self._coroutine_factory = coroutine_saga_factory
+        self._engine = engine
+        self._workers = workers
+        self._tick_length = tick_length
 
     def process(self, sagas: List[SimpleSaga]) -> Duration:
         coroutines: List[CoroutineSaga] = []
@@ -93,7 +391,53 @@ class CoroutinesOrchestrator(Orchestrator):
             coroutines.append(coroutine)
             sagas = sagas[sagas_bunch_size:]
 
-        return _run(executables=coroutines, system=self._system)
+        return _run_with(
+            engine=self._engine,
+            executables=coroutines,
+            system=self._system,
+            workers=_workers_for(self._workers, self._processors_number),
+            tick_length=self._tick_length
+        )
+
+    # every processor runs one open coroutine that takes its share of arriving sagas
+    def stream(
+            self,
+            sagas: Iterator[SimpleSaga],
+            arrivals: ArrivalProcess,
+            horizon: Duration,
+            warm_up: Duration = Duration.zero()
+    ) -> StreamReport:
+        _check_single_worker(self._workers)
+        admissions = Admissions(warm_up=warm_up)
+        coroutines = [self._coroutine_factory.new([], closed=False) for _ in range(self._processors_number)]
+        targets = cycle(coroutines)
+        self._system.publish(coroutines)
+
+        def close():
+            for coroutine in coroutines:
+                coroutine.close()
+
+        duration = _run_open(
+            sagas=sagas,
+            arrivals=arrivals.instants(),
+            system=self._system,
+            submit=lambda executable: next(targets).add(executable),
+            close=close,
+            horizon=horizon,
+            admissions=admissions,
+            tick_length=self._tick_length
+        )
+        return admissions.report(log_name=self.name(), duration=duration)
 
     def name(self) -> str:
-        return f"coroutines_orchestrator"
+        return CoroutinesOrchestrator.NAME
+
+
+def _check_single_worker(workers: Optional[int]):
+    if workers is not None and workers > 1:
+        raise ValueError(f"Arriving sagas are simulated in a single process, got {workers} workers")
+
+
+def _check_tick_length(tick_length: Duration):
+    if not tick_length.is_positive:
+        raise ValueError(f"Tick length should be positive, got {tick_length}")
@@ -1,18 +1,49 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
+from src.log import Logger, ContextLogger
 from src.sys.thread import Executable
 from src.saga.task import Task
+from src.sys.time.duration import Duration
 from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
 
 
 class SimpleSaga(Executable):
-    def __init__(self, tasks: List[Task], name: str = "unnamed"):
-        self._tasks: List[Task] = tasks
+    # sagas pickled before tasks were walked with an index start from their first remaining task
+    _task_index: int = 0
+    _started: Duration = Duration.zero()
+    _logger: Logger = ContextLogger()
+
+    def __init__(self, tasks: Sequence[Task], name: str = "unnamed", logger: Optional[Logger] = None):
+        self._tasks: Tuple[Task, ...] = tuple(tasks)
+        for task in self._tasks:
+            task.saga_name = name
+        self._task_index: int = 0
         self._processing: bool = False
         self._name = name
+        self._timer: Optional[WaitTimer] = None
+        self._started: Duration = Duration.zero()
+        self._logger: Logger = logger if logger is not None else ContextLogger()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def tasks(self) -> List[Task]:
+        return list(self._tasks[self._task_index:])
 
     def is_finished(self) -> bool:
-        return len(self._tasks) == 0
+        return self._task_index >= len(self._tasks)
+
+    def arrive(self, instant: Duration):
+        self._started = instant
+
+    def register_waits(self, timer: WaitTimer):
+        self._timer = timer
+        current_task = self._get_current_task()
+        if current_task:
+            current_task.register_waits(timer)
 
     def ticked(self, time_delta: TimeDelta):
         current_task = self._get_current_task()
@@ -26,14 +57,33 @@ class SimpleSaga(Executable):
         if not current_task.is_complete():
             return
 
-        self._tasks.pop(0)
+        self._task_index += 1
+
+        next_task = self._get_current_task()
+        if next_task is None:
+            self._logger.log_saga_finished(started=self._started)
+        elif self._timer is not None:
+            next_task.register_waits(self._timer)
+
+    def next_event_in(self) -> Optional[Duration]:
+        current_task = self._get_current_task()
+        if not current_task or current_task.is_waiting():
+            return None
+        return current_task.next_event_in()
 
     def get_current_tasks(self) -> List[Task]:
         current_task = self._get_current_task()
         return [current_task] if current_task else []
 
+    def current_task(self) -> Optional[Task]:
+        return self._get_current_task()
+
+    def has_runnable_task(self) -> bool:
+        current_task = self._get_current_task()
+        return current_task is not None and not current_task.is_waiting()
+
     def _get_current_task(self) -> Optional[Task]:
-        return next(iter(self._tasks), None)
+        return self._tasks[self._task_index] if self._task_index < len(self._tasks) else None
 
     def __str__(self) -> str:
         return self._name
@@ -42,4 +92,4 @@ class SimpleSaga(Executable):
         return self._name
 
     def _as_str(self):
-        return f"{self._name}<{self._tasks}>"
+        return f"{self._name}<{self.tasks}>"
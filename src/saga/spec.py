@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple, Optional, List, Sequence
+from uuid import UUID
+
+from src.log import Logger
+from src.saga.simple_saga import SimpleSaga
+from src.saga.task import Task, SystemOperation
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+    operations: Tuple[SystemOperation, ...]
+    name: Optional[str] = None
+    identifier: Optional[UUID] = None
+
+    @staticmethod
+    def of(task: Task) -> TaskSpec:
+        return TaskSpec(operations=tuple(task.operations), name=task.name, identifier=task.identifier)
+
+    def new_task(self, logger: Optional[Logger] = None) -> Task:
+        return Task(operations=self.operations, name=self.name, identifier=self.identifier, logger=logger)
+
+
+@dataclass(frozen=True)
+class SagaSpec:
+    tasks: Tuple[TaskSpec, ...]
+    name: str = "unnamed"
+
+    @staticmethod
+    def of(saga: SimpleSaga) -> SagaSpec:
+        return SagaSpec(tasks=tuple(TaskSpec.of(task) for task in saga.tasks), name=saga.name)
+
+    def new_saga(self, logger: Optional[Logger] = None) -> SimpleSaga:
+        return SimpleSaga(tasks=[task.new_task(logger=logger) for task in self.tasks], name=self.name, logger=logger)
+
+
+def specs_of(sagas: Sequence[SimpleSaga]) -> List[SagaSpec]:
+    return [SagaSpec.of(saga) for saga in sagas]
+
+
+def new_sagas(specs: Sequence[SagaSpec], logger: Optional[Logger] = None) -> List[SimpleSaga]:
+    return [spec.new_saga(logger=logger) for spec in specs]
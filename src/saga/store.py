@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from typing import List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+from jsonpickle import decode, encode
+
+from src.log import Logger
+from src.saga.simple_saga import SimpleSaga
+from src.saga.spec import SagaSpec
+from src.saga.task import Task, SystemOperation
+from src.sys.time.duration import Duration
+
+
+class OperationStore:
+    def __init__(
+            self,
+            durations: np.ndarray,
+            to_process: np.ndarray,
+            task_offsets: np.ndarray,
+            saga_offsets: np.ndarray,
+            saga_names: Optional[Sequence[str]] = None,
+            task_names: Optional[Sequence[str]] = None,
+            operation_names: Optional[Sequence[str]] = None
+    ):
+        if len(durations) != len(to_process):
+            raise ValueError(f"Got {len(durations)} durations but {len(to_process)} to_process flags")
+        if task_offsets[-1] != len(durations) or saga_offsets[-1] != len(task_offsets) - 1:
+            raise ValueError("Offsets should end with the number of operations and tasks respectively")
+        if np.any(np.diff(task_offsets) <= 0):
+            raise ValueError("Task should contain operations")
+        if np.any(durations <= 0):
+            raise ValueError("Duration of all operations should be positive")
+
+        self.durations: np.ndarray = durations
+        self.to_process: np.ndarray = to_process
+        self.task_offsets: np.ndarray = task_offsets
+        self.saga_offsets: np.ndarray = saga_offsets
+        self.saga_names: Optional[Sequence[str]] = saga_names
+        self.task_names: Optional[Sequence[str]] = task_names
+        self.operation_names: Optional[Sequence[str]] = operation_names
+
+    @staticmethod
+    def from_sagas(sagas: Sequence[Union[SimpleSaga, SagaSpec]], keep_names: bool = True) -> OperationStore:
+        durations: List[int] = []
+        to_process: List[bool] = []
+        task_offsets: List[int] = [0]
+        saga_offsets: List[int] = [0]
+        task_names: List[str] = []
+        operation_names: List[str] = []
+
+        for saga in sagas:
+            for task in saga.tasks:
+                for operation in task.operations:
+                    durations.append(operation.duration.micros)
+                    to_process.append(operation.to_process)
+                    operation_names.append(operation.name)
+                task_offsets.append(len(durations))
+                task_names.append(task.name)
+            saga_offsets.append(len(task_offsets) - 1)
+
+        return OperationStore(
+            durations=np.array(durations, dtype=np.int64),
+            to_process=np.array(to_process, dtype=np.bool_),
+            task_offsets=np.array(task_offsets, dtype=np.int64),
+            saga_offsets=np.array(saga_offsets, dtype=np.int64),
+            saga_names=[saga.name for saga in sagas] if keep_names else None,
+            task_names=task_names if keep_names else None,
+            operation_names=operation_names if keep_names else None
+        )
+
+    @staticmethod
+    def load(path: str, number_of_sagas: Optional[int] = None) -> OperationStore:
+        with open(path, mode="rb") as file:
+            buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        magic, version, flags, sagas, tasks, operations, names_size = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a saga store of version {_VERSION}")
+
+        reader = _Reader(buffer)
+        saga_offsets = reader.array(np.int64, sagas + 1)
+        task_offsets = reader.array(np.int64, tasks + 1)
+        durations = reader.array(np.int64, operations)
+        to_process = reader.array(np.bool_, operations)
+
+        number = sagas if number_of_sagas is None else min(number_of_sagas, sagas)
+        tasks_in_prefix = int(saga_offsets[number])
+        operations_in_prefix = int(task_offsets[tasks_in_prefix])
+
+        names: List[Optional[_StringTable]] = [None, None, None]
+        if flags & _HAS_NAMES:
+            name_offsets = reader.array(np.int64, sagas + tasks + operations + 1)
+            blob = reader.array(np.uint8, names_size)
+            names = [
+                _StringTable(blob, name_offsets, start=0, size=number),
+                _StringTable(blob, name_offsets, start=sagas, size=tasks_in_prefix),
+                _StringTable(blob, name_offsets, start=sagas + tasks, size=operations_in_prefix)
+            ]
+
+        return OperationStore(
+            durations=durations[:operations_in_prefix],
+            to_process=to_process[:operations_in_prefix],
+            task_offsets=task_offsets[:tasks_in_prefix + 1],
+            saga_offsets=saga_offsets[:number + 1],
+            saga_names=names[0],
+            task_names=names[1],
+            operation_names=names[2]
+        )
+
+    def save(self, path: str):
+        has_names = self.saga_names is not None and self.task_names is not None and self.operation_names is not None
+        sections = [
+            self.saga_offsets.astype(np.int64),
+            self.task_offsets.astype(np.int64),
+            self.durations.astype(np.int64),
+            self.to_process.astype(np.bool_)
+        ]
+        blob = b""
+        if has_names:
+            name_offsets, blob = _encode_names([*self.saga_names, *self.task_names, *self.operation_names])
+            sections.append(name_offsets)
+
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _HAS_NAMES if has_names else 0,
+            self.number_of_sagas,
+            self.number_of_tasks,
+            self.number_of_operations,
+            len(blob)
+        )
+        with open(path, mode="wb") as file:
+            file.write(header.ljust(_HEADER_SIZE, b"\0"))
+            for section in sections:
+                file.write(_padded(section.tobytes()))
+            file.write(blob)
+
+    def digest(self) -> str:
+        content = sha256()
+        for section in (self.saga_offsets, self.task_offsets, self.durations, self.to_process):
+            content.update(np.ascontiguousarray(section).tobytes())
+        return content.hexdigest()
+
+    def to_sagas(self) -> List[SimpleSaga]:
+        durations: List[int] = self.durations.tolist()
+        to_process: List[bool] = self.to_process.tolist()
+        task_offsets: List[int] = self.task_offsets.tolist()
+        saga_offsets: List[int] = self.saga_offsets.tolist()
+
+        return [
+            SimpleSaga(
+                tasks=[
+                    Task(
+                        operations=[
+                            SystemOperation(
+                                to_process=to_process[operation],
+                                name=self.operation_names[operation] if self.operation_names is not None else "",
+                                duration=Duration(micros=durations[operation])
+                            )
+                            for operation
+                            in range(task_offsets[task], task_offsets[task + 1])
+                        ],
+                        name=self.task_names[task] if self.task_names is not None else None
+                    )
+                    for task
+                    in range(saga_offsets[saga], saga_offsets[saga + 1])
+                ],
+                name=self.saga_names[saga] if self.saga_names is not None else f"saga{saga}"
+            )
+            for saga
+            in range(self.number_of_sagas)
+        ]
+
+    @property
+    def number_of_sagas(self) -> int:
+        return len(self.saga_offsets) - 1
+
+    @property
+    def number_of_tasks(self) -> int:
+        return len(self.task_offsets) - 1
+
+    @property
+    def number_of_operations(self) -> int:
+        return len(self.durations)
+
+    def simulated_micros(self, number_of_sagas: Optional[int] = None) -> int:
+        number = self.number_of_sagas if number_of_sagas is None else min(number_of_sagas, self.number_of_sagas)
+        return int(self.durations[:int(self.task_offsets[int(self.saga_offsets[number])])].sum())
+
+    @property
+    def nbytes(self) -> int:
+        return self.durations.nbytes + self.to_process.nbytes + self.task_offsets.nbytes + self.saga_offsets.nbytes
+
+    def sagas(self, number: Optional[int] = None, logger: Optional[Logger] = None) -> List[SimpleSaga]:
+        number = self.number_of_sagas if number is None else min(number, self.number_of_sagas)
+        progress = _Progress(self, tasks=int(self.saga_offsets[number]))
+
+        return [
+            SimpleSaga(
+                tasks=[
+                    StoredTask(store=self, progress=progress, index=task_index, logger=logger)
+                    for task_index
+                    in range(int(self.saga_offsets[saga_index]), int(self.saga_offsets[saga_index + 1]))
+                ],
+                name=self.saga_names[saga_index] if self.saga_names is not None else f"saga{saga_index}",
+                logger=logger
+            )
+            for saga_index
+            in range(number)
+        ]
+
+
+def convert_json_to_store(json_path: str, store_path: str, keep_names: bool = True):
+    with open(file=json_path, mode="r") as file:
+        sagas: List[SimpleSaga] = decode(file.read())
+    OperationStore.from_sagas(sagas, keep_names=keep_names).save(store_path)
+
+
+def convert_store_to_json(store_path: str, json_path: str):
+    with open(file=json_path, mode="w") as file:
+        file.write(encode(OperationStore.load(store_path).to_sagas(), indent=4))
+
+
+# magic, version, flags, number of sagas, tasks and operations, size of the names blob
+_HEADER = Struct("<8sIIQQQQ")
+_HEADER_SIZE = 64
+_MAGIC = b"SAGASTOR"
+_VERSION = 1
+_HAS_NAMES = 1
+_ALIGNMENT = 8
+
+
+def _padded(section: bytes) -> bytes:
+    return section + b"\0" * (-len(section) % _ALIGNMENT)
+
+
+def _encode_names(names: Sequence[str]) -> Tuple[np.ndarray, bytes]:
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+class _Reader:
+    def __init__(self, buffer: mmap):
+        self._buffer = buffer
+        self._position = _HEADER_SIZE
+
+    def array(self, dtype: type, count: int) -> np.ndarray:
+        array = np.frombuffer(self._buffer, dtype=dtype, count=count, offset=self._position)
+        self._position += array.nbytes + (-array.nbytes % _ALIGNMENT)
+        return array
+
+
+class _StringTable(Sequence[str]):
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray, start: int, size: int):
+        self._blob = blob
+        self._offsets = offsets
+        self._start = start
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Name {index} is out of {self._size} names")
+
+        begin, end = self._offsets[self._start + index], self._offsets[self._start + index + 1]
+        return self._blob[begin:end].tobytes().decode("utf-8")
+
+
+class _Progress:
+    def __init__(self, store: OperationStore, tasks: int):
+        self.cursors: np.ndarray = store.task_offsets[:tasks].copy()
+        self.processed: np.ndarray = np.zeros(tasks, dtype=np.int64)
+
+
+class _StoredOperations(Sequence[SystemOperation]):
+    def __init__(self, store: OperationStore, start: int, end: int):
+        self._store = store
+        self._start = start
+        self._size = end - start
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[SystemOperation, List[SystemOperation]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Operation {index} is out of {self._size} operations")
+
+        operation = self._start + index
+        return SystemOperation(
+            to_process=bool(self._store.to_process[operation]),
+            name=self._store.operation_names[operation] if self._store.operation_names is not None else "",
+            duration=Duration(micros=int(self._store.durations[operation]))
+        )
+
+
+# the cursor and processed time of a stored task live in the arrays shared by all tasks of its sagas
+class StoredTask(Task):
+    def __init__(self, store: OperationStore, progress: _Progress, index: int, logger: Optional[Logger] = None):
+        self._store = store
+        self._progress = progress
+        self._index = index
+        self._start: int = int(store.task_offsets[index])
+        super().__init__(
+            operations=_StoredOperations(store, start=self._start, end=int(store.task_offsets[index + 1])),
+            name=store.task_names[index] if store.task_names is not None else None,
+            identifier=UUID(int=index),
+            logger=logger
+        )
+
+    @property
+    def _operation_index(self) -> int:
+        return int(self._progress.cursors[self._index]) - self._start
+
+    @_operation_index.setter
+    def _operation_index(self, value: int):
+        self._progress.cursors[self._index] = self._start + value
+
+    @property
+    def _current_operation_processed_time(self) -> Duration:
+        return Duration(micros=int(self._progress.processed[self._index]))
+
+    @_current_operation_processed_time.setter
+    def _current_operation_processed_time(self, value: Duration):
+        self._progress.processed[self._index] = value.micros
+
+    def _current_operation_duration(self) -> Duration:
+        return Duration(micros=int(self._store.durations[self._progress.cursors[self._index]]))
+
+    def _current_operation_is_to_process(self) -> bool:
+        return bool(self._store.to_process[self._progress.cursors[self._index]])
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from src.saga.task import Task
+from src.sys.thread import Executable
+from src.sys.time.duration import Duration
+from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
+
+
+@dataclass(frozen=True)
+class StreamReport:
+    log_name: str
+    simulation_duration: Duration
+    arrived: int
+    completed: int
+    in_flight: int
+    offered_rate: float
+    throughput: float
+    avg_latency: Duration
+
+
+# the sustained throughput is the best one seen, the saturation point is the highest rate still kept up with
+@dataclass(frozen=True)
+class Saturation:
+    log_name: str
+    sustained_throughput: float
+    saturation_rate: Optional[float]
+
+    @staticmethod
+    def of(log_name: str, reports: Sequence[StreamReport], tolerance: float = 0.05) -> Saturation:
+        kept_up = [
+            report.offered_rate
+            for report
+            in reports
+            if report.throughput >= (1 - tolerance) * report.offered_rate
+        ]
+        return Saturation(
+            log_name=log_name,
+            sustained_throughput=max([report.throughput for report in reports], default=0.0),
+            saturation_rate=max(kept_up, default=None)
+        )
+
+
+# counts sagas arriving and completing after the warm up, when the system is expected to be in a steady state
+class Admissions:
+    def __init__(self, warm_up: Duration = Duration.zero()):
+        self._warm_up: int = warm_up.micros
+        self._finished: List[Admitted] = []
+        self._admitted: int = 0
+        self._released: int = 0
+        self._arrived: int = 0
+        self._completed: int = 0
+        self._latency_micros: int = 0
+
+    def admit(self, executable: Executable, arrived_at: Duration) -> Admitted:
+        self._admitted += 1
+        if arrived_at.micros >= self._warm_up:
+            self._arrived += 1
+        return Admitted(executable=executable, arrived_at=arrived_at.micros, on_finished=self._finished.append)
+
+    # sagas finished during the last step are completed at its end
+    def complete_finished(self, now: Duration):
+        if not self._finished:
+            return
+        self._released += len(self._finished)
+        if now.micros > self._warm_up:
+            self._completed += len(self._finished)
+            self._latency_micros += sum(now.micros - admitted.arrived_at for admitted in self._finished)
+        self._finished.clear()
+
+    def report(self, log_name: str, duration: Duration) -> StreamReport:
+        window_seconds = max(duration.micros - self._warm_up, 0) / 10 ** 6
+        return StreamReport(
+            log_name=log_name,
+            simulation_duration=duration,
+            arrived=self._arrived,
+            completed=self._completed,
+            in_flight=self._admitted - self._released,
+            offered_rate=self._arrived / window_seconds if window_seconds else 0.0,
+            throughput=self._completed / window_seconds if window_seconds else 0.0,
+            avg_latency=Duration(micros=self._latency_micros // self._completed) if self._completed else Duration.zero()
+        )
+
+
+class Admitted(Executable):
+    def __init__(self, executable: Executable, arrived_at: int, on_finished: Callable[[Admitted], None]):
+        self.arrived_at = arrived_at
+        self._executable = executable
+        self._on_finished = on_finished
+
+    def register_waits(self, timer: WaitTimer):
+        self._executable.register_waits(timer)
+
+    def arrive(self, instant: Duration):
+        self._executable.arrive(instant)
+
+    def get_current_tasks(self) -> List[Task]:
+        return self._executable.get_current_tasks()
+
+    def current_task(self) -> Optional[Task]:
+        return self._executable.current_task()
+
+    def has_runnable_task(self) -> bool:
+        return self._executable.has_runnable_task()
+
+    def ticked(self, time_delta: TimeDelta):
+        self._executable.ticked(time_delta)
+        if self._executable.is_finished():
+            self._on_finished(self)
+
+    def next_event_in(self) -> Optional[Duration]:
+        return self._executable.next_event_in()
+
+    def is_finished(self) -> bool:
+        return self._executable.is_finished()
+
+    def __str__(self) -> str:
+        return str(self._executable)
+
+    def __repr__(self):
+        return repr(self._executable)
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import uuid4, UUID
 
 from src.sys.time.time import TimeAffected, TimeDelta
-from src.log import LogContext
+from src.log import Logger, ContextLogger
 from src.sys.time.duration import Duration
+from src.sys.time.timer import Waiting, WaitTimer
 
 
 # TODO: check if wait_is_finished check duration. Only if switched from another coroutine
@@ -19,20 +20,45 @@ class SystemOperation:
             raise ValueError(f'Duration of {self} should be positive')
 
 
-class Task(TimeAffected):
+class Task(TimeAffected, Waiting):
+    # set by the saga the task belongs to
+    saga_name: Optional[str] = None
+    # tasks pickled before time deltas were identified by a counter, waits were timed or loggers injected
+    _last_time_delta_identifier: Optional[int] = None
+    _timer: Optional[WaitTimer] = None
+    _logger: Logger = ContextLogger()
+
     def __init__(
             self,
-            operations: List[SystemOperation],
+            operations: Sequence[SystemOperation],
             name: Optional[str] = None,
-            identifier: Optional[UUID] = None
+            identifier: Optional[UUID] = None,
+            logger: Optional[Logger] = None
     ):
         if not operations:
             raise ValueError('Task should contain operations')
-        self.operations: List[SystemOperation] = operations
+        self.operations = operations
         self.name = name if name else "_❔task❔_"
         self._current_operation_processed_time: Duration = Duration.zero()
-        self._last_time_delta: Optional[TimeDelta] = None
+        self._last_time_delta_identifier: Optional[int] = None
+        self._timer: Optional[WaitTimer] = None
         self.identifier = identifier if identifier else uuid4()
+        self._logger: Logger = logger if logger is not None else ContextLogger()
+
+    @property
+    def operations(self) -> List[SystemOperation]:
+        return list(self._operations[self._operation_index:])
+
+    # also restores tasks pickled when operations were a plain list consumed from the front;
+    # a list is copied, any other sequence is kept as given so stored operations can be read lazily
+    @operations.setter
+    def operations(self, operations: Sequence[SystemOperation]):
+        self._operations: Sequence[SystemOperation] = tuple(operations) if isinstance(operations, list) else operations
+        self._operation_index: int = 0
+
+    def register_waits(self, timer: WaitTimer):
+        self._timer = timer
+        self._schedule_if_waiting()
 
     def ticked(self, time_delta: TimeDelta):
         if self.is_complete():
@@ -42,7 +68,7 @@ class Task(TimeAffected):
         if self._should_skip_same_time_delta_update(time_delta):
             return
 
-        LogContext.logger().log_task_processing(name=self.name, identifier=self.identifier)
+        self._logger.log_task_processing(name=self.name, identifier=self.identifier, saga=self.saga_name)
         self._increment_time_processing(time_delta)
         self._handle_if_operation_finished()
 
@@ -57,23 +83,47 @@ class Task(TimeAffected):
         self._increment_time_waiting(time_delta)
         self._handle_if_operation_finished()
 
+    def wake_up(self):
+        if self.is_complete() or not self.is_waiting():
+            return
+
+        self._current_operation_processed_time = self._current_operation_duration()
+        self._handle_if_operation_finished()
+
+    def next_event_in(self) -> Optional[Duration]:
+        if self.is_complete():
+            return None
+        return self._current_operation_duration() - self._current_operation_processed_time
+
     def is_complete(self) -> bool:
-        return not self.operations
+        return self._operation_index >= len(self._operations)
 
     def is_waiting(self) -> bool:
-        if not self.operations:
+        if self.is_complete():
             return True
 
         return not self._current_operation_is_to_process()
 
     def _handle_if_operation_finished(self):
-        next_operation_time = self._current_operation_processed_time - self._current_operation().duration
+        next_operation_time = self._current_operation_processed_time - self._current_operation_duration()
         if next_operation_time.is_zero or next_operation_time.is_positive:
-            self.operations.pop(0)
+            self._finish_current_operation()
             self._current_operation_processed_time = next_operation_time
+            self._schedule_if_waiting()
+
+    def _schedule_if_waiting(self):
+        if self._timer is None or self.is_complete() or not self.is_waiting():
+            return
+        self._timer.schedule(self, self._current_operation_duration() - self._current_operation_processed_time)
 
     def _current_operation(self) -> Optional[SystemOperation]:
-        return self.operations[0]
+        return self._operations[self._operation_index]
+
+    def _current_operation_duration(self) -> Duration:
+        return self._current_operation().duration
+
+    def _finish_current_operation(self):
+        self._operation_index += 1
 
     def _current_operation_is_to_process(self) -> bool:
         current = self._current_operation()
@@ -90,9 +140,9 @@ class Task(TimeAffected):
         self._current_operation_processed_time += delta.duration
 
     def _should_skip_same_time_delta_update(self, delta: TimeDelta) -> bool:
-        if self._last_time_delta == delta:
+        if self._last_time_delta_identifier == delta.identifier:
             return True
-        self._last_time_delta = delta
+        self._last_time_delta_identifier = delta.identifier
         return False
 
     def __str__(self) -> str:
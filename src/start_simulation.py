@@ -1,111 +1,590 @@
-from copy import deepcopy
+from dataclasses import dataclass, replace
+from hashlib import sha256
 from datetime import datetime
+from time import perf_counter
 from multiprocessing import cpu_count, Pool
 from multiprocessing.pool import ApplyResult
-from typing import List, Any, Optional, TextIO
-
-from src.log import LogContext, Report
-from src.saga.orchestration import CoroutinesOrchestrator, Orchestrator
+from typing import List, Any, Optional, TextIO, Union, Tuple, Dict, Callable
+
+from src.accuracy import TickAccuracy
+from src.cache import ReportCache, SimulationResult
+from src.cost import CostModel, SimulationCost, predicted_makespan
+from src.log import LogContext, Report, LoggingLevel, Logger, ProcessorLog
+from src.profiling import Profiling, profiled, profile_summary
+from src.replication import ReplicatedReport, replications_needed
+from src.saga.arrival import ArrivalProcess
+from src.saga.batched import BatchedThreadedOrchestrator
+from src.saga.dataset import Dataset, InMemoryDataset
+from src.saga.generation import generate_saga_stream
+from src.saga.orchestration import CoroutinesOrchestrator, Orchestrator, Engine, ENGINE_VERSION
 from src.saga.orchestration import ThreadedOrchestrator
 from src.saga.simple_saga import SimpleSaga
+from src.saga.spec import SagaSpec, specs_of, new_sagas
+from src.saga.store import OperationStore
+from src.saga.streaming import StreamReport, Saturation
 from src.sys.system import ProcessingMode
+from src.sys.time.constants import thread_context_switch_overhead, thread_creation_cost, \
+    thread_deallocation_cost, thread_timeslice
+from src.sys.time.duration import Duration
+from src.trace import ChromeTraceWriter, TraceWriter
+
+
+def _threads_orchestrator(
+        processors: int,
+        mode: ProcessingMode,
+        engine: Engine,
+        logger: Optional[Logger] = None,
+        workers: Optional[int] = None,
+        tick_length: Duration = Duration.one_micro()
+) -> ThreadedOrchestrator:
+    return ThreadedOrchestrator(
+        processors_number=processors,
+        processing_mode=mode,
+        engine=engine,
+        logger=logger,
+        workers=workers,
+        tick_length=tick_length
+    )
+
+
+def _coroutines_orchestrator(
+        processors: int,
+        engine: Engine,
+        logger: Optional[Logger] = None,
+        workers: Optional[int] = None,
+        tick_length: Duration = Duration.one_micro()
+) -> CoroutinesOrchestrator:
+    return CoroutinesOrchestrator(
+        processors_number=processors,
+        engine=engine,
+        logger=logger,
+        workers=workers,
+        tick_length=tick_length
+    )
+
+
+def _orchestrator_name(mode: Optional[ProcessingMode]) -> str:
+    return ThreadedOrchestrator.name_of(mode) if mode is not None else CoroutinesOrchestrator.NAME
+
+
+_worker_specs: List[SagaSpec] = []
+_worker_dataset: List[Dataset] = []
+_worker_replicas: Dict[int, List[SagaSpec]] = {}
+
+
+def _load_dataset(dataset: Dataset):
+    _worker_specs[:] = specs_of(dataset.load())
+    _worker_dataset[:] = [dataset]
+    _worker_replicas.clear()
+
+
+# replicas are generated by the workers that simulate them
+def _specs_of_replica(replication: int) -> List[SagaSpec]:
+    if replication == 0:
+        return _worker_specs
+    if replication not in _worker_replicas:
+        _worker_replicas[replication] = specs_of(_worker_dataset[0].replica(replication).load())
+    return _worker_replicas[replication]
+
+
+@dataclass(frozen=True)
+class _Simulation:
+    processors: int
+    number_of_sagas: int
+    engine: Engine
+    logging_level: LoggingLevel
+    mode: Optional[ProcessingMode] = None
+    tick_length: Duration = Duration.one_micro()
+    batched: bool = False
+    replication: int = 0
+    trace_prefix: Optional[str] = None
+    profiling: Profiling = Profiling.OFF
+    profile_prefix: Optional[str] = None
+    workers: Optional[int] = None
+
+    def orchestrator(self, logger: Optional[Logger] = None) -> Orchestrator:
+        if self.mode is None:
+            return _coroutines_orchestrator(
+                processors=self.processors,
+                engine=self.engine,
+                logger=logger,
+                workers=self.workers,
+                tick_length=self.tick_length
+            )
+        return _threads_orchestrator(
+            processors=self.processors,
+            mode=self.mode,
+            engine=self.engine,
+            logger=logger,
+            workers=self.workers,
+            tick_length=self.tick_length
+        )
 
+    @property
+    def replica_label(self) -> str:
+        return f", replica {self.replication}" if self.replication != 0 else ""
 
-def _threads_orchestrator(processors: int, mode: ProcessingMode) -> ThreadedOrchestrator:
-    return ThreadedOrchestrator(processors_number=processors, processing_mode=mode)
+    def log_name(self, number_of_sagas: int) -> str:
+        return f"{_orchestrator_name(self.mode)}, {self.processors}p, {number_of_sagas}s{self.replica_label}"
 
+    @property
+    def orchestrator_name(self) -> str:
+        return self.mode.name if self.mode is not None else "coroutines"
 
-def _coroutines_orchestrator(processors: int) -> CoroutinesOrchestrator:
-    return CoroutinesOrchestrator(processors_number=processors)
+    # the batched pass is an engine of its own, so its results and timings are kept apart
+    @property
+    def engine_name(self) -> str:
+        return "BATCHED" if self.batched else self.engine.name
+
+    @property
+    def trace_path(self) -> Optional[str]:
+        if self.trace_prefix is None:
+            return None
+        return f"{self.trace_prefix}_{self._file_label}.json"
+
+    @property
+    def profile_path(self) -> Optional[str]:
+        if self.profile_prefix is None or self.profiling is Profiling.OFF:
+            return None
+        return f"{self.profile_prefix}_{self._file_label}.prof"
+
+    @property
+    def snapshot_path(self) -> Optional[str]:
+        if self.profile_prefix is None or self.profiling is not Profiling.CPU_AND_MEMORY:
+            return None
+        return f"{self.profile_prefix}_{self._file_label}.snapshot"
+
+    @property
+    def _file_label(self) -> str:
+        replica = f"_r{self.replication}" if self.replication != 0 else ""
+        return f"{self.orchestrator_name}_{self.processors}p_{self.number_of_sagas}s{replica}"
+
+    def cost(self, store: OperationStore) -> SimulationCost:
+        return SimulationCost(
+            orchestrator=self.orchestrator_name,
+            engine=self.engine_name,
+            number_of_sagas=self.number_of_sagas,
+            processors=self.processors,
+            operation_micros=store.simulated_micros(self.number_of_sagas),
+            tick_micros=self.tick_length.micros
+        )
+
+    def fingerprint(self, dataset_fingerprint: str) -> str:
+        parts = [
+            dataset_fingerprint,
+            self.number_of_sagas,
+            self.processors,
+            self.orchestrator_name,
+            self.engine_name,
+            self.logging_level.name,
+            self.tick_length.micros,
+            ENGINE_VERSION,
+            [constant().micros for constant in _TIMING_CONSTANTS]
+        ]
+        return sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+_FIRST_ROUND_REPLICATIONS = 3
+
+_TIMING_CONSTANTS = [thread_context_switch_overhead, thread_creation_cost, thread_deallocation_cost, thread_timeslice]
+
+
+@dataclass(frozen=True)
+class _Job:
+    simulation: _Simulation
+    cost: SimulationCost
+    estimate: float
+    key: Optional[str] = None
+
+
+# the logger of a run is built once and handed to everything the action simulates
+def _logged_result(
+        name: str,
+        level: LoggingLevel,
+        action: Callable[[Logger], Duration],
+        trace: Optional[TraceWriter] = None
+) -> SimulationResult:
+    result: List[Report] = []
+    logger = LogContext.new_logger(level=level, name=name, report_publisher=result.append, trace=trace)
+    duration = LogContext.run_logging(log_name=name, action=lambda: action(logger), logger=logger)
+    if not result:
+        return f"{name}: simulation_duration={duration}"
+    return result[0]
+
+
+def _merged(logger: Logger, logs: List[ProcessorLog]) -> Duration:
+    logger.merge(logs)
+    return max([log.duration for log in logs], default=Duration.zero())
 
 
 class _SimulationRunner:
     def __init__(
             self,
-            sagas: List[SimpleSaga],
+            sagas: Union[List[SimpleSaga], Dataset],
             processors: List[int],
             number_of_sagas_sets: Optional[List[int]] = None,
             thread_orchestrators_modes: List[ProcessingMode] = [],
-            coroutine_orchestrator: bool = False
+            coroutine_orchestrator: bool = False,
+            engine: Engine = Engine.TICKS,
+            logging_level: LoggingLevel = LoggingLevel.FULL,
+            cache: Optional[ReportCache] = None,
+            cost_model: Optional[CostModel] = None,
+            tick_length: Duration = Duration.one_micro(),
+            check_tick_accuracy: bool = False,
+            batched: bool = False,
+            replications: int = 1,
+            replication_width: Optional[float] = None,
+            trace: bool = False,
+            profiling: Profiling = Profiling.OFF,
+            workers: Optional[int] = None
     ):
-        self.sagas: List[SimpleSaga] = sagas
+        if batched and tick_length != Duration.one_micro():
+            raise ValueError(f"Batched simulations advance from event to event, got tick length {tick_length}")
+        if trace and (batched or logging_level is LoggingLevel.NONE):
+            raise ValueError("Traces are written from logging of every tick, which batched or unlogged runs skip")
+        if batched and profiling is not Profiling.OFF:
+            raise ValueError("Profiles are taken of every simulation apart, which batched runs share")
+        if replications < 1:
+            raise ValueError(f"Number of replications should be positive, got {replications}")
+        if replications > 1 and logging_level is LoggingLevel.NONE:
+            raise ValueError("Replications are aggregated from reports, which are not produced without logging")
+        self.dataset: Dataset = sagas if isinstance(sagas, Dataset) else InMemoryDataset(tuple(sagas))
+        if replications > 1:
+            self.dataset.replica(1)
         self.processors: List[int] = processors
         self.number_of_sagas_sets: List[int] = number_of_sagas_sets if number_of_sagas_sets is not None else [
-            len(sagas)]
+            len(self.dataset)]
         self.thread_orchestrators_modes: List[ProcessingMode] = thread_orchestrators_modes
         self.coroutine_orchestrator: bool = coroutine_orchestrator
+        self.engine: Engine = engine
+        self.logging_level: LoggingLevel = logging_level
+        self.cache: Optional[ReportCache] = cache
+        self.cost_model: CostModel = cost_model if cost_model is not None else CostModel()
+        self.tick_length: Duration = tick_length
+        self.check_tick_accuracy: bool = check_tick_accuracy
+        self.batched: bool = batched
+        self.replications: int = replications
+        self.replication_width: Optional[float] = replication_width
+        self.trace: bool = trace
+        self.profiling: Profiling = profiling
+        self.workers: Optional[int] = workers
+        self._dataset_fingerprint: Optional[str] = None
 
         now = datetime.now().strftime("%Y.%m.%d_%H-%M-%S")
         self._output_name = f"out/{now}.log"
-
-    def _sagas_copy(self, number: int) -> List[SimpleSaga]:
-        return deepcopy(self.sagas[:number])
+        self._trace_prefix: Optional[str] = f"out/{now}_trace" if trace else None
+        self._profile_prefix: Optional[str] = f"out/{now}_profile" if profiling is not Profiling.OFF else None
 
     def run_simulations(self):
-        this_machine_processors_to_use: int = min(self._number_of_simulations, cpu_count())
+        # simulations split over worker processes are run one by one
+        this_machine_processors_to_use: int = 1 if self.workers is not None else min(
+            self._number_of_simulations, cpu_count())
 
         print(f"Running {self._number_of_simulations} simulation in {this_machine_processors_to_use} processors")
         self._store_intro()
 
-        with Pool(processes=this_machine_processors_to_use) as pool:
-            self._run_simulations_in_pool(pool)
-            pool.close()
-            pool.join()
+        jobs = self._jobs()
+        if self.check_tick_accuracy and jobs and self.tick_length != Duration.one_micro():
+            self._store_tick_accuracy(jobs)
+
+        if self.replications == 1:
+            self._run_jobs(jobs, workers=this_machine_processors_to_use)
+        else:
+            self._run_replications(jobs, workers=this_machine_processors_to_use)
 
         self._store_line("Simulation successfully finished!")
         print("\nSimulation successfully finished!")
 
-    def _run_simulations_in_pool(self, pool: Pool):
+    def _run_jobs(self, jobs: List[_Job], workers: int) -> List[Tuple[_Job, SimulationResult]]:
+        results: List[Tuple[_Job, SimulationResult]] = []
+        pending = self._store_cached_results(jobs, results)
+        if not pending:
+            return results
+
+        batches = self._batches(pending)
+        workers = min(len(batches), workers)
+        predicted = predicted_makespan([sum(job.estimate for job in batch) for batch in batches], workers)
+        self._store_line(f"Predicted wall time of {len(pending)} simulations: {predicted:.1f}s")
+        print(f"Predicted wall time of {len(pending)} simulations: {predicted:.1f}s")
+
+        if self.workers is not None:
+            self._run_simulations_in_turn(batches, len(pending), results)
+            return results
+
+        with Pool(
+                processes=workers,
+                initializer=_load_dataset,
+                initargs=(self.dataset,)
+        ) as pool:
+            self._run_simulations_in_pool(pool, batches, len(pending), results)
+            pool.close()
+            pool.join()
+        return results
+
+    # replications are added in rounds till the interval of every simulation duration is narrow enough
+    def _run_replications(self, jobs: List[_Job], workers: int):
+        reports: Dict[_Simulation, Dict[int, Report]] = {job.simulation: {} for job in jobs}
+        first_round = self.replications if self.replication_width is None else min(
+            self.replications, _FIRST_ROUND_REPLICATIONS)
+        round_jobs = [self._replica_job(job, replication) for job in jobs for replication in range(first_round)]
+
+        while round_jobs:
+            for job, report in self._run_jobs(round_jobs, workers=workers):
+                reports[replace(job.simulation, replication=0)][job.simulation.replication] = report
+            if self.replication_width is None:
+                break
+
+            round_jobs = []
+            for job in jobs:
+                replicas = reports[job.simulation]
+                if not replicas:
+                    continue
+                replicated = ReplicatedReport.of(log_name="", reports=list(replicas.values()))
+                needed = min(
+                    self.replications,
+                    replications_needed(replicated.simulation_duration, len(replicas), self.replication_width)
+                )
+                following = max(replicas) + 1
+                round_jobs.extend(
+                    self._replica_job(job, replication)
+                    for replication
+                    in range(following, following + needed - len(replicas))
+                )
+
+        for job in jobs:
+            replicas = reports[job.simulation]
+            if not replicas:
+                continue
+            first = replace(job.simulation, replication=min(replicas))
+            report = ReplicatedReport.of(
+                log_name=replicas[first.replication].log_name.replace(first.replica_label, ""),
+                reports=list(replicas.values())
+            )
+            self._store_line(str(report))
+            print(f"\n{report}")
+
+    def _replica_job(self, job: _Job, replication: int) -> _Job:
+        if replication == 0:
+            return job
+        return _Job(
+            simulation=replace(job.simulation, replication=replication),
+            cost=job.cost,
+            estimate=job.estimate,
+            key=job.simulation.fingerprint(f"{self._dataset_fingerprint}/{replication}")
+            if self._dataset_fingerprint is not None else None
+        )
+
+    def _jobs(self) -> List[_Job]:
+        store = self.dataset.store()
+        self._dataset_fingerprint = store.digest() if self.cache is not None else None
+
+        jobs: List[_Job] = []
+        for simulation in self._simulations():
+            cost = simulation.cost(store)
+            jobs.append(_Job(
+                simulation=simulation,
+                cost=cost,
+                estimate=self.cost_model.estimate(cost),
+                key=simulation.fingerprint(self._dataset_fingerprint) if self._dataset_fingerprint is not None else None
+            ))
+        return sorted(jobs, key=lambda job: job.estimate, reverse=True)
+
+    # the cheapest configuration of the sweep is run at both tick lengths to tell what the coarse tick costs
+    def _store_tick_accuracy(self, jobs: List[_Job]):
+        coarse = replace(
+            min(jobs, key=lambda job: job.estimate).simulation,
+            logging_level=LoggingLevel.COUNTING,
+            trace_prefix=None,
+            profile_prefix=None
+        )
+        exact = replace(coarse, tick_length=Duration.one_micro())
+
+        with Pool(processes=2, initializer=_load_dataset, initargs=(self.dataset,)) as pool:
+            (exact_report, _), (coarse_report, _) = pool.map(self._run_simulation, [exact, coarse])
+
+        accuracy = TickAccuracy.of(tick_length=self.tick_length, exact=exact_report, coarse=coarse_report)
+        self._store_line(str(accuracy))
+        print(accuracy)
+
+    # traced and profiled simulations are run again, a cached report has neither a trace nor a profile
+    def _store_cached_results(self, jobs: List[_Job], results: List[Tuple[_Job, SimulationResult]]) -> List[_Job]:
+        if self.cache is None or self.trace or self.profiling is not Profiling.OFF:
+            return jobs
+
+        pending: List[_Job] = []
+        for job in jobs:
+            result = self.cache.get(job.key)
+            if result is None:
+                pending.append(job)
+            else:
+                self._store_line(str(result))
+                results.append((job, result))
+
+        cached = len(jobs) - len(pending)
+        self._store_line(f"Reused {cached} cached results")
+        print(f"Reused {cached} cached results")
+        return pending
+
+    # threaded simulations of the same sagas and mode differ only in processors, so one batched pass runs them all
+    def _batches(self, pending: List[_Job]) -> List[List[_Job]]:
+        if not self.batched:
+            return [[job] for job in pending]
+
+        batches: List[List[_Job]] = []
+        same_sagas_and_mode: Dict[Tuple[int, int, ProcessingMode], List[_Job]] = {}
+        for job in pending:
+            simulation = job.simulation
+            if simulation.mode is None:
+                batches.append([job])
+            else:
+                same_sagas_and_mode.setdefault(
+                    (simulation.replication, simulation.number_of_sagas, simulation.mode), []).append(job)
+        batches.extend(same_sagas_and_mode.values())
+        return sorted(batches, key=lambda batch: sum(job.estimate for job in batch), reverse=True)
+
+    def _run_simulations_in_pool(
+            self,
+            pool: Pool,
+            batches: List[List[_Job]],
+            total: int,
+            results: List[Tuple[_Job, SimulationResult]]
+    ):
         finished: List[int] = [0]
-        results: List[ApplyResult] = []
+        applied: List[ApplyResult] = []
 
-        self._display_progress_bar(current=0, total=self._number_of_simulations)
+        self._display_progress_bar(current=0, total=total)
 
-        def callback(report: Report):
-            finished[0] = finished[0] + 1
-            self._display_progress_bar(current=finished[0], total=self._number_of_simulations)
-            self._store_line(str(report))
+        def callback_for(batch: List[_Job]):
+            def callback(outcomes: List[Tuple[SimulationResult, float]]):
+                self._store_outcomes(batch, outcomes, finished, total, results)
+
+            return callback
 
         def error_callback(r: Any):
             print(f"Simulation error: {r}")
 
+        for batch in batches:
+            applied.append(
+                pool.apply_async(
+                    self._run_batch,
+                    args=([job.simulation for job in batch],),
+                    callback=callback_for(batch),
+                    error_callback=error_callback
+                )
+            )
+
+        for result in applied:
+            result.wait()
+
+    # pool workers cannot start processes, so simulations split over worker processes are run one by one from here
+    def _run_simulations_in_turn(
+            self,
+            batches: List[List[_Job]],
+            total: int,
+            results: List[Tuple[_Job, SimulationResult]]
+    ):
+        finished: List[int] = [0]
+        _load_dataset(self.dataset)
+
+        self._display_progress_bar(current=0, total=total)
+        for batch in batches:
+            outcomes = self._run_batch([job.simulation for job in batch])
+            self._store_outcomes(batch, outcomes, finished, total, results)
+
+    def _store_outcomes(
+            self,
+            batch: List[_Job],
+            outcomes: List[Tuple[SimulationResult, float]],
+            finished: List[int],
+            total: int,
+            results: List[Tuple[_Job, SimulationResult]]
+    ):
+        for job, (report, seconds) in zip(batch, outcomes):
+            finished[0] = finished[0] + 1
+            self._display_progress_bar(current=finished[0], total=total)
+            self._store_line(str(report))
+            profile_path = job.simulation.profile_path
+            if profile_path is None:
+                self.cost_model.record(job.cost, seconds)
+            else:
+                self._store_line(profile_summary(profile_path, job.simulation.snapshot_path))
+            results.append((job, report))
+            if job.key is not None:
+                self.cache.put(job.key, report)
+
+    def _simulations(self) -> List[_Simulation]:
+        simulations: List[_Simulation] = []
+        modes: List[Optional[ProcessingMode]] = list(self.thread_orchestrators_modes)
+        if self.coroutine_orchestrator:
+            modes.append(None)
+
         for number_of_sagas in self.number_of_sagas_sets:
-            sagas_to_process = self._sagas_copy(number_of_sagas)
             for number_of_processors in self.processors:
-                for mode in self.thread_orchestrators_modes:
-                    orchestrator = _threads_orchestrator(processors=number_of_processors, mode=mode)
-                    results.append(
-                        pool.apply_async(
-                            self._run_simulation,
-                            args=(orchestrator, number_of_processors, sagas_to_process),
-                            callback=callback,
-                            error_callback=error_callback
-                        )
-                    )
-                if self.coroutine_orchestrator:
-                    orchestrator = _coroutines_orchestrator(processors=number_of_processors)
-                    results.append(
-                        pool.apply_async(
-                            self._run_simulation,
-                            args=(orchestrator, number_of_processors, sagas_to_process),
-                            callback=callback
-                        )
-                    )
-
-        for result in results:
-            result.wait()
+                for mode in modes:
+                    simulations.append(_Simulation(
+                        processors=number_of_processors,
+                        number_of_sagas=number_of_sagas,
+                        engine=self.engine,
+                        logging_level=self.logging_level,
+                        mode=mode,
+                        tick_length=self.tick_length,
+                        batched=self.batched and mode is not None,
+                        trace_prefix=self._trace_prefix,
+                        profiling=self.profiling,
+                        profile_prefix=self._profile_prefix,
+                        workers=self.workers
+                    ))
+        return simulations
 
     @staticmethod
-    def _run_simulation(orchestrator: Orchestrator, processors: int, sagas: List[SimpleSaga]) -> Report:
-        name = f"{orchestrator.name()}, {processors}p, {len(sagas)}s"
+    def _run_batch(simulations: List[_Simulation]) -> List[Tuple[SimulationResult, float]]:
+        if not simulations[0].batched:
+            return [_SimulationRunner._run_simulation(simulation) for simulation in simulations]
+
+        started = perf_counter()
+        specs = _specs_of_replica(simulations[0].replication)[:simulations[0].number_of_sagas]
+        orchestrator = BatchedThreadedOrchestrator(
+            processors_numbers=[simulation.processors for simulation in simulations],
+            processing_mode=simulations[0].mode
+        )
+        logs = orchestrator.process(OperationStore.from_sagas(specs, keep_names=False))
+
+        results: List[SimulationResult] = [
+            _logged_result(
+                name=simulation.log_name(len(specs)),
+                level=simulation.logging_level,
+                action=lambda logger: _merged(logger, simulation_logs)
+            )
+            for simulation, simulation_logs
+            in zip(simulations, logs)
+        ]
+        seconds = (perf_counter() - started) / len(simulations)
+        return [(result, seconds) for result in results]
 
-        result: List[Report] = []
-        LogContext.run_logging(
-            log_name=name,
-            action=lambda: orchestrator.process(sagas),
-            report_publisher=lambda report: result.append(report)
+    @staticmethod
+    def _run_simulation(simulation: _Simulation) -> Tuple[SimulationResult, float]:
+        started = perf_counter()
+        specs = _specs_of_replica(simulation.replication)[:simulation.number_of_sagas]
+        trace = ChromeTraceWriter(simulation.trace_path) if simulation.trace_path is not None else None
+
+        def process(logger: Logger) -> Duration:
+            orchestrator = simulation.orchestrator(logger=logger)
+            sagas = new_sagas(specs, logger=logger)
+            if simulation.profile_path is None:
+                return orchestrator.process(sagas)
+            return profiled(
+                action=lambda: orchestrator.process(sagas),
+                profile_path=simulation.profile_path,
+                snapshot_path=simulation.snapshot_path
+            )
+
+        result = _logged_result(
+            name=simulation.log_name(len(specs)),
+            level=simulation.logging_level,
+            action=process,
+            trace=trace
         )
-        return result[0]
+        return result, perf_counter() - started
 
     def _store_intro(self):
         self._store_line(f"Running simulation on the next dataset:")
@@ -113,6 +592,15 @@ class _SimulationRunner:
         self._store_line(f"* number of sagas per simulation={self.number_of_sagas_sets}")
         self._store_line(f"* thread orchestrators={self.thread_orchestrators_modes}")
         self._store_line(f"* coroutine orchestrator used={self.coroutine_orchestrator}")
+        self._store_line(f"* simulation engine={self.engine}")
+        self._store_line(f"* tick length={self.tick_length}")
+        self._store_line(f"* batched processors={self.batched}")
+        self._store_line(f"* replications={self.replications}, interval width={self.replication_width}")
+        self._store_line(f"* logging level={self.logging_level}")
+        self._store_line(f"* traces={self._trace_prefix}")
+        self._store_line(f"* profiling={self.profiling}")
+        self._store_line(f"* worker processes per simulation={self.workers}")
+        self._store_line(f"* result cache={self.cache.directory if self.cache is not None else None}")
         self._store_line(f"* number of simulations to run={self._number_of_simulations}")
 
     def _store_line(self, line: str):
@@ -142,17 +630,190 @@ class _SimulationRunner:
         print(f'Progress: [{progress_visualisation}] {int(percent)}%  ({current} of {total})', end='\r')
 
 
+@dataclass(frozen=True)
+class _StreamingSimulation:
+    processors: int
+    arrivals: ArrivalProcess
+    horizon: Duration
+    warm_up: Duration
+    seed: int
+    logging_level: LoggingLevel
+    mode: Optional[ProcessingMode] = None
+
+    @property
+    def orchestrator_name(self) -> str:
+        return self.mode.name if self.mode is not None else "coroutines"
+
+    def log_name(self) -> str:
+        return f"{_orchestrator_name(self.mode)}, {self.processors}p, {self.arrivals}"
+
+    def orchestrator(self, logger: Logger) -> Orchestrator:
+        if self.mode is None:
+            return _coroutines_orchestrator(processors=self.processors, engine=Engine.EVENTS, logger=logger)
+        return _threads_orchestrator(processors=self.processors, mode=self.mode, engine=Engine.EVENTS, logger=logger)
+
+
+# every orchestrator and processors number is fed with each arrival process, usually the same one at growing rates
+class _StreamingRunner:
+    def __init__(
+            self,
+            processors: List[int],
+            arrival_processes: List[ArrivalProcess],
+            horizon: Duration,
+            warm_up: Duration = Duration.zero(),
+            thread_orchestrators_modes: List[ProcessingMode] = [],
+            coroutine_orchestrator: bool = False,
+            seed: int = 0,
+            logging_level: LoggingLevel = LoggingLevel.COUNTING
+    ):
+        if warm_up >= horizon:
+            raise ValueError(f"Warm up should end before the horizon, got {warm_up} and {horizon}")
+        self.processors: List[int] = processors
+        self.arrival_processes: List[ArrivalProcess] = arrival_processes
+        self.horizon: Duration = horizon
+        self.warm_up: Duration = warm_up
+        self.thread_orchestrators_modes: List[ProcessingMode] = thread_orchestrators_modes
+        self.coroutine_orchestrator: bool = coroutine_orchestrator
+        self.seed: int = seed
+        self.logging_level: LoggingLevel = logging_level
+
+        now = datetime.now().strftime("%Y.%m.%d_%H-%M-%S")
+        self._output_name = f"out/{now}_streaming.log"
+
+    def run_simulations(self):
+        simulations = self._simulations()
+        workers = min(len(simulations), cpu_count())
+        print(f"Running {len(simulations)} streaming simulations in {workers} processors")
+        self._store_intro()
+
+        with Pool(processes=workers) as pool:
+            results = pool.map(self._run_simulation, simulations)
+
+        stream_reports: Dict[Tuple[Optional[ProcessingMode], int], List[StreamReport]] = {}
+        for simulation, (stream_report, report) in zip(simulations, results):
+            self._store_line(str(stream_report))
+            if report is not None:
+                self._store_line(str(report))
+            stream_reports.setdefault((simulation.mode, simulation.processors), []).append(stream_report)
+
+        for (mode, processors), reports in stream_reports.items():
+            orchestrator_name = mode.name if mode is not None else "coroutines"
+            saturation = Saturation.of(log_name=f"{orchestrator_name}, {processors}p", reports=reports)
+            self._store_line(str(saturation))
+            print(saturation)
+
+        self._store_line("Streaming simulation successfully finished!")
+        print("\nStreaming simulation successfully finished!")
+
+    def _simulations(self) -> List[_StreamingSimulation]:
+        modes: List[Optional[ProcessingMode]] = list(self.thread_orchestrators_modes)
+        if self.coroutine_orchestrator:
+            modes.append(None)
+
+        return [
+            _StreamingSimulation(
+                processors=processors,
+                arrivals=arrivals,
+                horizon=self.horizon,
+                warm_up=self.warm_up,
+                seed=self.seed,
+                logging_level=self.logging_level,
+                mode=mode
+            )
+            for processors in self.processors
+            for mode in modes
+            for arrivals in self.arrival_processes
+        ]
+
+    @staticmethod
+    def _run_simulation(simulation: _StreamingSimulation) -> Tuple[StreamReport, Optional[Report]]:
+        name = simulation.log_name()
+        reports: List[Report] = []
+        logger = LogContext.new_logger(level=simulation.logging_level, name=name, report_publisher=reports.append)
+        stream_report = LogContext.run_logging(
+            log_name=name,
+            action=lambda: simulation.orchestrator(logger).stream(
+                sagas=generate_saga_stream(seed=simulation.seed, logger=logger),
+                arrivals=simulation.arrivals,
+                horizon=simulation.horizon,
+                warm_up=simulation.warm_up
+            ),
+            logger=logger
+        )
+        return replace(stream_report, log_name=name), next(iter(reports), None)
+
+    def _store_intro(self):
+        self._store_line(f"Running streaming simulation:")
+        self._store_line(f"* processors={self.processors}")
+        self._store_line(f"* arrival processes={self.arrival_processes}")
+        self._store_line(f"* horizon={self.horizon}, warm up={self.warm_up}")
+        self._store_line(f"* thread orchestrators={self.thread_orchestrators_modes}")
+        self._store_line(f"* coroutine orchestrator used={self.coroutine_orchestrator}")
+        self._store_line(f"* sagas seed={self.seed}")
+        self._store_line(f"* logging level={self.logging_level}")
+
+    def _store_line(self, line: str):
+        with open(self._output_name, mode="a") as output:
+            output.write(line + "\n")
+
+
+def run_streaming_simulation(
+        processors: List[int],
+        arrival_processes: List[ArrivalProcess],
+        horizon: Duration,
+        warm_up: Duration = Duration.zero(),
+        thread_orchestrators_modes: List[ProcessingMode] = [],
+        coroutine_orchestrator: bool = False,
+        seed: int = 0,
+        logging_level: LoggingLevel = LoggingLevel.COUNTING
+):
+    _StreamingRunner(
+        processors=processors,
+        arrival_processes=arrival_processes,
+        horizon=horizon,
+        warm_up=warm_up,
+        thread_orchestrators_modes=thread_orchestrators_modes,
+        coroutine_orchestrator=coroutine_orchestrator,
+        seed=seed,
+        logging_level=logging_level
+    ).run_simulations()
+
+
 def run_simulation(
-        sagas: List[SimpleSaga],
+        sagas: Union[List[SimpleSaga], Dataset],
         processors: List[int],
         number_of_sagas_sets: Optional[List[int]] = None,
         thread_orchestrators_modes: List[ProcessingMode] = [],
-        coroutine_orchestrator: bool = False
+        coroutine_orchestrator: bool = False,
+        engine: Engine = Engine.TICKS,
+        logging_level: LoggingLevel = LoggingLevel.FULL,
+        cache: Optional[ReportCache] = None,
+        cost_model: Optional[CostModel] = None,
+        tick_length: Duration = Duration.one_micro(),
+        check_tick_accuracy: bool = False,
+        batched: bool = False,
+        replications: int = 1,
+        replication_width: Optional[float] = None,
+        trace: bool = False,
+        profiling: Profiling = Profiling.OFF,
+        workers: Optional[int] = None
 ):
     _SimulationRunner(
         sagas=sagas,
         processors=processors,
         number_of_sagas_sets=number_of_sagas_sets,
         thread_orchestrators_modes=thread_orchestrators_modes,
-        coroutine_orchestrator=coroutine_orchestrator
+        coroutine_orchestrator=coroutine_orchestrator,
+        engine=engine,
+        logging_level=logging_level,
+        cache=cache,
+        cost_model=cost_model,
+        tick_length=tick_length,
+        check_tick_accuracy=check_tick_accuracy,
+        batched=batched,
+        replications=replications,
+        replication_width=replication_width,
+        trace=trace,
+        profiling=profiling,
+        workers=workers
     ).run_simulations()
@@ -1,10 +1,12 @@
-from typing import List, Optional
+from collections import deque
+from typing import List, Optional, Deque
 
-from src.log import LogContext, ProcessorNumber
+from src.log import ProcessorNumber, Logger, ContextLogger
 from src.sys.thread import KernelThread
 from src.sys.time.constants import thread_context_switch_overhead
 from src.sys.time.duration import Duration
-from src.sys.time.time import TimeAffected, TimeDelta
+from src.sys.time.time import TimeAffected, TimeDelta, earliest
+from src.sys.time.timer import WaitTimer
 
 
 class Processor(TimeAffected):
@@ -13,45 +15,59 @@ class Processor(TimeAffected):
             processing_interval: Duration,
             yielding: bool,
             proc_number: int = -1,
-            context_switch_cost: Duration = thread_context_switch_overhead()
+            context_switch_cost: Duration = thread_context_switch_overhead(),
+            logger: Optional[Logger] = None
     ):
         self.processing_interval = processing_interval
         self.number = proc_number
         self._context_switch_cost = context_switch_cost
-        self._thread_pool: List[KernelThread] = []
+        self._thread_pool: Deque[KernelThread] = deque()
         self._processing_slot: Optional[KernelThread] = None
         self._current_thread_processing_duration: Duration = Duration.zero()
         self._context_switch_duration: Duration = Duration.zero()
         self._yield_allowed: bool = yielding
         self._yielding: bool = False
+        self._logger: Logger = logger if logger is not None else ContextLogger()
+        # advances only while ticked, which is whenever the processor has threads to measure
+        self._now: int = 0
 
     def assign(self, thread: KernelThread):
-        self._thread_pool.append(thread)
+        thread.created_at = self._now
+        self._enqueue(thread)
         self._assign_first_from_pool_if_starving()
 
+    def register_waits(self, timer: WaitTimer):
+        if self._processing_slot is not None:
+            self._processing_slot.register_waits(timer)
+        for thread in self._thread_pool:
+            thread.register_waits(timer)
+
     def ticked(self, time_delta: TimeDelta):
-        LogContext.logger().log_processor_tick(proc_number=ProcessorNumber(self.number))
+        self._logger.log_processor_tick(proc_number=ProcessorNumber(self.number))
         self._assign_first_from_pool_if_starving()
+        self._now += time_delta.duration.micros
 
         if self._processing_slot is None:
             return
 
-        should_yield = self._yield_allowed and (self._yielding or self._processing_slot.can_yield())
-        should_finish_timeslice = self._current_thread_processing_duration >= self.processing_interval
         pool_has_more_threads = len(self._thread_pool) != 0
 
-        if pool_has_more_threads and (should_yield or should_finish_timeslice):
+        if pool_has_more_threads and self._should_switch_context(self._processing_slot):
             self._yielding = True
-            LogContext.logger().log_overhead_tick()
+            self._logger.log_overhead_tick()
             self._context_switch_duration += time_delta.duration
 
             if self._context_switch_duration <= self._context_switch_cost:
                 return
 
+            self._logger.log_context_switch(
+                proc_number=ProcessorNumber(self.number),
+                voluntary=self._current_thread_processing_duration < self.processing_interval
+            )
             self._yielding = False
             self._reset_counters()
             unassigned = self._unassign_current()
-            self._thread_pool.append(unassigned)
+            self._enqueue(unassigned)
             return
 
         if not self._processing_slot.is_doing_system_operation():
@@ -59,6 +75,29 @@ class Processor(TimeAffected):
         self._processing_slot.ticked(time_delta)
         self._handle_if_finished()
 
+    def next_event_in(self) -> Optional[Duration]:
+        thread = self._processing_slot
+        if thread is None:
+            if not self._thread_pool:
+                return None
+            thread = self._thread_pool[0]
+
+        threads_left_in_pool = len(self._thread_pool)
+        if self._processing_slot is None:
+            threads_left_in_pool -= 1
+
+        if threads_left_in_pool == 0:
+            return thread.next_event_in()
+
+        if self._should_switch_context(thread):
+            return self._context_switch_cost - self._context_switch_duration + Duration.one_micro()
+
+        timeslice_left = self.processing_interval - self._current_thread_processing_duration
+        return earliest([thread.next_event_in(), timeslice_left])
+
+    def is_blocked(self) -> bool:
+        return self._processing_slot is None or self._processing_slot.is_blocked()
+
     def is_starving(self) -> bool:
         return self._processing_slot is None and not self._thread_pool
 
@@ -71,12 +110,27 @@ class Processor(TimeAffected):
     def _as_string(self):
         return f"processor({self.number})"
 
+    def _should_switch_context(self, thread: KernelThread) -> bool:
+        should_yield = self._yield_allowed and (self._yielding or thread.can_yield())
+        should_finish_timeslice = self._current_thread_processing_duration >= self.processing_interval
+        return should_yield or should_finish_timeslice
+
     def _assign_first_from_pool_if_starving(self):
         if self._processing_slot is not None:
             return
         if not self._thread_pool:
             return
-        self._processing_slot = self._thread_pool.pop(0)
+        thread = self._thread_pool.popleft()
+        self._processing_slot = thread
+        self._logger.log_thread_dispatched(
+            proc_number=ProcessorNumber(self.number),
+            delay=Duration(micros=self._now - thread.queued_at)
+        )
+
+    def _enqueue(self, thread: KernelThread):
+        thread.queued_at = self._now
+        self._thread_pool.append(thread)
+        self._logger.log_thread_queued(proc_number=ProcessorNumber(self.number), queue_length=len(self._thread_pool))
 
     def _reset_counters(self):
         self._context_switch_duration = Duration.zero()
@@ -87,7 +141,11 @@ class Processor(TimeAffected):
             return
         if not self._processing_slot.is_finished():
             return
-        self._unassign_current()
+        finished = self._unassign_current()
+        self._logger.log_thread_finished(
+            proc_number=ProcessorNumber(self.number),
+            lifetime=Duration(micros=self._now - finished.created_at)
+        )
         self._assign_first_from_pool_if_starving()
 
     def _unassign_current(self) -> Optional[KernelThread]:
@@ -107,7 +165,8 @@ class ProcessorFactory:
             self,
             count: int,
             processing_interval: Duration,
-            yielding: bool
+            yielding: bool,
+            logger: Optional[Logger] = None
     ) -> List[Processor]:
         processors = []
         for i in range(count):
@@ -116,7 +175,8 @@ class ProcessorFactory:
                 Processor(
                     proc_number=self.last_processor_number,
                     processing_interval=processing_interval,
-                    yielding=yielding
+                    yielding=yielding,
+                    logger=logger
                 )
             )
         return processors
@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 from enum import Enum
-from typing import List
+from typing import List, Optional, Tuple
 
-from src.sys.processor import ProcessorFactory
+from src.log import Logger, ContextLogger, ProcessorNumber
+from src.sys.processor import ProcessorFactory, Processor
 from src.sys.thread import Executable, KernelThread, ChainOfExecutables
 from src.sys.time.constants import thread_timeslice
-from src.sys.time.time import TimeDelta
+from src.sys.time.duration import Duration
+from src.sys.time.time import TimeDelta, earliest
+from src.sys.time.timer import WaitTimer
 
 
 class ProcessingMode(Enum):
@@ -18,15 +23,27 @@ class System:
             self,
             processors_count: int,
             processing_mode: ProcessingMode,
-            proc_factory: ProcessorFactory = ProcessorFactory()
+            proc_factory: ProcessorFactory = ProcessorFactory(),
+            logger: Optional[Logger] = None,
+            processing_interval: Optional[Duration] = None
     ):
         self.processing_mode = processing_mode
+        self._logger: Optional[Logger] = logger
         self._processors = proc_factory.new(
             count=processors_count,
-            processing_interval=thread_timeslice(),
-            yielding=processing_mode == ProcessingMode.YIELDING_PROCESSORS
+            processing_interval=processing_interval if processing_interval is not None else thread_timeslice(),
+            yielding=processing_mode == ProcessingMode.YIELDING_PROCESSORS,
+            logger=logger
         )
         self._published: List[Executable] = []
+        self._streams: List[ChainOfExecutables] = []
+        self._submitted: int = 0
+        self._timer: Optional[WaitTimer] = None
+        self._idle_logger: Logger = logger if logger is not None else ContextLogger()
+        self._idle_processors: List[Processor] = []
+        self._active_processors: List[Processor] = list(self._processors)
+        self._starving_active_processors: List[Processor] = [
+            processor for processor in self._active_processors if processor.is_starving()]
 
     def publish(self, executables: List[Executable]):
         self._published = executables
@@ -41,22 +58,113 @@ class System:
 
             for processor_num in range(processors_number):
                 executable: Executable = ChainOfExecutables(*all_executalbe_pools.pop(0))
-                self._processors[processor_num].assign(KernelThread(executable))
+                self._processors[processor_num].assign(KernelThread(executable, logger=self._logger))
 
+            self._refresh_active_processors()
             return
 
         for i in range(len(executables)):
             executable = executables[i]
             processor = self._processors[i % processors_number]
-            thread = KernelThread(executable)
+            thread = KernelThread(executable, logger=self._logger)
             processor.assign(thread)
+        self._refresh_active_processors()
 
-    def tick(self, time_delta: TimeDelta):
+    # executables submitted later are spread round-robin as publish does, a fixed pool gets one open chain per processor
+    def open(self):
+        self._submitted = 0
+        if self.processing_mode is not ProcessingMode.FIXED_POOL_SIZE:
+            return
+
+        self._streams = [ChainOfExecutables(closed=False) for _ in self._processors]
+        for processor, stream in zip(self._processors, self._streams):
+            processor.assign(KernelThread(stream, logger=self._logger))
+        self._refresh_active_processors()
+
+    def submit(self, executable: Executable):
+        processor_num = self._submitted % len(self._processors)
+        self._submitted += 1
+
+        if self._streams:
+            self._streams[processor_num].append(executable)
+            return
+
+        thread = KernelThread(executable, logger=self._logger)
+        if self._timer is not None:
+            thread.register_waits(self._timer)
+        processor = self._processors[processor_num]
+        was_starving = processor.is_starving()
+        processor.assign(thread)
+        if was_starving:
+            self._refresh_active_processors()
+
+    def close(self):
+        for stream in self._streams:
+            stream.close()
+
+    # processors never exchange threads, so each of them together with what it would be published can be run apart
+    def partitions(self, executables: List[Executable]) -> List[Tuple[System, List[Executable]]]:
+        processors_number = len(self._processors)
+        return [
+            (self._single_processor_system(processor), executables[processor_num::processors_number])
+            for processor_num, processor
+            in enumerate(self._processors)
+        ]
+
+    def processor_numbers(self) -> List[int]:
+        return [processor.number for processor in self._processors]
+
+    def register_waits(self, timer: WaitTimer):
+        self._timer = timer
         for processor in self._processors:
+            processor.register_waits(timer)
+
+    def tick(self, time_delta: TimeDelta):
+        if self._starving_active_processors:
+            self._deactivate_starving_processors()
+
+        for processor in self._active_processors:
             processor.ticked(time_delta=time_delta)
+            if processor.is_starving():
+                self._starving_active_processors.append(processor)
+
+    def next_event_in(self) -> Optional[Duration]:
+        return earliest([processor.next_event_in() for processor in self._active_processors])
+
+    def is_blocked(self) -> bool:
+        return all(processor.is_blocked() for processor in self._active_processors)
 
     def work_is_done(self) -> bool:
-        return all([processor.is_starving() for processor in self._processors])
+        return len(self._starving_active_processors) == len(self._active_processors)
+
+    # starving processors stop being ticked from the next tick on, the logger credits their waiting in bulk
+    def _deactivate_starving_processors(self):
+        for processor in self._starving_active_processors:
+            self._idle_logger.log_processor_idle(proc_number=ProcessorNumber(processor.number))
+        self._idle_processors.extend(self._starving_active_processors)
+        self._active_processors = [processor for processor in self._active_processors if not processor.is_starving()]
+        self._starving_active_processors = []
+
+    def _refresh_active_processors(self):
+        for processor in self._idle_processors:
+            if not processor.is_starving():
+                self._idle_logger.log_processor_active(proc_number=ProcessorNumber(processor.number))
+        self._idle_processors = [processor for processor in self._idle_processors if processor.is_starving()]
+        self._active_processors = [
+            processor for processor in self._processors if processor not in self._idle_processors]
+        self._starving_active_processors = [
+            processor for processor in self._active_processors if processor.is_starving()]
+
+    def _single_processor_system(self, processor: Processor) -> System:
+        proc_factory = ProcessorFactory()
+        proc_factory.last_processor_number = processor.number - 1
+        return System(
+            processors_count=1,
+            processing_mode=self.processing_mode,
+            proc_factory=proc_factory,
+            logger=self._logger,
+            processing_interval=processor.processing_interval
+        )
 
 
 class SystemFactory:
@@ -64,6 +172,7 @@ class SystemFactory:
     def create(
             self,
             processors_count: int,
-            processing_mode: ProcessingMode
+            processing_mode: ProcessingMode,
+            logger: Optional[Logger] = None
     ) -> System:
-        return System(processors_count, processing_mode)
+        return System(processors_count, processing_mode, logger=logger)
@@ -1,23 +1,57 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import List, Optional
+from collections import deque
+from typing import List, Optional, Tuple, Deque
 
-from src.log import LogContext
+from src.log import Logger, ContextLogger
 from src.saga.task import Task
 from src.sys.time.constants import thread_creation_cost, thread_deallocation_cost
+from src.sys.time.duration import Duration
 from src.sys.time.time import TimeAffected, Limited
 from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
 
 
 class Executable(TimeAffected, Limited):
     @abstractmethod
     def get_current_tasks(self) -> List[Task]: pass
 
+    @abstractmethod
+    def register_waits(self, timer: WaitTimer): pass
+
+    def current_task(self) -> Optional[Task]:
+        return next(iter(self.get_current_tasks()), None)
+
+    def has_runnable_task(self) -> bool:
+        return not all(task.is_waiting() for task in self.get_current_tasks())
+
+    # the instant it entered the system, published executables enter at the start
+    def arrive(self, instant: Duration): pass
 
+
+# an open chain is not finished while it runs out of executables, more can be appended till it is closed
 class ChainOfExecutables(Executable):
-    def __init__(self, *executables: Executable):
-        self._executables = list(executables)
+    def __init__(self, *executables: Executable, closed: bool = True):
+        self._executables: Deque[Executable] = deque(executables)
+        self._closed: bool = closed
+        self._timer: Optional[WaitTimer] = None
+
+    def append(self, executable: Executable):
+        if self._closed:
+            raise ValueError(f"Executable {executable} appended to a closed chain")
+        self._executables.append(executable)
+        if len(self._executables) == 1 and self._timer is not None:
+            executable.register_waits(self._timer)
+
+    def close(self):
+        self._closed = True
+
+    def register_waits(self, timer: WaitTimer):
+        self._timer = timer
+        current = self._current_executable()
+        if current is not None:
+            current.register_waits(timer)
 
     def get_current_tasks(self) -> List[Task]:
         current = self._current_executable()
@@ -25,32 +59,65 @@ class ChainOfExecutables(Executable):
             return []
         return current.get_current_tasks()
 
+    def current_task(self) -> Optional[Task]:
+        current = self._current_executable()
+        if current is None:
+            return None
+        return current.current_task()
+
+    def has_runnable_task(self) -> bool:
+        current = self._current_executable()
+        if current is None:
+            return False
+        return current.has_runnable_task()
+
     def ticked(self, time_delta: TimeDelta):
         current = self._current_executable()
         if current is None:
             return
         current.ticked(time_delta)
 
-        if current.is_finished():
-            self._executables.pop(0)
+        if not current.is_finished():
+            return
+        self._executables.popleft()
+
+        following = self._current_executable()
+        if following is not None and self._timer is not None:
+            following.register_waits(self._timer)
+
+    def next_event_in(self) -> Optional[Duration]:
+        current = self._current_executable()
+        if current is None:
+            return None
+        return current.next_event_in()
 
     def is_finished(self) -> bool:
-        return self._current_executable() is None
+        return self._closed and not self._executables
 
     def _current_executable(self) -> Optional[Executable]:
-        return next(iter(self._executables), None)
+        return self._executables[0] if self._executables else None
+
+    def _remaining_executables(self) -> Tuple[Executable, ...]:
+        return tuple(self._executables)
 
     def __eq__(self, other: ChainOfExecutables) -> bool:
         if not isinstance(other, type(self)):
             return False
-        return self._executables == other._executables
+        return self._remaining_executables() == other._remaining_executables()
 
 
 class KernelThread(TimeAffected, Limited):
-    def __init__(self, executable: Executable):
+    def __init__(self, executable: Executable, logger: Optional[Logger] = None):
         self._executable = executable
+        self._logger: Logger = logger if logger is not None else ContextLogger()
         self._init_cool_down = thread_creation_cost()
         self._destruct_cool_down = thread_deallocation_cost()
+        # instants on the clock of the processor running the thread
+        self.created_at: int = 0
+        self.queued_at: int = 0
+
+    def register_waits(self, timer: WaitTimer):
+        self._executable.register_waits(timer)
 
     def is_doing_system_operation(self) -> bool:
         if self._init_cool_down.is_positive:
@@ -63,14 +130,19 @@ class KernelThread(TimeAffected, Limited):
         if self.is_finished() or self.is_doing_system_operation():
             return False
 
-        current_task: Optional[Task] = next(iter(self._executable.get_current_tasks()), None)
+        current_task: Optional[Task] = self._executable.current_task()
         if not current_task:
             return False
         return current_task.is_waiting()
 
+    def is_blocked(self) -> bool:
+        if self.is_doing_system_operation() or self._executable.is_finished():
+            return False
+        return not self._executable.has_runnable_task()
+
     def ticked(self, time_delta: TimeDelta):
         if self._init_cool_down.is_positive:
-            LogContext.logger().log_overhead_tick()
+            self._logger.log_overhead_tick()
             self._init_cool_down -= time_delta.duration
             return
 
@@ -79,10 +151,22 @@ class KernelThread(TimeAffected, Limited):
             return
 
         if self._destruct_cool_down.is_positive:
-            LogContext.logger().log_overhead_tick()
+            self._logger.log_overhead_tick()
             self._destruct_cool_down -= time_delta.duration
             return
 
+    def next_event_in(self) -> Optional[Duration]:
+        if self._init_cool_down.is_positive:
+            return self._init_cool_down
+
+        if not self._executable.is_finished():
+            return self._executable.next_event_in()
+
+        if self._destruct_cool_down.is_positive:
+            return self._destruct_cool_down
+
+        return None
+
     def is_finished(self) -> bool:
         return not self._destruct_cool_down.is_positive
 
@@ -1,26 +1,40 @@
 from __future__ import annotations
 
 from functools import reduce
-from random import randint
-from typing import Union
+from random import randint, Random
+from typing import Union, Optional
 
 
 class Duration:
+    __slots__ = ("micros",)
+
     def __init__(self, micros: int = 0, millis: int = 0, seconds: int = 0):
-        self.micros: int = micros + (millis * 10 ** 3) + (seconds * 10 ** 6)
+        _set_micros(self, micros + (millis * 10 ** 3) + (seconds * 10 ** 6))
+
+    @staticmethod
+    def zero() -> Duration:
+        return _ZERO
 
     @staticmethod
-    def zero():
-        return Duration()
+    def one_micro() -> Duration:
+        return _ONE_MICRO
 
     @staticmethod
-    def rand_between(start: Duration, end: Duration) -> Duration:
+    def of(micros: int) -> Duration:
+        # unchecked constructor for the simulation hot path
+        duration = _new_object(Duration)
+        _set_micros(duration, micros)
+        return duration
+
+    @staticmethod
+    def rand_between(start: Duration, end: Duration, rand: Optional[Random] = None) -> Duration:
         if start.is_negative:
             raise ValueError(f"Start should be >= 0, but was {start}")
         if start >= end:
             raise ValueError(f"Start should be < end, but start was {start} and end was {end}")
 
-        return Duration(micros=randint(start.micros, end.micros))
+        micros = randint(start.micros, end.micros) if rand is None else rand.randint(start.micros, end.micros)
+        return Duration(micros=micros)
 
     @staticmethod
     def avg(*durations: Duration) -> Duration:
@@ -35,42 +49,46 @@ class Duration:
         return reduce(lambda a, b: a + b, durations)
 
     def __add__(self, other: Duration) -> Duration:
-        self._check_is_duration(other)
-        return Duration(self.micros + other.micros)
-
-    def __iadd__(self, other: Duration) -> Duration:
-        self._check_is_duration(other)
-        self.micros += other.micros
-        return self
+        if type(other) is not Duration:
+            self._check_is_duration(other)
+        duration = _new_object(Duration)
+        _set_micros(duration, self.micros + other.micros)
+        return duration
 
     def __sub__(self, other: Duration) -> Duration:
-        self._check_is_duration(other)
-        return Duration(self.micros - other.micros)
+        if type(other) is not Duration:
+            self._check_is_duration(other)
+        duration = _new_object(Duration)
+        _set_micros(duration, self.micros - other.micros)
+        return duration
 
     def __radd__(self, other: Duration) -> Duration:
         self._check_is_duration(other)
-        self.micros -= other.micros
-        return self
+        return Duration.of(other.micros + self.micros)
 
     def __gt__(self, other: Duration) -> bool:
-        self._check_is_duration(other)
+        if type(other) is not Duration:
+            self._check_is_duration(other)
         return self.micros > other.micros
 
     def __ge__(self, other: Duration) -> bool:
-        self._check_is_duration(other)
+        if type(other) is not Duration:
+            self._check_is_duration(other)
         return self.micros >= other.micros
 
     def __lt__(self, other: Duration) -> bool:
-        self._check_is_duration(other)
+        if type(other) is not Duration:
+            self._check_is_duration(other)
         return self.micros < other.micros
 
     def __le__(self, other: Duration) -> bool:
-        self._check_is_duration(other)
+        if type(other) is not Duration:
+            self._check_is_duration(other)
         return self.micros <= other.micros
 
     def __mod__(self, other: Duration) -> Duration:
         self._check_is_duration(other)
-        return Duration(micros=self.micros % other.micros)
+        return Duration.of(self.micros % other.micros)
 
     def __truediv__(self, other: Union[Duration, int, float]) -> Duration:
         divisor: Union[int, float]
@@ -81,7 +99,7 @@ class Duration:
             divisor = other
         else:
             raise ValueError(f"Divisor should be either number or {type(Duration)} but it was {other}")
-        return Duration(micros=int(self.micros / divisor))
+        return Duration.of(int(self.micros / divisor))
 
     @property
     def is_positive(self) -> bool:
@@ -114,6 +132,17 @@ class Duration:
             return False
         return self.micros == other.micros
 
+    def __hash__(self):
+        return hash(self.micros)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
     @property
     def as_string(self):
         return f"{self.micros}"
@@ -127,3 +156,10 @@ class Duration:
         argument_type = type(argument)
         if argument_type is not Duration:
             raise TypeError(f"Expected to receive {type(Duration)} but was {argument_type}")
+
+
+_new_object = object.__new__
+_set_micros = Duration.micros.__set__
+
+_ZERO = Duration()
+_ONE_MICRO = Duration(micros=1)
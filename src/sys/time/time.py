@@ -1,27 +1,45 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from uuid import UUID, uuid4
+from itertools import count
+from typing import Optional, Iterable, Iterator
 
 from src.sys.time.duration import Duration
 
 
+_tick_sequence: Iterator[int] = count()
+
+
 @dataclass
 class TimeDelta:
     duration: Duration
-    identifier: UUID = None
+    identifier: int = None
 
     def __post_init__(self):
         if self.identifier is None:
-            self.identifier = uuid4()
+            self.advance()
+
+    def advance(self):
+        self.identifier = next(_tick_sequence)
 
 
 class TimeAffected(ABC):
     @abstractmethod
     def ticked(self, time_delta: TimeDelta): pass
 
+    # the longest time delta that can be ticked at once without skipping over a state change;
+    # None when ticking alone cannot change the state
+    @abstractmethod
+    def next_event_in(self) -> Optional[Duration]: pass
+
 
 class Limited(ABC):
     @abstractmethod
     def is_finished(self) -> bool: pass
 
 
+def earliest(durations: Iterable[Optional[Duration]]) -> Optional[Duration]:
+    result: Optional[Duration] = None
+    for duration in durations:
+        if duration is not None and (result is None or duration < result):
+            result = duration
+    return result
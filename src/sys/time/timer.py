@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from heapq import heappush, heappop
+from itertools import count
+from typing import List, Tuple, Optional, Iterator, Callable
+
+from src.sys.time.duration import Duration
+
+
+class Waiting(ABC):
+    @abstractmethod
+    def wake_up(self): pass
+
+
+class WaitTimer:
+    def __init__(self):
+        self._now: int = 0
+        self._scheduled: List[Tuple[int, int, Waiting]] = []
+        self._sequence: Iterator[int] = count()
+
+    @property
+    def now(self) -> Duration:
+        return Duration(micros=self._now)
+
+    def schedule(self, waiting: Waiting, wait: Duration):
+        heappush(self._scheduled, (self._now + wait.micros, next(self._sequence), waiting))
+
+    def shift(self, duration: Duration):
+        self._now += duration.micros
+
+    def next_wake_up_in(self) -> Optional[Duration]:
+        if not self._scheduled:
+            return None
+        return Duration(micros=self._scheduled[0][0] - self._now)
+
+    def wake_up_due(self):
+        while self._scheduled and self._scheduled[0][0] <= self._now:
+            _, _, waiting = heappop(self._scheduled)
+            waiting.wake_up()
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+
+class NotifyingTimer(WaitTimer):
+    # view on a shared timer that reports every wake up scheduled through it
+    # noinspection PyMissingConstructor
+    def __init__(self, timer: WaitTimer, on_wake: Callable[[], None]):
+        self._timer = timer
+        self._on_wake = on_wake
+
+    @property
+    def now(self) -> Duration:
+        return self._timer.now
+
+    def schedule(self, waiting: Waiting, wait: Duration):
+        self._timer.schedule(_NotifyingWaiting(waiting, self._on_wake), wait)
+
+    def shift(self, duration: Duration):
+        self._timer.shift(duration)
+
+    def next_wake_up_in(self) -> Optional[Duration]:
+        return self._timer.next_wake_up_in()
+
+    def wake_up_due(self):
+        self._timer.wake_up_due()
+
+    def __len__(self) -> int:
+        return len(self._timer)
+
+
+class _NotifyingWaiting(Waiting):
+    def __init__(self, waiting: Waiting, on_wake: Callable[[], None]):
+        self._waiting = waiting
+        self._on_wake = on_wake
+
+    def wake_up(self):
+        self._waiting.wake_up()
+        self._on_wake()
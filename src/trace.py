@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from json import dumps
+from typing import List, Optional, Set, TextIO
+
+
+class TraceWriter(ABC):
+    # a span is one processor doing the same thing without a break, instants are in simulated micros
+    @abstractmethod
+    def write_span(self, processor: int, action: str, start: int, duration: int, saga: Optional[str]): pass
+
+    @abstractmethod
+    def close(self): pass
+
+
+# the Chrome trace event format, which chrome://tracing and Perfetto open; every processor is a thread of one process
+class ChromeTraceWriter(TraceWriter):
+    def __init__(self, path: str, buffer_size: int = 4096):
+        if buffer_size <= 0:
+            raise ValueError(f"Buffer size should be positive, got {buffer_size}")
+        self.path: str = path
+        self._buffer_size: int = buffer_size
+        self._buffer: List[str] = []
+        self._processors: Set[int] = set()
+        self._file: Optional[TextIO] = open(path, mode="w")
+        self._file.write('{"displayTimeUnit": "ns", "traceEvents": [\n')
+        self._separator: str = ""
+
+    def write_span(self, processor: int, action: str, start: int, duration: int, saga: Optional[str]):
+        if processor not in self._processors:
+            self._processors.add(processor)
+            self._append(
+                f'{{"name": "thread_name", "ph": "M", "pid": 0, "tid": {processor}, '
+                f'"args": {{"name": "processor {processor}"}}}}'
+            )
+        name = dumps(saga) if saga is not None else f'"{action}"'
+        self._append(
+            f'{{"name": {name}, "cat": "{action}", "ph": "X", "pid": 0, "tid": {processor}, '
+            f'"ts": {start}, "dur": {duration}}}'
+        )
+
+    def close(self):
+        if self._file is None:
+            return
+        self._flush()
+        self._file.write("\n]}\n")
+        self._file.close()
+        self._file = None
+
+    def _append(self, event: str):
+        self._buffer.append(self._separator + event)
+        self._separator = ",\n"
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def _flush(self):
+        self._file.write("".join(self._buffer))
+        self._buffer.clear()
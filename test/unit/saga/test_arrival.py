@@ -0,0 +1,61 @@
+from itertools import islice
+from typing import List
+from unittest import TestCase
+
+from src.saga.arrival import PoissonArrivals, ConstantArrivals, BurstyArrivals, ReplayedArrivals, ArrivalProcess
+from src.sys.time.duration import Duration
+
+
+class TestPoissonArrivals(TestCase):
+    def test_instants_should_arrive_at_the_given_rate_and_repeat_for_the_same_seed(self):
+        # given
+        arrivals = PoissonArrivals(rate=1000, seed=3)
+
+        # when
+        instants = first(arrivals, 10_000)
+
+        # then
+        self.assertEqual(instants, first(PoissonArrivals(rate=1000, seed=3), 10_000))
+        self.assertEqual(instants, sorted(instants))
+        self.assertAlmostEqual(10.0, instants[-1].micros / 10 ** 6, delta=0.3)
+
+    def test_should_reject_not_positive_rate(self):
+        # when / then
+        with self.assertRaises(ValueError):
+            PoissonArrivals(rate=0)
+
+
+class TestConstantArrivals(TestCase):
+    def test_instants_should_be_evenly_spaced(self):
+        # then
+        self.assertEqual(
+            [Duration(micros=250), Duration(micros=500), Duration(micros=750)],
+            first(ConstantArrivals(rate=4000), 3)
+        )
+
+
+class TestBurstyArrivals(TestCase):
+    def test_instants_should_come_in_bursts_keeping_the_rate(self):
+        # then
+        self.assertEqual(
+            [Duration(micros=500)] * 2 + [Duration(micros=1000)] * 2,
+            first(BurstyArrivals(rate=4000, burst_size=2), 4)
+        )
+
+    def test_should_reject_not_positive_burst_size(self):
+        # when / then
+        with self.assertRaises(ValueError):
+            BurstyArrivals(rate=10, burst_size=0)
+
+
+class TestReplayedArrivals(TestCase):
+    def test_instants_should_replay_timestamps_in_order(self):
+        # given
+        arrivals = ReplayedArrivals(timestamps=(Duration(micros=5), Duration(micros=1), Duration(micros=3)))
+
+        # then
+        self.assertEqual([Duration(micros=1), Duration(micros=3), Duration(micros=5)], list(arrivals.instants()))
+
+
+def first(arrivals: ArrivalProcess, number: int) -> List[Duration]:
+    return list(islice(arrivals.instants(), number))
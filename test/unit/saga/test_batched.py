@@ -0,0 +1,76 @@
+from dataclasses import astuple
+from typing import List, Tuple
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from src.log import LogContext, Report, ProcessorLog
+from src.saga.batched import BatchedThreadedOrchestrator
+from src.saga.orchestration import Engine
+from src.saga.simple_saga import SimpleSaga
+from src.saga.store import OperationStore
+from src.saga.task import Task, SystemOperation
+from src.sys.system import ProcessingMode
+from src.sys.time.duration import Duration
+from test.unit.saga.test_orchestration import given_orchestrator, process_and_report, create_sagas
+
+
+class TestBatchedThreadedOrchestrator(TestCase):
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE],
+        [ProcessingMode.OVERLOADED_PROCESSORS],
+        [ProcessingMode.YIELDING_PROCESSORS]
+    ])
+    def test_process_should_report_the_same_as_running_every_configuration_apart(self, mode: ProcessingMode):
+        processors_numbers = [1, 2, 3, 5]
+        for seed in range(10):
+            # given
+            orchestrator = BatchedThreadedOrchestrator(
+                processors_numbers=processors_numbers,
+                processing_mode=mode,
+                processing_interval=Duration(micros=25)
+            )
+
+            # when
+            logs = orchestrator.process(OperationStore.from_sagas(create_sagas(seed)))
+
+            # then
+            self.assertEqual(len(processors_numbers), len(logs))
+            for processors, processors_logs in zip(processors_numbers, logs):
+                apart = given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=processors)
+                expected_duration, expected_report = process_and_report(apart, create_sagas(seed))
+                duration, report = merge_and_report(processors_logs)
+
+                self.assertEqual(expected_duration, duration, msg=f"seed {seed}, {processors} processors")
+                for expected, actual in zip(astuple(expected_report)[1:], astuple(report)[1:]):
+                    if type(expected) is float:
+                        self.assertAlmostEqual(expected, actual, msg=f"seed {seed}, {processors} processors")
+                    else:
+                        self.assertEqual(expected, actual, msg=f"seed {seed}, {processors} processors")
+
+    def test_process_should_reject_tasks_finished_by_a_wait(self):
+        # given
+        task = Task(operations=[
+            SystemOperation(to_process=True, name="", duration=Duration(micros=2)),
+            SystemOperation(to_process=False, name="", duration=Duration(micros=5))
+        ])
+        store = OperationStore.from_sagas([SimpleSaga(tasks=[task])])
+        orchestrator = BatchedThreadedOrchestrator(
+            processors_numbers=[1],
+            processing_mode=ProcessingMode.OVERLOADED_PROCESSORS
+        )
+
+        # when / then
+        with self.assertRaises(ValueError):
+            orchestrator.process(store)
+
+
+def merge_and_report(logs: List[ProcessorLog]) -> Tuple[Duration, Report]:
+    reports: List[Report] = []
+
+    def merge() -> Duration:
+        LogContext.logger().merge(logs)
+        return max([log.duration for log in logs])
+
+    duration = LogContext.run_logging(log_name="test", action=merge, report_publisher=reports.append)
+    return duration, reports[0]
@@ -3,10 +3,12 @@ from unittest import TestCase
 from unittest.mock import Mock, call, ANY
 
 from src.saga.coroutine_saga import CoroutineSaga
+from src.saga.simple_saga import SimpleSaga
 from src.sys.thread import Executable
-from src.saga.task import Task
+from src.saga.task import Task, SystemOperation
 from src.sys.time.time import TimeDelta
 from src.sys.time.duration import Duration
+from src.sys.time.timer import WaitTimer
 
 
 class TestCoroutineSaga(TestCase):
@@ -135,6 +137,88 @@ class TestCoroutineSaga(TestCase):
         coroutine.ticked(time_delta=TimeDelta(Duration(micros=1)))
         self.assertTrue(coroutine.is_finished())
 
+    def test_ticked_should_run_executables_woken_up_by_timer_in_round_robin_order(self):
+        # given
+        logger = Mock()
+        timer = WaitTimer()
+        coroutine = CoroutineSaga(executables=[
+            saga(name="1", wait=Duration(micros=3), logger=logger),
+            saga(name="2", wait=Duration(micros=1), logger=logger),
+            saga(name="3", wait=Duration(micros=1), logger=logger)
+        ])
+        coroutine.register_waits(timer)
+
+        # when
+        for _ in range(7):
+            timer.shift(Duration(micros=1))
+            coroutine.ticked(time_delta=TimeDelta(Duration(micros=1)))
+            timer.wake_up_due()
+
+        # then
+        self.assertEqual(
+            ["1", "2", "3", "2", "3", "1"],
+            [task_call.kwargs["name"] for task_call in logger.log_task_processing.call_args_list]
+        )
+        self.assertTrue(coroutine.is_finished())
+
+    def test_has_runnable_task_should_follow_executables_waiting_and_waking_up(self):
+        # given
+        logger = Mock()
+        timer = WaitTimer()
+        first = saga(name="1", wait=Duration(micros=3), logger=logger)
+        second = saga(name="2", wait=Duration(micros=1), logger=logger)
+        coroutine = CoroutineSaga(executables=[first, second])
+        coroutine.register_waits(timer)
+
+        # then
+        self.assertTrue(coroutine.has_runnable_task())
+        self.assertEqual(first.current_task(), coroutine.current_task())
+
+        for _ in range(2):
+            timer.shift(Duration(micros=1))
+            coroutine.ticked(time_delta=TimeDelta(Duration(micros=1)))
+        self.assertFalse(coroutine.has_runnable_task())
+        self.assertEqual(second.current_task(), coroutine.current_task())
+
+        timer.shift(Duration(micros=1))
+        timer.wake_up_due()
+        self.assertTrue(coroutine.has_runnable_task())
+
+    def test_add_should_run_executables_at_the_end_of_the_round_till_coroutine_is_closed(self):
+        # given
+        logger = Mock()
+        timer = WaitTimer()
+        coroutine = CoroutineSaga(executables=[], closed=False)
+        coroutine.register_waits(timer)
+
+        # then
+        self.assertFalse(coroutine.is_finished())
+        self.assertFalse(coroutine.has_runnable_task())
+
+        # when
+        coroutine.add(saga(name="1", wait=Duration(micros=2), logger=logger))
+        for _ in range(2):
+            timer.shift(Duration(micros=1))
+            coroutine.ticked(time_delta=TimeDelta(Duration(micros=1)))
+            timer.wake_up_due()
+        coroutine.add(saga(name="2", wait=Duration(micros=1), logger=logger))
+        for _ in range(4):
+            timer.shift(Duration(micros=1))
+            coroutine.ticked(time_delta=TimeDelta(Duration(micros=1)))
+            timer.wake_up_due()
+
+        # then
+        self.assertEqual(
+            ["1", "2", "1", "2"],
+            [task_call.kwargs["name"] for task_call in logger.log_task_processing.call_args_list]
+        )
+        self.assertFalse(coroutine.is_finished())
+
+        coroutine.close()
+        self.assertTrue(coroutine.is_finished())
+        with self.assertRaises(ValueError):
+            coroutine.add(saga(name="3", wait=Duration(micros=1), logger=logger))
+
     def test_get_current_tasks_should_return_current_tasks_of_all_executables(self):
         # given
         executable1, executable2 = executables(2)
@@ -154,6 +238,18 @@ class TestCoroutineSaga(TestCase):
         self.assertEqual([executable1_task, executable2_task], actual)
 
 
+def saga(name: str, wait: Duration, logger: Mock) -> SimpleSaga:
+    return SimpleSaga(tasks=[Task(
+        operations=[
+            SystemOperation(to_process=True, name="request", duration=Duration(micros=1)),
+            SystemOperation(to_process=False, name="wait", duration=wait),
+            SystemOperation(to_process=True, name="response", duration=Duration(micros=1))
+        ],
+        name=name,
+        logger=logger
+    )], logger=logger)
+
+
 def executables(count: int) -> List[Executable]:
     return [executable(name=f"thread {i + 1}") for i in range(count)]
 
@@ -165,6 +261,8 @@ def executable(name: str = "thread") -> Executable:
     task: Task = Mock()
     task.is_waiting = lambda: False
     mock.get_current_tasks = lambda: [task]
+    mock.current_task = lambda: task
+    mock.has_runnable_task = lambda: True
     return mock
 
 
@@ -172,6 +270,8 @@ def given_current_task_in_exectutable_is_not_waiting(executable_to_stub: Executa
     is_waiting_answers = [False for _ in range(not_waiting_ticks)]
     current_task: Task = Mock()
     executable_to_stub.get_current_tasks = lambda: [current_task]
+    executable_to_stub.current_task = lambda: current_task
+    executable_to_stub.has_runnable_task = lambda: not current_task.is_waiting()
     executable_to_stub.ticked = Mock(side_effect=lambda time_delta: is_waiting_answers.pop() if is_waiting_answers else None)
     current_task.is_waiting = lambda: next(iter(is_waiting_answers), True)
 
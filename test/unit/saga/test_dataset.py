@@ -0,0 +1,209 @@
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import List, Any
+from unittest import TestCase
+
+from jsonpickle import encode
+
+from src.log import LogContext, LoggingLevel
+from src.saga.orchestration import ThreadedOrchestrator
+from src.saga.dataset import GeneratedDataset, FileDataset, InMemoryDataset, StoreDataset
+from src.saga.simple_saga import SimpleSaga
+from src.saga.store import OperationStore
+from src.saga.task import Task, SystemOperation
+from src.sys.system import ProcessingMode
+from src.sys.time.duration import Duration
+
+
+class TestGeneratedDataset(TestCase):
+    def test_load_should_generate_the_same_sagas_for_the_same_seed(self):
+        # given
+        dataset = GeneratedDataset(number=5, seed=3)
+
+        # when
+        first = dataset.load()
+        second = dataset.load()
+
+        # then
+        self.assertEqual(5, len(dataset))
+        self.assertEqual(describe(first), describe(second))
+        self.assertNotEqual(describe(first), describe(GeneratedDataset(number=5, seed=4).load()))
+
+    def test_equal_specs_should_be_equal(self):
+        # then
+        self.assertEqual(GeneratedDataset(number=5, seed=3), GeneratedDataset(number=5, seed=3))
+        self.assertEqual(1, len({GeneratedDataset(number=5, seed=3), GeneratedDataset(number=5, seed=3)}))
+
+    def test_replica_should_generate_other_sagas_deterministically(self):
+        # given
+        dataset = GeneratedDataset(number=5, seed=3)
+
+        # when
+        replica = dataset.replica(1)
+
+        # then
+        self.assertIs(dataset, dataset.replica(0))
+        self.assertEqual(replica, dataset.replica(1))
+        self.assertEqual(5, len(replica))
+        self.assertNotEqual(describe(dataset.load()), describe(replica.load()))
+        self.assertNotEqual(replica, dataset.replica(2))
+
+
+class TestFileDataset(TestCase):
+    def test_load_should_decode_exported_sagas(self):
+        # given
+        sagas = GeneratedDataset(number=3, seed=1).load()
+
+        with TemporaryDirectory() as directory:
+            path = join(directory, "sagas.json")
+            with open(path, mode="w") as file:
+                file.write(encode(sagas))
+            dataset = FileDataset(path=path)
+
+            # when
+            loaded = dataset.load()
+
+            # then
+            self.assertEqual(3, len(dataset))
+            self.assertEqual(describe(sagas), describe(loaded))
+
+
+    def test_load_should_decode_sagas_exported_when_tasks_were_consumed_from_lists(self):
+        # given
+        with TemporaryDirectory() as directory:
+            path = join(directory, "sagas.json")
+            with open(path, mode="w") as file:
+                file.write(_LIST_BASED_SAGAS_JSON)
+
+            # when
+            loaded = FileDataset(path=path).load()
+
+        # then
+        self.assertEqual(
+            [("saga", [("_❔task❔_", [(True, Duration(micros=3)), (False, Duration(micros=5))])])],
+            describe(loaded)
+        )
+        self.assertFalse(loaded[0].is_finished())
+        self.assertTrue(loaded[0].has_runnable_task())
+
+    def test_load_should_run_sagas_exported_by_the_first_format(self):
+        # given
+        with TemporaryDirectory() as directory:
+            path = join(directory, "sagas.json")
+            with open(path, mode="w") as file:
+                file.write(_BASELINE_SAGAS_JSON)
+
+            loaded = FileDataset(path=path).load()
+
+        built = [SimpleSaga(tasks=[Task(operations=[
+            SystemOperation(to_process=True, name="1", duration=Duration(micros=3)),
+            SystemOperation(to_process=False, name="2", duration=Duration(micros=5)),
+            SystemOperation(to_process=True, name="3", duration=Duration(micros=2))
+        ], name="t")], name="saga")]
+
+        # when
+        durations = [run_on_one_processor(sagas) for sagas in [loaded, built]]
+
+        # then
+        self.assertTrue(loaded[0].is_finished())
+        self.assertEqual(durations[1], durations[0])
+
+
+_BASELINE_SAGAS_JSON = """[{"py/object": "src.saga.simple_saga.SimpleSaga", "py/state": {"_tasks": [
+    {"py/object": "src.saga.task.Task", "py/state": {"operations": [
+        {"py/object": "src.saga.task.SystemOperation", "py/state": {"to_process": true, "name": "1",
+            "duration": {"py/object": "src.sys.time.duration.Duration", "py/state": {"micros": 3}}}},
+        {"py/object": "src.saga.task.SystemOperation", "py/state": {"to_process": false, "name": "2",
+            "duration": {"py/object": "src.sys.time.duration.Duration", "py/state": {"micros": 5}}}},
+        {"py/object": "src.saga.task.SystemOperation", "py/state": {"to_process": true, "name": "3",
+            "duration": {"py/object": "src.sys.time.duration.Duration", "py/state": {"micros": 2}}}}
+    ], "name": "t",
+        "_current_operation_processed_time": {"py/object": "src.sys.time.duration.Duration", "py/state": {"micros": 0}},
+        "_last_time_delta": null, "identifier": {"py/object": "uuid.UUID", "hex": "00000000000000000000000000000001"}}}
+], "_processing": false, "_name": "saga"}}]"""
+
+
+_LIST_BASED_SAGAS_JSON = """[{"py/object": "src.saga.simple_saga.SimpleSaga", "py/state": {"_tasks": [
+    {"py/object": "src.saga.task.Task", "py/state": {"operations": [
+        {"py/object": "src.saga.task.SystemOperation", "py/state": {"to_process": true, "name": "1",
+            "duration": {"py/object": "src.sys.time.duration.Duration", "py/state": {"micros": 3}}}},
+        {"py/object": "src.saga.task.SystemOperation", "py/state": {"to_process": false, "name": "2",
+            "duration": {"py/object": "src.sys.time.duration.Duration", "py/state": {"micros": 5}}}}
+    ], "name": "_❔task❔_", "_last_time_delta": null}}
+], "_processing": false, "_name": "saga"}}]"""
+
+
+class TestStoreDataset(TestCase):
+    def test_load_should_read_the_requested_number_of_sagas(self):
+        # given
+        sagas = GeneratedDataset(number=3, seed=1).load()
+
+        with TemporaryDirectory() as directory:
+            path = join(directory, "sagas.sagas")
+            OperationStore.from_sagas(sagas).save(path)
+            dataset = StoreDataset(path=path, number=2)
+
+            # when
+            loaded = dataset.load()
+
+            # then
+            self.assertEqual(2, len(dataset))
+            self.assertEqual(describe(sagas[:2]), describe(loaded))
+
+    def test_fingerprint_should_match_the_same_sagas_in_any_dataset(self):
+        # given
+        sagas = GeneratedDataset(number=3, seed=1).load()
+
+        with TemporaryDirectory() as directory:
+            path = join(directory, "sagas.sagas")
+            OperationStore.from_sagas(sagas).save(path)
+
+            # when
+            fingerprint = StoreDataset(path=path).fingerprint()
+
+            # then
+            self.assertEqual(GeneratedDataset(number=3, seed=1).fingerprint(), fingerprint)
+            self.assertEqual(InMemoryDataset(sagas=tuple(sagas)).fingerprint(), fingerprint)
+            self.assertNotEqual(StoreDataset(path=path, number=2).fingerprint(), fingerprint)
+            self.assertNotEqual(GeneratedDataset(number=3, seed=2).fingerprint(), fingerprint)
+
+
+class TestInMemoryDataset(TestCase):
+    def test_replica_should_be_rejected_for_fixed_sagas(self):
+        # given
+        dataset = InMemoryDataset(sagas=())
+
+        # then
+        self.assertIs(dataset, dataset.replica(0))
+        with self.assertRaises(ValueError):
+            dataset.replica(1)
+
+    def test_load_should_provide_new_list_of_the_same_sagas(self):
+        # given
+        saga = SimpleSaga(tasks=[
+            Task(operations=[SystemOperation(to_process=True, name="", duration=Duration(micros=1))])
+        ])
+        dataset = InMemoryDataset(sagas=(saga,))
+
+        # when
+        loaded = dataset.load()
+        loaded.clear()
+
+        # then
+        self.assertEqual([saga], dataset.load())
+
+
+def run_on_one_processor(sagas: List[SimpleSaga]) -> Duration:
+    orchestrator = ThreadedOrchestrator(processors_number=1, processing_mode=ProcessingMode.OVERLOADED_PROCESSORS)
+    return LogContext.run_logging(
+        log_name="test",
+        action=lambda: orchestrator.process(sagas),
+        level=LoggingLevel.NONE
+    )
+
+
+def describe(sagas: List[SimpleSaga]) -> List[Any]:
+    return [
+        (saga.name, [(task.name, [(op.to_process, op.duration) for op in task.operations]) for task in saga.tasks])
+        for saga in sagas
+    ]
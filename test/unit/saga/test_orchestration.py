@@ -1,11 +1,18 @@
-from typing import Tuple, Callable, List
+from dataclasses import astuple
+from random import Random
+from typing import Tuple, Callable, List, Iterator, Optional
 from unittest import TestCase
 from unittest.mock import Mock, call, patch, ANY
 
+from parameterized import parameterized
+
+from src.log import LogContext, Report, Logger, LoggingLevel
 from src.saga import orchestration
+from src.saga.arrival import ReplayedArrivals, ConstantArrivals, ArrivalProcess
 from src.saga.coroutine_saga import CoroutineSaga, CoroutineSagaFactory
-from src.saga.orchestration import ThreadedOrchestrator, CoroutinesOrchestrator
+from src.saga.orchestration import ThreadedOrchestrator, CoroutinesOrchestrator, Engine, Orchestrator
 from src.saga.simple_saga import SimpleSaga
+from src.saga.streaming import StreamReport
 from src.saga.task import Task, SystemOperation
 from src.sys.system import SystemFactory, System, ProcessingMode
 from src.sys.thread import Executable
@@ -18,6 +25,7 @@ class TestRun(TestCase):
     def test_run_should_tick_system(self, shift_time_method: Callable[[], None]):
         # given
         system: Mock[System] = Mock()
+        system.is_blocked = lambda: False
 
         work_is_done_answers = [False for _ in range(3)]
         system.tick = Mock(side_effect=lambda duration: work_is_done_answers.pop(0))
@@ -43,44 +51,487 @@ class TestRun(TestCase):
         self.assertEqual(3, shift_time_method.call_count)
 
     @patch("src.saga.orchestration.LogContext.shift_time")
-    def test_run_should_call_wait_if_task_is_waiting(self, shift_time_method: Callable[[], None]):
+    def test_run_should_wake_up_task_when_its_wait_ends(self, shift_time_method: Callable[[], None]):
+        # given
+        system: Mock[System] = Mock()
+        system.is_blocked = lambda: False
+        task = create_task(name="wait")
+        system.register_waits = lambda timer: task.register_waits(timer)
+
+        is_complete_before_ticks: List[bool] = []
+        work_is_done_answers = [False for _ in range(3)]
+        system.tick = Mock(side_effect=lambda duration: [
+            is_complete_before_ticks.append(task.is_complete()),
+            work_is_done_answers.pop(0)
+        ])
+        system.work_is_done = lambda: next(iter(work_is_done_answers), True)
+
+        executable: Mock[Executable] = Mock()
+
+        # when
+        result = orchestration._run(executables=[executable], system=system)
+
+        # then
+        self.assertEqual([False, False, True], is_complete_before_ticks)
+        self.assertEqual(Duration(micros=3), result)
+        self.assertEqual(3, shift_time_method.call_count)
+
+    @patch("src.saga.orchestration.LogContext.shift_time")
+    def test_run_should_not_touch_waiting_tasks_before_their_wait_ends(self, shift_time_method: Callable[[], None]):
         # given
         system: Mock[System] = Mock()
+        system.is_blocked = lambda: False
+        task: Mock[Task] = Mock()
+        system.register_waits = lambda timer: timer.schedule(task, Duration(micros=2))
 
+        work_is_done_answers = [False for _ in range(3)]
+        system.tick = Mock(side_effect=lambda duration: work_is_done_answers.pop(0))
+        system.work_is_done = lambda: next(iter(work_is_done_answers), True)
+
+        # when
+        orchestration._run(executables=[], system=system)
+
+        # then
+        task.wake_up.assert_called_once_with()
+        task.wait.assert_not_called()
+        task.is_waiting.assert_not_called()
+
+    @patch("src.saga.orchestration.LogContext.shift_time")
+    @patch("src.saga.orchestration.LogContext.logger")
+    def test_run_should_skip_to_the_next_event_while_system_is_blocked(
+            self,
+            logger_method: Callable[[], Mock],
+            shift_time_method: Callable[[], None]
+    ):
+        # given
+        logger: Mock = Mock()
+        logger.time_to_next_report = lambda: None
+        logger_method.return_value = logger
+
+        system: Mock[System] = Mock()
+        blocked_answers = [False, True, False]
+        system.is_blocked = lambda: blocked_answers.pop(0)
+        system.next_event_in = lambda: Duration(micros=5)
+
+        work_is_done_answers = [False for _ in range(3)]
+        system.tick = Mock(side_effect=lambda duration: work_is_done_answers.pop(0))
+        system.work_is_done = lambda: next(iter(work_is_done_answers), True)
+
+        # when
+        result = orchestration._run(executables=[], system=system)
+
+        # then
+        system.tick.assert_has_calls(
+            calls=[
+                call.tick(TimeDelta(duration=Duration(micros=1), identifier=ANY)),
+                call.tick(TimeDelta(duration=Duration(micros=5), identifier=ANY)),
+                call.tick(TimeDelta(duration=Duration(micros=1), identifier=ANY))
+            ]
+        )
+        logger.set_tick_length.assert_has_calls([call(Duration(micros=5)), call(Duration(micros=1))])
+        self.assertEqual(Duration(micros=7), result)
+        self.assertEqual(3, shift_time_method.call_count)
+
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE, 3],
+        [ProcessingMode.OVERLOADED_PROCESSORS, 3],
+        [ProcessingMode.YIELDING_PROCESSORS, 3],
+        [None, 3]
+    ])
+    def test_run_should_report_the_same_as_ticking_every_micro(self, mode: ProcessingMode, processors: int):
+        for seed in range(10):
+            # given
+            skipping = given_orchestrator(engine=Engine.TICKS, mode=mode, processors=processors)
+            ticking = given_orchestrator(engine=Engine.TICKS, mode=mode, processors=processors)
+
+            # when
+            skipping_duration, skipping_report = process_and_report(skipping, create_sagas(seed))
+            with patch("src.saga.orchestration._fast_forward_step", return_value=None):
+                ticking_duration, ticking_report = process_and_report(ticking, create_sagas(seed))
+
+            # then
+            self.assertEqual(ticking_duration, skipping_duration, msg=f"seed {seed}")
+            for expected, actual in zip(astuple(ticking_report), astuple(skipping_report)):
+                if type(expected) is float:
+                    self.assertAlmostEqual(expected, actual, msg=f"seed {seed}")
+                else:
+                    self.assertEqual(expected, actual, msg=f"seed {seed}")
+
+
+class TestRunEvents(TestCase):
+    @patch("src.saga.orchestration.LogContext.logger")
+    def test_run_events_should_tick_system_till_the_next_event(self, logger_method: Callable[[], Mock]):
+        # given
+        logger: Mock = Mock()
+        logger.time_to_next_report = lambda: None
+        logger_method.return_value = logger
+
+        system: Mock[System] = Mock()
+        next_events = [Duration(micros=5), Duration(micros=7)]
         work_is_done_answers = [False for _ in range(2)]
         system.tick = Mock(side_effect=lambda duration: work_is_done_answers.pop(0))
-        system.publish = Mock()
+        system.work_is_done = lambda: next(iter(work_is_done_answers), True)
+        system.next_event_in = lambda: next_events.pop(0)
 
         executable: Mock[Executable] = Mock()
+        executable.get_current_tasks = lambda: []
+
+        # when
+        result = orchestration._run_events(executables=[executable], system=system)
+
+        # then
+        system.tick.assert_has_calls(
+            calls=[
+                call.tick(TimeDelta(duration=Duration(micros=5), identifier=ANY)),
+                call.tick(TimeDelta(duration=Duration(micros=7), identifier=ANY))
+            ]
+        )
+        logger.set_tick_length.assert_has_calls([call(Duration(micros=5)), call(Duration(micros=7))])
+        self.assertEqual(2, logger.shift_time.call_count)
+        self.assertEqual(Duration(micros=12), result)
+
+    @patch("src.saga.orchestration.LogContext.logger")
+    def test_run_events_should_not_skip_the_end_of_a_wait(self, logger_method: Callable[[], Mock]):
+        # given
+        logger: Mock = Mock()
+        logger.time_to_next_report = lambda: None
+        logger_method.return_value = logger
+
+        system: Mock[System] = Mock()
+        work_is_done_answers = [False]
+        system.tick = Mock(side_effect=lambda duration: work_is_done_answers.pop(0))
         system.work_is_done = lambda: next(iter(work_is_done_answers), True)
+        system.next_event_in = lambda: Duration(micros=10)
+
+        task = create_task(name="wait")
+        system.register_waits = lambda timer: task.register_waits(timer)
 
-        task_to_process: Mock[Task] = Mock()
-        task_to_process.is_waiting = lambda: False
-        task_to_wait: Mock[Task] = Mock()
-        task_to_wait.is_waiting = lambda: True
-        executable.get_current_tasks = lambda: [task_to_process, task_to_wait]
+        # when
+        result = orchestration._run_events(executables=[], system=system)
 
-        mock_manager = Mock()
-        mock_manager.attach_mock(system.tick, "tick")
-        mock_manager.attach_mock(task_to_wait.wait, "wait")
+        # then
+        system.tick.assert_called_once_with(TimeDelta(duration=Duration(micros=2), identifier=ANY))
+        self.assertTrue(task.is_complete())
+        self.assertEqual(Duration(micros=2), result)
+
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE, 1],
+        [ProcessingMode.FIXED_POOL_SIZE, 3],
+        [ProcessingMode.OVERLOADED_PROCESSORS, 1],
+        [ProcessingMode.OVERLOADED_PROCESSORS, 3],
+        [ProcessingMode.YIELDING_PROCESSORS, 1],
+        [ProcessingMode.YIELDING_PROCESSORS, 3],
+        [None, 1],
+        [None, 3]
+    ])
+    def test_run_events_should_report_the_same_as_ticking(self, mode: ProcessingMode, processors: int):
+        for seed in range(10):
+            # given
+            ticks = given_orchestrator(engine=Engine.TICKS, mode=mode, processors=processors)
+            events = given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=processors)
+
+            # when
+            ticks_duration, ticks_report = process_and_report(ticks, create_sagas(seed))
+            events_duration, events_report = process_and_report(events, create_sagas(seed))
+
+            # then
+            self.assertEqual(ticks_duration, events_duration, msg=f"seed {seed}")
+            for expected, actual in zip(astuple(ticks_report), astuple(events_report)):
+                if type(expected) is float:
+                    self.assertAlmostEqual(expected, actual, msg=f"seed {seed}")
+                else:
+                    self.assertEqual(expected, actual, msg=f"seed {seed}")
+
+
+class TestRunPartitioned(TestCase):
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE],
+        [ProcessingMode.OVERLOADED_PROCESSORS],
+        [ProcessingMode.YIELDING_PROCESSORS],
+        [None]
+    ])
+    def test_run_partitioned_should_report_the_same_as_running_in_one_process(self, mode: ProcessingMode):
+        for seed in range(5):
+            # given
+            serial = given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=3)
+            partitioned = given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=3, workers=2)
+
+            # when
+            serial_duration, serial_report = process_and_report(serial, create_sagas(seed))
+            partitioned_duration, partitioned_report = process_and_report(partitioned, create_sagas(seed))
+
+            # then
+            self.assertEqual(serial_duration, partitioned_duration, msg=f"seed {seed}")
+            for expected, actual in zip(astuple(serial_report), astuple(partitioned_report)):
+                if type(expected) is float:
+                    self.assertAlmostEqual(expected, actual, msg=f"seed {seed}")
+                else:
+                    self.assertEqual(expected, actual, msg=f"seed {seed}")
+
+
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE, LoggingLevel.FULL],
+        [ProcessingMode.YIELDING_PROCESSORS, LoggingLevel.COUNTING],
+        [None, LoggingLevel.FULL]
+    ])
+    def test_run_partitioned_should_log_to_the_given_logger_of_the_callers_level(
+            self,
+            mode: ProcessingMode,
+            level: LoggingLevel
+    ):
+        for seed in range(3):
+            # given
+            serial_reports: List[Report] = []
+            serial_logger = LogContext.new_logger(level=level, name="test", report_publisher=serial_reports.append)
+            partitioned_reports: List[Report] = []
+            partitioned_logger = LogContext.new_logger(
+                level=level,
+                name="test",
+                report_publisher=partitioned_reports.append
+            )
+            serial = given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=3, logger=serial_logger)
+            partitioned = given_orchestrator(
+                engine=Engine.EVENTS,
+                mode=mode,
+                processors=3,
+                workers=2,
+                logger=partitioned_logger
+            )
+
+            # when
+            serial_duration = LogContext.run_logging(
+                log_name="test",
+                action=lambda: serial.process(create_sagas(seed, logger=serial_logger)),
+                logger=serial_logger
+            )
+            partitioned_duration = LogContext.run_logging(
+                log_name="test",
+                action=lambda: partitioned.process(create_sagas(seed, logger=partitioned_logger)),
+                logger=partitioned_logger
+            )
+
+            # then
+            self.assertEqual(serial_duration, partitioned_duration, msg=f"seed {seed}")
+            self.assertEqual(1, len(partitioned_reports), msg=f"seed {seed}")
+            for expected, actual in zip(astuple(serial_reports[0]), astuple(partitioned_reports[0])):
+                if type(expected) is float:
+                    self.assertAlmostEqual(expected, actual, msg=f"seed {seed}")
+                else:
+                    self.assertEqual(expected, actual, msg=f"seed {seed}")
+
+    @patch("src.saga.orchestration._run_partitioned")
+    def test_process_should_run_in_one_process_when_reports_are_published_every_period(
+            self,
+            run_partitioned_method: Mock
+    ):
+        # given
+        orchestrator = given_orchestrator(engine=Engine.EVENTS, mode=ProcessingMode.FIXED_POOL_SIZE, processors=3,
+                                          workers=2)
 
         # when
-        result = orchestration._run(executables=[executable], system=system)
+        LogContext.run_logging(
+            log_name="test",
+            action=lambda: orchestrator.process(create_sagas(seed=0)),
+            publish_report_every=Duration(micros=10),
+            report_publisher=lambda report: None
+        )
 
         # then
-        tick1_time_delta: TimeDelta = mock_manager.tick.call_args_list[0][0][0]
-        tick2_time_delta: TimeDelta = mock_manager.tick.call_args_list[1][0][0]
-        wait_time_delta: TimeDelta = mock_manager.wait.call_args_list[0][1]['time_delta']
+        run_partitioned_method.assert_not_called()
 
-        self.assertEqual(tick1_time_delta, wait_time_delta)
+    @patch("src.saga.orchestration.cpu_count", return_value=8)
+    @patch("src.saga.orchestration._run_partitioned", return_value=Duration(micros=10))
+    def test_process_should_simulate_each_processor_in_a_process_of_its_own_by_default(
+            self,
+            run_partitioned_method: Mock,
+            _
+    ):
+        # given
+        orchestrator = given_orchestrator(engine=Engine.EVENTS, mode=ProcessingMode.FIXED_POOL_SIZE, processors=3,
+                                          workers=None)
 
-        self.assertEqual(tick1_time_delta.duration, tick2_time_delta.duration)
-        self.assertNotEqual(tick1_time_delta.identifier, tick2_time_delta.identifier)
+        # when
+        process_and_report(orchestrator, create_sagas(seed=0))
 
-        system.publish.assert_called_once_with([executable])
+        # then
+        run_partitioned_method.assert_called_once_with(
+            engine=Engine.EVENTS,
+            executables=ANY,
+            system=ANY,
+            workers=3,
+            logger=ANY,
+            partition_logger=ANY,
+            tick_length=Duration(micros=1)
+        )
 
-        self.assertEqual(Duration(micros=2), result)
-        self.assertEqual(2, shift_time_method.call_count)
+    @patch("src.saga.orchestration.current_process", return_value=Mock(daemon=True))
+    @patch("src.saga.orchestration.cpu_count", return_value=8)
+    @patch("src.saga.orchestration._run_partitioned")
+    def test_process_should_run_in_one_process_inside_a_daemonic_process(self, run_partitioned_method: Mock, *_):
+        # given
+        orchestrator = given_orchestrator(engine=Engine.EVENTS, mode=ProcessingMode.FIXED_POOL_SIZE, processors=3,
+                                          workers=None)
+
+        # when
+        process_and_report(orchestrator, create_sagas(seed=0))
+
+        # then
+        run_partitioned_method.assert_not_called()
+
+
+class TestStream(TestCase):
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE],
+        [ProcessingMode.OVERLOADED_PROCESSORS],
+        [ProcessingMode.YIELDING_PROCESSORS]
+    ])
+    def test_stream_should_report_the_same_as_process_when_all_sagas_arrive_at_once(self, mode: ProcessingMode):
+        for seed in range(5):
+            # given
+            sagas = create_sagas(seed)
+            arrivals = ReplayedArrivals(timestamps=tuple(Duration.zero() for _ in sagas))
+            expected_duration, expected_report = process_and_report(
+                given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=3),
+                create_sagas(seed)
+            )
+
+            # when
+            stream_report, report = stream_and_report(
+                given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=3),
+                iter(sagas),
+                arrivals,
+                horizon=Duration(seconds=1)
+            )
+
+            # then
+            self.assertEqual(expected_duration, stream_report.simulation_duration, msg=f"seed {seed}")
+            self.assertEqual(len(sagas), stream_report.arrived, msg=f"seed {seed}")
+            self.assertEqual(len(sagas), stream_report.completed, msg=f"seed {seed}")
+            self.assertEqual(0, stream_report.in_flight, msg=f"seed {seed}")
+            for expected, actual in zip(astuple(expected_report), astuple(report)):
+                if type(expected) is float:
+                    self.assertAlmostEqual(expected, actual, msg=f"seed {seed}")
+                else:
+                    self.assertEqual(expected, actual, msg=f"seed {seed}")
+
+    @parameterized.expand([
+        [ProcessingMode.FIXED_POOL_SIZE],
+        [ProcessingMode.OVERLOADED_PROCESSORS],
+        [ProcessingMode.YIELDING_PROCESSORS],
+        [None]
+    ])
+    def test_stream_should_complete_sagas_arriving_over_time(self, mode: ProcessingMode):
+        # given
+        sagas = [saga for seed in range(5) for saga in create_sagas(seed)]
+        orchestrator = given_orchestrator(engine=Engine.EVENTS, mode=mode, processors=2)
+
+        # when
+        stream_report, _ = stream_and_report(
+            orchestrator,
+            iter(sagas),
+            ConstantArrivals(rate=10_000),
+            horizon=Duration(seconds=1)
+        )
+
+        # then
+        self.assertEqual(len(sagas), stream_report.completed)
+        self.assertEqual(0, stream_report.in_flight)
+        self.assertTrue(stream_report.avg_latency.is_positive)
+        self.assertLess(stream_report.simulation_duration, Duration(seconds=1))
+
+    def test_stream_should_stop_at_the_horizon_with_sagas_in_flight(self):
+        # given
+        sagas = [
+            SimpleSaga(tasks=[Task(operations=[SystemOperation(to_process=True, name="", duration=Duration(micros=10))])])
+            for _
+            in range(3)
+        ]
+        orchestrator = given_orchestrator(
+            engine=Engine.EVENTS,
+            mode=ProcessingMode.OVERLOADED_PROCESSORS,
+            processors=1
+        )
+
+        # when
+        stream_report, _ = stream_and_report(
+            orchestrator,
+            iter(sagas),
+            ReplayedArrivals(timestamps=(Duration.zero(), Duration.zero(), Duration(micros=5))),
+            horizon=Duration(micros=4)
+        )
+
+        # then
+        self.assertEqual(Duration(micros=4), stream_report.simulation_duration)
+        self.assertEqual(2, stream_report.arrived)
+        self.assertEqual(0, stream_report.completed)
+        self.assertEqual(2, stream_report.in_flight)
+
+
+def given_orchestrator(
+        engine: Engine,
+        mode: ProcessingMode,
+        processors: int,
+        workers: Optional[int] = 1,
+        logger: Optional[Logger] = None
+) -> Orchestrator:
+    with patch("src.sys.system.thread_timeslice", return_value=Duration(micros=25)):
+        if mode is None:
+            return CoroutinesOrchestrator(processors_number=processors, engine=engine, logger=logger, workers=workers)
+        return ThreadedOrchestrator(
+            processors_number=processors,
+            processing_mode=mode,
+            engine=engine,
+            logger=logger,
+            workers=workers
+        )
+
+
+def process_and_report(orchestrator: Orchestrator, sagas: List[SimpleSaga]) -> Tuple[Duration, Report]:
+    reports: List[Report] = []
+    duration = LogContext.run_logging(
+        log_name="test",
+        action=lambda: orchestrator.process(sagas),
+        report_publisher=lambda report: reports.append(report)
+    )
+    return duration, reports[0]
+
+
+def stream_and_report(
+        orchestrator: Orchestrator,
+        sagas: Iterator[SimpleSaga],
+        arrivals: ArrivalProcess,
+        horizon: Duration
+) -> Tuple[StreamReport, Report]:
+    reports: List[Report] = []
+    stream_report = LogContext.run_logging(
+        log_name="test",
+        action=lambda: orchestrator.stream(sagas=sagas, arrivals=arrivals, horizon=horizon),
+        report_publisher=lambda report: reports.append(report)
+    )
+    return stream_report, reports[0]
+
+
+def create_sagas(seed: int, logger: Optional[Logger] = None) -> List[SimpleSaga]:
+    random = Random(seed)
+
+    def operation(to_process: bool, longest: int) -> SystemOperation:
+        return SystemOperation(to_process=to_process, name="", duration=Duration(micros=random.randint(1, longest)))
+
+    def task() -> Task:
+        operations = [operation(to_process=True, longest=30)]
+        operations.extend([
+            operation(to_process=random.random() < 0.4, longest=60)
+            for _
+            in range(random.randint(0, 2))
+        ])
+        operations.append(operation(to_process=True, longest=30))
+        return Task(operations=operations, logger=logger)
+
+    return [
+        SimpleSaga(tasks=[task() for _ in range(random.randint(1, 3))], name=f"saga{i}", logger=logger)
+        for i
+        in range(random.randint(1, 8))
+    ]
 
 
 class TestThreadedOrchestrator(TestCase):
@@ -96,7 +547,8 @@ class TestThreadedOrchestrator(TestCase):
         orchestrator = ThreadedOrchestrator(
             processors_number=2,
             processing_mode=ProcessingMode.OVERLOADED_PROCESSORS,
-            system_factory=processors_factory
+            system_factory=processors_factory,
+            workers=1
         )
 
         saga: SimpleSaga = Mock()
@@ -105,9 +557,46 @@ class TestThreadedOrchestrator(TestCase):
         result = orchestrator.process(sagas=[saga])
 
         # then
-        run_method.assert_called_once_with(executables=[saga], system=system)
+        run_method.assert_called_once_with(
+            executables=[saga], system=system, tick_length=Duration(micros=1)
+        )
         self.assertEqual(Duration(micros=10), result)
 
+    @patch("src.saga.orchestration._run")
+    def test_process_should_run_with_configured_tick_length(
+            self,
+            run_method: Callable[[List[Executable], System], Duration]
+    ):
+        # given
+        processors_factory, system = given_system_factory_that_produces_mock(
+            expected_processors=2,
+            expected_mode=ProcessingMode.OVERLOADED_PROCESSORS
+        )
+        orchestrator = ThreadedOrchestrator(
+            processors_number=2,
+            processing_mode=ProcessingMode.OVERLOADED_PROCESSORS,
+            system_factory=processors_factory,
+            workers=1,
+            tick_length=Duration(micros=10)
+        )
+
+        saga: SimpleSaga = Mock()
+
+        # when
+        orchestrator.process(sagas=[saga])
+
+        # then
+        run_method.assert_called_once_with(executables=[saga], system=system, tick_length=Duration(micros=10))
+
+    def test_should_reject_not_positive_tick_length(self):
+        # when / then
+        with self.assertRaises(ValueError):
+            ThreadedOrchestrator(
+                processors_number=2,
+                processing_mode=ProcessingMode.OVERLOADED_PROCESSORS,
+                tick_length=Duration.zero()
+            )
+
 
 class TestCoroutinesOrchestrator(TestCase):
     @patch("src.saga.orchestration._run")
@@ -126,7 +615,8 @@ class TestCoroutinesOrchestrator(TestCase):
         orchestrator = CoroutinesOrchestrator(
             processors_number=2,
             system_factory=processors_factory,
-            coroutine_saga_factory=coroutine_factory
+            coroutine_saga_factory=coroutine_factory,
+            workers=1
         )
         saga1: SimpleSaga = Mock()
         saga2: SimpleSaga = Mock()
@@ -139,7 +629,9 @@ class TestCoroutinesOrchestrator(TestCase):
         result = orchestrator.process(sagas=[saga1, saga2, saga3])
 
         # then
-        run_method.assert_called_once_with(executables=[coroutine1, coroutine2], system=system)
+        run_method.assert_called_once_with(
+            executables=[coroutine1, coroutine2], system=system, tick_length=Duration(micros=1)
+        )
         self.assertEqual(Duration(micros=10), result)
 
     @patch("src.saga.orchestration._run")
@@ -158,7 +650,8 @@ class TestCoroutinesOrchestrator(TestCase):
         orchestrator = CoroutinesOrchestrator(
             processors_number=2,
             system_factory=processors_factory,
-            coroutine_saga_factory=coroutine_factory
+            coroutine_saga_factory=coroutine_factory,
+            workers=1
         )
         saga1: SimpleSaga = Mock()
 
@@ -168,7 +661,9 @@ class TestCoroutinesOrchestrator(TestCase):
         result = orchestrator.process(sagas=[saga1])
 
         # then
-        run_method.assert_called_once_with(executables=[coroutine], system=system)
+        run_method.assert_called_once_with(
+            executables=[coroutine], system=system, tick_length=Duration(micros=1)
+        )
         self.assertEqual(Duration(micros=10), result)
 
 
@@ -191,7 +686,7 @@ def given_system_factory_that_produces_mock(expected_processors: int, expected_m
     factory = SystemFactory()
     system: System = Mock()
     factory.create = \
-        lambda processors_count, processing_mode: system \
+        lambda processors_count, processing_mode, logger=None: system \
             if processors_count == expected_processors and processing_mode == expected_mode \
             else None
 
@@ -3,18 +3,20 @@ from unittest import TestCase
 from unittest.mock import Mock
 
 from src.saga.simple_saga import SimpleSaga
-from src.saga.task import Task
+from src.saga.task import Task, SystemOperation
 from src.sys.time.duration import Duration
 from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
 
 
 class TestSimpleSimpleSaga(TestCase):
     def test_tick_should_tick_all_tasks_until_they_finish(self):
         # given
+        logger = Mock()
         saga = SimpleSaga(tasks=[
             create_tickable_task(processing_duration_before_completion=Duration(micros=3)),
             create_tickable_task(processing_duration_before_completion=Duration(micros=2))
-        ])
+        ], logger=logger)
 
         # then
         self.assertFalse(saga.is_finished())
@@ -27,6 +29,33 @@ class TestSimpleSimpleSaga(TestCase):
 
         saga.ticked(time_delta=TimeDelta(duration=Duration(micros=4)))
         self.assertTrue(saga.is_finished())
+        logger.log_saga_finished.assert_called_once_with(started=Duration.zero())
+
+    def test_tick_should_log_saga_finished_since_its_arrival(self):
+        # given
+        logger = Mock()
+        saga = SimpleSaga(
+            tasks=[create_tickable_task(processing_duration_before_completion=Duration(micros=2))],
+            logger=logger
+        )
+        saga.arrive(Duration(micros=7))
+
+        # when
+        saga.ticked(time_delta=TimeDelta(duration=Duration(micros=2)))
+
+        # then
+        logger.log_saga_finished.assert_called_once_with(started=Duration(micros=7))
+
+    def test_should_name_its_tasks_after_itself(self):
+        # given
+        task1 = Task(operations=[SystemOperation(to_process=True, name="op", duration=Duration(micros=1))])
+        task2 = Task(operations=[SystemOperation(to_process=True, name="op", duration=Duration(micros=1))])
+
+        # when
+        SimpleSaga(tasks=[task1, task2], name="saga1")
+
+        # then
+        self.assertEqual(["saga1", "saga1"], [task1.saga_name, task2.saga_name])
 
     def test_get_current_tasks_should_provide_first_task_if_present(self):
         # given
@@ -43,7 +72,7 @@ class TestSimpleSimpleSaga(TestCase):
     def test_get_current_tasks_should_return_none_if_no_current_task_present(self):
         # given
         task = create_tickable_task(processing_duration_before_completion=Duration(micros=2))
-        saga = SimpleSaga(tasks=[task])
+        saga = SimpleSaga(tasks=[task], logger=Mock())
 
         # when
         saga.ticked(time_delta=TimeDelta(duration=Duration(micros=3)))
@@ -52,6 +81,18 @@ class TestSimpleSimpleSaga(TestCase):
         # then
         self.assertEqual(0, len(result))
 
+    def test_has_runnable_task_should_follow_current_task(self):
+        # given
+        task = create_tickable_task(processing_duration_before_completion=Duration(micros=2))
+        waiting_task = create_tickable_task(processing_duration_before_completion=Duration(micros=2), to_process=False)
+
+        # then
+        self.assertTrue(SimpleSaga(tasks=[task]).has_runnable_task())
+        self.assertEqual(task, SimpleSaga(tasks=[task]).current_task())
+        self.assertFalse(SimpleSaga(tasks=[waiting_task]).has_runnable_task())
+        self.assertFalse(SimpleSaga(tasks=[]).has_runnable_task())
+        self.assertIsNone(SimpleSaga(tasks=[]).current_task())
+
     def test_tick_should_tick_task_only_if_not_waiting(self):
         # given
         task = create_tickable_task(processing_duration_before_completion=Duration(micros=2), to_process=False)
@@ -64,6 +105,24 @@ class TestSimpleSimpleSaga(TestCase):
         task.ticked.assert_not_called()
 
 
+    def test_register_waits_should_register_current_task_and_the_next_one_when_it_starts(self):
+        # given
+        timer: WaitTimer = Mock()
+        task1 = create_tickable_task(processing_duration_before_completion=Duration(micros=1))
+        task2 = create_tickable_task(processing_duration_before_completion=Duration(micros=1))
+        saga = SimpleSaga(tasks=[task1, task2])
+
+        # when
+        saga.register_waits(timer)
+
+        # then
+        task1.register_waits.assert_called_once_with(timer)
+        task2.register_waits.assert_not_called()
+
+        saga.ticked(time_delta=TimeDelta(duration=Duration(micros=1)))
+        task2.register_waits.assert_called_once_with(timer)
+
+
 def create_fixed_task(completed: bool) -> Task:
     task: Task = Mock()
     task.is_complete = lambda: completed
@@ -0,0 +1,83 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.log import Logger
+from src.saga.simple_saga import SimpleSaga
+from src.saga.spec import SagaSpec, TaskSpec, specs_of, new_sagas
+from src.saga.task import Task, SystemOperation
+from src.sys.time.duration import Duration
+from src.sys.time.time import TimeDelta
+
+
+class TestSagaSpec(TestCase):
+    def test_of_should_capture_tasks_and_operations(self):
+        # given
+        saga = create_saga()
+
+        # when
+        spec = SagaSpec.of(saga)
+
+        # then
+        self.assertEqual("saga", spec.name)
+        self.assertEqual(["task1", "task2"], [task.name for task in spec.tasks])
+        self.assertEqual(saga.tasks[0].identifier, spec.tasks[0].identifier)
+        self.assertEqual(
+            [Duration(micros=2), Duration(micros=1)],
+            [operation.duration for operation in spec.tasks[0].operations]
+        )
+
+    def test_new_saga_should_not_share_progress_between_runs(self):
+        # given
+        logger: Logger = Mock()
+        spec = SagaSpec.of(create_saga())
+        first = spec.new_saga(logger=logger)
+
+        # when
+        first.ticked(time_delta=TimeDelta(Duration(micros=2)))
+        first.ticked(time_delta=TimeDelta(Duration(micros=1)))
+        second = spec.new_saga(logger=logger)
+
+        # then
+        self.assertEqual(["task2"], [task.name for task in first.tasks])
+        self.assertEqual(["task1", "task2"], [task.name for task in second.tasks])
+        self.assertEqual(Duration(micros=2), second.next_event_in())
+        self.assertEqual(2, len(spec.tasks[0].operations))
+
+    def test_new_task_should_use_given_logger(self):
+        # given
+        logger: Logger = Mock()
+        task = TaskSpec.of(create_saga().tasks[0]).new_task(logger=logger)
+
+        # when
+        task.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        logger.log_task_processing.assert_called_once_with(name="task1", identifier=task.identifier, saga=None)
+
+    def test_new_sagas_should_rebuild_all_specs(self):
+        # given
+        specs = specs_of([create_saga(), create_saga()])
+
+        # when
+        sagas = new_sagas(specs, logger=Mock())
+
+        # then
+        self.assertEqual(2, len(sagas))
+        self.assertIsNot(sagas[0].tasks[0], sagas[1].tasks[0])
+        self.assertEqual(specs, specs_of(sagas))
+
+
+def create_saga() -> SimpleSaga:
+    return SimpleSaga(
+        tasks=[
+            Task(
+                operations=[
+                    SystemOperation(to_process=True, name="1", duration=Duration(micros=2)),
+                    SystemOperation(to_process=True, name="2", duration=Duration(micros=1))
+                ],
+                name="task1"
+            ),
+            Task(operations=[SystemOperation(to_process=True, name="3", duration=Duration(micros=4))], name="task2")
+        ],
+        name="saga"
+    )
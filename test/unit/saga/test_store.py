@@ -0,0 +1,292 @@
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import List, Any
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+import numpy as np
+
+from jsonpickle import encode, decode
+
+from src.log import TimeLogger, LogContext
+from src.saga.simple_saga import SimpleSaga
+from src.saga.store import OperationStore, convert_json_to_store, convert_store_to_json
+from src.saga.task import Task, SystemOperation
+from src.sys.time.duration import Duration
+from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
+
+
+class TestOperationStore(TestCase):
+    log_context_logger = LogContext.logger
+
+    @classmethod
+    def tearDownClass(cls):
+        LogContext.logger = cls.log_context_logger
+
+    def test_from_sagas_should_flatten_operations_into_arrays(self):
+        # given
+        sagas = create_sagas()
+
+        # when
+        store = OperationStore.from_sagas(sagas)
+
+        # then
+        self.assertEqual([3, 5, 2, 4, 1], store.durations.tolist())
+        self.assertEqual([True, False, True, True, False], store.to_process.tolist())
+        self.assertEqual([0, 3, 4, 5], store.task_offsets.tolist())
+        self.assertEqual([0, 2, 3], store.saga_offsets.tolist())
+        self.assertEqual(["saga1", "saga2"], store.saga_names)
+        self.assertEqual(["task1", "task2", "task3"], store.task_names)
+        self.assertEqual(2, store.number_of_sagas)
+        self.assertEqual(3, store.number_of_tasks)
+        self.assertEqual(5, store.number_of_operations)
+
+    def test_from_sagas_should_drop_names_if_not_needed(self):
+        # when
+        store = OperationStore.from_sagas(create_sagas(), keep_names=False)
+
+        # then
+        self.assertIsNone(store.saga_names)
+        self.assertIsNone(store.task_names)
+        self.assertEqual(["saga0", "saga1"], [saga.name for saga in store.sagas()])
+
+    def test_simulated_micros_should_sum_operations_of_the_requested_sagas(self):
+        # given
+        store = OperationStore.from_sagas(create_sagas())
+
+        # then
+        self.assertEqual(15, store.simulated_micros())
+        self.assertEqual(14, store.simulated_micros(number_of_sagas=1))
+
+    def test_init_should_fail_if_a_task_has_no_operations(self):
+        # when
+        try:
+            OperationStore(
+                durations=np.array([1, 2], dtype=np.int64),
+                to_process=np.array([True, True]),
+                task_offsets=np.array([0, 2, 2], dtype=np.int64),
+                saga_offsets=np.array([0, 2], dtype=np.int64)
+            )
+        # then
+        except ValueError:
+            return
+
+        self.fail("Should throw exception")
+
+    def test_sagas_should_provide_the_requested_number_of_sagas(self):
+        # given
+        store = OperationStore.from_sagas(create_sagas())
+
+        # when
+        sagas = store.sagas(number=1)
+
+        # then
+        self.assertEqual(["saga1"], [saga.name for saga in sagas])
+        self.assertEqual(["task1", "task2"], [task.name for task in sagas[0].tasks])
+
+    def test_stored_task_should_progress_as_a_task(self):
+        # given
+        logger = given_logging_context_that_provides_logger()
+        timer: WaitTimer = Mock()
+        task = OperationStore.from_sagas(create_sagas()).sagas()[0].tasks[0]
+
+        # then
+        task.register_waits(timer)
+        self.assertFalse(task.is_waiting())
+        self.assertEqual(Duration(micros=3), task.next_event_in())
+
+        task.ticked(time_delta=TimeDelta(Duration(micros=1)))
+        self.assertEqual(Duration(micros=2), task.next_event_in())
+
+        task.ticked(time_delta=TimeDelta(Duration(micros=2)))
+        self.assertTrue(task.is_waiting())
+        self.assertFalse(task.is_complete())
+        timer.schedule.assert_called_once_with(task, Duration(micros=5))
+
+        task.wake_up()
+        self.assertFalse(task.is_waiting())
+
+        task.ticked(time_delta=TimeDelta(Duration(micros=2)))
+        self.assertTrue(task.is_complete())
+
+        logger.log_task_processing.assert_has_calls([call(name="task1", identifier=task.identifier, saga="saga1")] * 3)
+
+    def test_sagas_should_not_share_progress_between_calls(self):
+        # given
+        given_logging_context_that_provides_logger()
+        store = OperationStore.from_sagas(create_sagas())
+        first = store.sagas()
+
+        # when
+        first[0].ticked(time_delta=TimeDelta(Duration(micros=3)))
+        second = store.sagas()
+
+        # then
+        self.assertTrue(first[0].get_current_tasks()[0].is_waiting())
+        self.assertFalse(second[0].get_current_tasks()[0].is_waiting())
+        self.assertEqual(Duration(micros=3), second[0].next_event_in())
+
+    def test_operations_should_return_remaining_operations(self):
+        # given
+        given_logging_context_that_provides_logger()
+        task = OperationStore.from_sagas(create_sagas()).sagas()[0].tasks[0]
+
+        # when
+        task.ticked(time_delta=TimeDelta(Duration(micros=3)))
+
+        # then
+        self.assertEqual(
+            [(False, Duration(micros=5)), (True, Duration(micros=2))],
+            [(operation.to_process, operation.duration) for operation in task.operations]
+        )
+
+    def test_stored_task_should_hold_every_attribute_of_a_task(self):
+        # given
+        store = OperationStore.from_sagas(create_sagas())
+
+        # when
+        task = store.sagas()[0].tasks[0]
+
+        # then
+        built = Task(operations=[SystemOperation(to_process=True, name="1", duration=Duration(micros=3))])
+        for attribute in vars(built):
+            self.assertTrue(hasattr(task, attribute), attribute)
+        self.assertEqual(
+            [(True, "1", Duration(micros=3)), (False, "2", Duration(micros=5)), (True, "3", Duration(micros=2))],
+            [(operation.to_process, operation.name, operation.duration) for operation in task.operations]
+        )
+
+
+class TestOperationStoreFile(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, "sagas.sagas")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_should_restore_saved_store(self):
+        # given
+        OperationStore.from_sagas(create_sagas()).save(self.path)
+
+        # when
+        store = OperationStore.load(self.path)
+
+        # then
+        self.assertEqual([3, 5, 2, 4, 1], store.durations.tolist())
+        self.assertEqual([True, False, True, True, False], store.to_process.tolist())
+        self.assertEqual([0, 3, 4, 5], store.task_offsets.tolist())
+        self.assertEqual([0, 2, 3], store.saga_offsets.tolist())
+        self.assertEqual(["saga1", "saga2"], list(store.saga_names))
+        self.assertEqual(["task1", "task2", "task3"], list(store.task_names))
+        self.assertEqual(["1", "2", "3", "4", "5"], list(store.operation_names))
+        self.assertEqual(describe(create_sagas()), describe(store.to_sagas()))
+
+    def test_load_should_read_only_the_requested_prefix_of_sagas(self):
+        # given
+        OperationStore.from_sagas(create_sagas()).save(self.path)
+
+        # when
+        store = OperationStore.load(self.path, number_of_sagas=1)
+
+        # then
+        self.assertEqual(1, store.number_of_sagas)
+        self.assertEqual(2, store.number_of_tasks)
+        self.assertEqual(4, store.number_of_operations)
+        self.assertEqual(["task1", "task2"], list(store.task_names))
+        self.assertEqual(["4"], store.operation_names[-1:])
+        self.assertEqual(describe(create_sagas()[:1]), describe(store.to_sagas()))
+
+    def test_load_should_restore_store_saved_without_names(self):
+        # given
+        OperationStore.from_sagas(create_sagas(), keep_names=False).save(self.path)
+
+        # when
+        store = OperationStore.load(self.path)
+
+        # then
+        self.assertIsNone(store.saga_names)
+        self.assertIsNone(store.task_names)
+        self.assertIsNone(store.operation_names)
+        self.assertEqual([3, 5, 2, 4, 1], store.durations.tolist())
+
+    def test_load_should_fail_if_file_is_not_a_store(self):
+        # given
+        with open(self.path, mode="wb") as file:
+            file.write(b"\0" * 64)
+
+        # when
+        try:
+            OperationStore.load(self.path)
+        # then
+        except ValueError:
+            return
+
+        self.fail("Should throw exception")
+
+    def test_converters_should_keep_sagas_from_and_to_json(self):
+        # given
+        json_path = join(self.directory.name, "sagas.json")
+        with open(json_path, mode="w") as file:
+            file.write(encode(create_sagas()))
+
+        # when
+        convert_json_to_store(json_path, self.path)
+        convert_store_to_json(self.path, json_path)
+
+        # then
+        with open(json_path, mode="r") as file:
+            self.assertEqual(describe(create_sagas()), describe(decode(file.read())))
+
+
+def describe(sagas: List[SimpleSaga]) -> List[Any]:
+    return [
+        (
+            saga.name,
+            [
+                (
+                    task.name,
+                    [(operation.to_process, operation.name, operation.duration) for operation in task.operations]
+                )
+                for task
+                in saga.tasks
+            ]
+        )
+        for saga
+        in sagas
+    ]
+
+
+def create_sagas() -> List[SimpleSaga]:
+    return [
+        SimpleSaga(
+            tasks=[
+                Task(
+                    operations=[
+                        SystemOperation(to_process=True, name="1", duration=Duration(micros=3)),
+                        SystemOperation(to_process=False, name="2", duration=Duration(micros=5)),
+                        SystemOperation(to_process=True, name="3", duration=Duration(micros=2))
+                    ],
+                    name="task1"
+                ),
+                Task(operations=[SystemOperation(to_process=True, name="4", duration=Duration(micros=4))], name="task2")
+            ],
+            name="saga1"
+        ),
+        SimpleSaga(
+            tasks=[
+                Task(
+                    operations=[SystemOperation(to_process=False, name="5", duration=Duration(micros=1))],
+                    name="task3"
+                )
+            ],
+            name="saga2"
+        )
+    ]
+
+
+def given_logging_context_that_provides_logger() -> Mock:
+    logger: Mock[TimeLogger] = Mock()
+    LogContext.logger = lambda: logger
+    return logger
@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from src.saga.streaming import Admissions, Saturation, StreamReport
+from src.sys.time.duration import Duration
+from src.sys.time.time import TimeDelta
+from test.unit.sys.factories import create_executable
+
+
+class TestAdmissions(TestCase):
+    def test_report_should_count_sagas_arriving_and_completing_after_warm_up(self):
+        # given
+        admissions = Admissions(warm_up=Duration(seconds=1))
+        before = admissions.admit(create_executable(ticks=1, identifier=1), arrived_at=Duration(micros=500_000))
+        after = admissions.admit(create_executable(ticks=1, identifier=2), arrived_at=Duration(seconds=1))
+        admissions.admit(create_executable(ticks=1, identifier=3), arrived_at=Duration(micros=1_500_000))
+
+        # when
+        before.ticked(TimeDelta(Duration(micros=1)))
+        admissions.complete_finished(now=Duration(micros=1_100_000))
+        after.ticked(TimeDelta(Duration(micros=1)))
+        admissions.complete_finished(now=Duration(micros=1_300_000))
+        report = admissions.report(log_name="test", duration=Duration(seconds=3))
+
+        # then
+        self.assertEqual(
+            StreamReport(
+                log_name="test",
+                simulation_duration=Duration(seconds=3),
+                arrived=2,
+                completed=2,
+                in_flight=1,
+                offered_rate=1.0,
+                throughput=1.0,
+                avg_latency=Duration(micros=450_000)
+            ),
+            report
+        )
+
+
+class TestSaturation(TestCase):
+    def test_of_should_find_the_highest_rate_still_kept_up_with(self):
+        # given
+        reports = [
+            create_report(offered_rate=10.0, throughput=10.0),
+            create_report(offered_rate=20.0, throughput=19.5),
+            create_report(offered_rate=40.0, throughput=25.0),
+            create_report(offered_rate=80.0, throughput=24.0)
+        ]
+
+        # when
+        saturation = Saturation.of(log_name="test", reports=reports)
+
+        # then
+        self.assertEqual(Saturation(log_name="test", sustained_throughput=25.0, saturation_rate=20.0), saturation)
+
+    def test_of_should_have_no_saturation_rate_when_no_rate_is_kept_up_with(self):
+        # then
+        self.assertIsNone(Saturation.of(log_name="test", reports=[create_report(10.0, 1.0)]).saturation_rate)
+
+
+def create_report(offered_rate: float, throughput: float) -> StreamReport:
+    return StreamReport(
+        log_name="test",
+        simulation_duration=Duration(seconds=1),
+        arrived=0,
+        completed=0,
+        in_flight=0,
+        offered_rate=offered_rate,
+        throughput=throughput,
+        avg_latency=Duration.zero()
+    )
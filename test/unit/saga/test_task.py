@@ -1,10 +1,10 @@
 from unittest import TestCase
 from unittest.mock import Mock, call
-from uuid import uuid4
 
 from src.log import TimeLogger, LogContext
 from src.sys.time.time import TimeDelta
 from src.sys.time.duration import Duration
+from src.sys.time.timer import WaitTimer
 from src.saga.task import SystemOperation, Task
 
 
@@ -22,6 +22,12 @@ class TestSystemOperation(TestCase):
 
 
 class TestTask(TestCase):
+    log_context_logger = LogContext.logger
+
+    @classmethod
+    def tearDownClass(cls):
+        LogContext.logger = cls.log_context_logger
+
     def test_post_init_should_fail_if_there_is_no_operations(self):
         # given
         operations = []
@@ -58,10 +64,25 @@ class TestTask(TestCase):
         self.assertTrue(task.is_complete())
 
         logger.log_task_processing.assert_has_calls([
-            call(name="task", identifier=task.identifier),
-            call(name="task", identifier=task.identifier)
+            call(name="task", identifier=task.identifier, saga=None),
+            call(name="task", identifier=task.identifier, saga=None)
         ])
 
+    def test_completion_should_not_consume_given_operations(self):
+        # given
+        given_logging_context_that_provides_logger()
+        operations = (SystemOperation(to_process=True, name="1", duration=Duration(micros=1)),)
+        task = Task(operations=operations, name="task")
+
+        # when
+        task.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        self.assertTrue(task.is_complete())
+        self.assertEqual([], task.operations)
+        self.assertEqual(1, len(operations))
+        self.assertFalse(Task(operations=operations, name="task").is_complete())
+
     def test_is_complete_with_long_tick(self):
         # given
         logger = given_logging_context_that_provides_logger()
@@ -74,7 +95,7 @@ class TestTask(TestCase):
         # then
         self.assertTrue(task.is_complete())
 
-        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier)
+        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier, saga=None)
 
     def test_tick_should_throw_error_if_waiting(self):
         # given
@@ -108,6 +129,74 @@ class TestTask(TestCase):
 
         self.fail("Should throw exception")
 
+    def test_next_event_in_should_return_time_left_till_the_end_of_current_operation(self):
+        # given
+        given_logging_context_that_provides_logger()
+        task = Task(operations=[
+            SystemOperation(to_process=True, name="1: processing", duration=Duration(micros=3)),
+            SystemOperation(to_process=False, name="2: waiting", duration=Duration(micros=5))
+        ])
+
+        # then
+        self.assertEqual(Duration(micros=3), task.next_event_in())
+
+        task.ticked(time_delta=TimeDelta(Duration(micros=1)))
+        self.assertEqual(Duration(micros=2), task.next_event_in())
+
+        task.ticked(time_delta=TimeDelta(Duration(micros=2)))
+        self.assertEqual(Duration(micros=5), task.next_event_in())
+
+        task.wait(time_delta=TimeDelta(Duration(micros=5)))
+        self.assertIsNone(task.next_event_in())
+
+    def test_register_waits_should_schedule_wake_up_when_task_enters_a_wait(self):
+        # given
+        given_logging_context_that_provides_logger()
+        timer: WaitTimer = Mock()
+        task = Task(operations=[
+            SystemOperation(to_process=False, name="1: waiting", duration=Duration(micros=4)),
+            SystemOperation(to_process=True, name="2: processing", duration=Duration(micros=1)),
+            SystemOperation(to_process=False, name="3: waiting", duration=Duration(micros=3))
+        ])
+
+        # when
+        task.register_waits(timer)
+        task.wake_up()
+        task.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        timer.schedule.assert_has_calls([
+            call(task, Duration(micros=4)),
+            call(task, Duration(micros=3))
+        ])
+
+    def test_wake_up_should_finish_current_wait(self):
+        # given
+        task = Task(operations=[
+            SystemOperation(to_process=False, name="1: waiting", duration=Duration(micros=4)),
+            SystemOperation(to_process=True, name="2: processing", duration=Duration(micros=1))
+        ])
+
+        # when
+        task.wake_up()
+
+        # then
+        self.assertFalse(task.is_waiting())
+        self.assertEqual(Duration(micros=1), task.next_event_in())
+
+    def test_wake_up_should_be_ignored_if_task_is_processing(self):
+        # given
+        task = Task(operations=[
+            SystemOperation(to_process=True, name="1: processing", duration=Duration(micros=2))
+        ])
+
+        # when
+        task.wake_up()
+
+        # then
+        self.assertFalse(task.is_complete())
+        self.assertEqual(Duration(micros=2), task.next_event_in())
+
     def test_is_waiting_when_first_operation_is_not_to_process(self):
         # given
         operation = SystemOperation(to_process=False, name="not to process", duration=Duration(micros=1))
@@ -130,7 +219,7 @@ class TestTask(TestCase):
 
         # then
         self.assertTrue(task.is_waiting())
-        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier)
+        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier, saga=None)
 
     def test_wait_should_be_skipped_if_time_delta_is_same_as_in_last_tick(self):
         # given
@@ -139,7 +228,7 @@ class TestTask(TestCase):
             SystemOperation(to_process=True, name="1: processing", duration=Duration(micros=2)),
             SystemOperation(to_process=False, name="2: waiting", duration=Duration(micros=2))
         ], name="task")
-        delta_id = uuid4()
+        delta_id = TimeDelta(Duration(micros=2)).identifier
 
         # then
         # 1
@@ -155,7 +244,7 @@ class TestTask(TestCase):
         self.assertTrue(task.is_waiting())
         self.assertTrue(task.is_complete())
 
-        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier)
+        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier, saga=None)
 
     def test_ticked_should_be_skipped_if_time_delta_is_same_as_in_last_wait(self):
         # given
@@ -164,7 +253,7 @@ class TestTask(TestCase):
             SystemOperation(to_process=False, name="1: waiting", duration=Duration(micros=2)),
             SystemOperation(to_process=True, name="2: processing", duration=Duration(micros=2))
         ], name="task")
-        delta_id = uuid4()
+        delta_id = TimeDelta(Duration(micros=2)).identifier
 
         # then
         # 1
@@ -180,7 +269,24 @@ class TestTask(TestCase):
         self.assertTrue(task.is_waiting())
         self.assertTrue(task.is_complete())
 
-        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier)
+        logger.log_task_processing.assert_called_once_with(name="task", identifier=task.identifier, saga=None)
+
+    def test_ticked_should_not_be_skipped_if_reused_time_delta_advanced(self):
+        # given
+        given_logging_context_that_provides_logger()
+        task = Task(operations=[
+            SystemOperation(to_process=True, name="1: processing", duration=Duration(micros=2))
+        ], name="task")
+        delta = TimeDelta(Duration(micros=1))
+
+        # when
+        task.ticked(time_delta=delta)
+        task.ticked(time_delta=delta)
+        delta.advance()
+        task.ticked(time_delta=delta)
+
+        # then
+        self.assertTrue(task.is_complete())
 
     def test_is_waiting(self):
         # given
@@ -236,12 +342,12 @@ class TestTask(TestCase):
         self.assertTrue(task.is_waiting())
 
         logger.log_task_processing.assert_has_calls([
-            call(name="task", identifier=task.identifier),
-            call(name="task", identifier=task.identifier),
-            call(name="task", identifier=task.identifier),
-            call(name="task", identifier=task.identifier),
-            call(name="task", identifier=task.identifier),
-            call(name="task", identifier=task.identifier)
+            call(name="task", identifier=task.identifier, saga=None),
+            call(name="task", identifier=task.identifier, saga=None),
+            call(name="task", identifier=task.identifier, saga=None),
+            call(name="task", identifier=task.identifier, saga=None),
+            call(name="task", identifier=task.identifier, saga=None),
+            call(name="task", identifier=task.identifier, saga=None)
         ])
 
 
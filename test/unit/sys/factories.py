@@ -20,8 +20,9 @@ def create_executable(ticks: int, waits: int = 0, identifier: int = 0) -> Mock[E
         side_effect=lambda duration: is_complete_answers.pop(0) if len(is_complete_answers) != 0 else None
     )
     executable.is_finished = lambda: len(is_complete_answers) == 0
-    executable.get_current_tasks = lambda: \
-        [_create_dummy_task(is_waiting=next(iter(is_complete_answers), "work") == "wait")]
+    executable.current_task = lambda: _create_dummy_task(is_waiting=next(iter(is_complete_answers), "work") == "wait")
+    executable.get_current_tasks = lambda: [executable.current_task()]
+    executable.has_runnable_task = lambda: next(iter(is_complete_answers), "work") != "wait"
 
     return executable
 
@@ -40,6 +40,31 @@ class TestProcessor(TestCase):
             for _ in range(6)
         ])
 
+    def test_ticked_should_log_to_injected_logger(self):
+        # given
+        context_logger = given_logging_context_that_provides_logger()
+        logger: Mock[TimeLogger] = Mock()
+
+        thread1, thread2 = create_threads(number_of_threads=2, init_ticks=0, exec_ticks=3, destr_ticks=0)
+        processor = Processor(processing_interval=Duration(1), context_switch_cost=Duration(1), yielding=False,
+                              logger=logger)
+
+        # when
+        processor.assign(thread1)
+        processor.assign(thread2)
+        for _ in range(3):
+            processor.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        logger.assert_has_calls([
+            call.log_processor_tick(proc_number=processor.number),
+            call.log_processor_tick(proc_number=processor.number),
+            call.log_overhead_tick(),
+            call.log_processor_tick(proc_number=processor.number),
+            call.log_overhead_tick()
+        ])
+        self.assertEqual([], context_logger.method_calls)
+
     def test_is_starving_should_return_true_when_all_threads_are_processed(self):
         # given
         logger = given_logging_context_that_provides_logger()
@@ -82,6 +107,66 @@ class TestProcessor(TestCase):
         logger.log_processor_tick.assert_has_calls([call(proc_number=processor.number) for _ in range(8)])
         logger.log_overhead_tick.assert_has_calls([call() for _ in range(2)])
 
+    def test_ticked_should_log_run_queue_and_involuntary_context_switch_when_timeslice_runs_out(self):
+        # given
+        given_logging_context_that_provides_logger()
+        logger: Mock[TimeLogger] = Mock()
+
+        thread1, thread2 = create_threads(number_of_threads=2, init_ticks=0, exec_ticks=3, destr_ticks=0)
+        processor = Processor(processing_interval=Duration(1), context_switch_cost=Duration(1), yielding=False,
+                              logger=logger)
+
+        # when
+        processor.assign(thread1)
+        processor.assign(thread2)
+        for _ in range(4):
+            processor.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        self.assertEqual(
+            [call(proc_number=processor.number, queue_length=length) for length in (1, 1, 2)],
+            logger.log_thread_queued.call_args_list
+        )
+        self.assertEqual(
+            [call(proc_number=processor.number, delay=Duration(micros=delay)) for delay in (0, 3)],
+            logger.log_thread_dispatched.call_args_list
+        )
+        logger.log_context_switch.assert_called_once_with(proc_number=processor.number, voluntary=False)
+
+    def test_ticked_should_log_voluntary_context_switch_when_thread_yields(self):
+        # given
+        given_logging_context_that_provides_logger()
+        logger: Mock[TimeLogger] = Mock()
+
+        thread1, thread2 = create_threads(number_of_threads=2, init_ticks=0, exec_ticks=1, wait_ticks=1, destr_ticks=0)
+        processor = Processor(processing_interval=Duration(20), context_switch_cost=Duration(1), yielding=True,
+                              logger=logger)
+
+        # when
+        processor.assign(thread1)
+        processor.assign(thread2)
+        for _ in range(3):
+            processor.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        logger.log_context_switch.assert_called_once_with(proc_number=processor.number, voluntary=True)
+
+    def test_ticked_should_log_lifetime_of_finished_thread(self):
+        # given
+        given_logging_context_that_provides_logger()
+        logger: Mock[TimeLogger] = Mock()
+
+        thread = create_thread(init_ticks=1, exec_ticks=2, destr_ticks=1)
+        processor = Processor(processing_interval=Duration(20), yielding=False, logger=logger)
+
+        # when
+        processor.assign(thread)
+        for _ in range(5):
+            processor.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        logger.log_thread_finished.assert_called_once_with(proc_number=processor.number, lifetime=Duration(micros=4))
+
     def test_is_starving_should_return_true_when_thread_is_processed(self):
         # given
         logger = given_logging_context_that_provides_logger()
@@ -141,6 +226,32 @@ class TestProcessor(TestCase):
         )
         logger.log_processor_tick.assert_has_calls([call(proc_number=processor.number) for _ in range(10)])
 
+    def test_next_event_in_should_return_time_till_the_end_of_context_switch(self):
+        # given
+        given_logging_context_that_provides_logger()
+
+        thread1, thread2 = create_threads(number_of_threads=2, init_ticks=0, exec_ticks=10, destr_ticks=0)
+        thread1.next_event_in = lambda: Duration(micros=10)
+        processor = Processor(processing_interval=Duration(3), context_switch_cost=Duration(4), yielding=False)
+        processor.assign(thread1)
+        processor.assign(thread2)
+
+        # then
+        self.assertEqual(Duration(micros=3), processor.next_event_in())
+
+        processor.ticked(time_delta=TimeDelta(Duration(micros=3)))
+        self.assertEqual(Duration(micros=5), processor.next_event_in())
+
+        processor.ticked(time_delta=TimeDelta(Duration(micros=2)))
+        self.assertEqual(Duration(micros=3), processor.next_event_in())
+
+    def test_next_event_in_should_return_none_when_starving(self):
+        # given
+        processor = Processor(processing_interval=Duration(3), yielding=False)
+
+        # then
+        self.assertIsNone(processor.next_event_in())
+
     def assert_only_calls(self, expected_calls: List[Any], mock: Any):
         self.assertEqual(expected_calls, mock.mock_calls)
 
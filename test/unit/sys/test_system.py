@@ -104,6 +104,100 @@ class TestSystem(TestCase):
 
         self.assertIsNot(processor1Thread, processor2Thread)
 
+    def test_submit_should_assign_new_threads_round_robin_and_register_their_waits(self):
+        # given
+        timer = Mock()
+        factory = proc_factory(yielding_is_on=False)
+        processor1 = proc_mock(factory)
+        processor2 = proc_mock(factory)
+        system = System(
+            processors_count=2,
+            processing_mode=ProcessingMode.OVERLOADED_PROCESSORS,
+            proc_factory=factory
+        )
+        executable1, executable2, executable3 = create_executables(3)
+        system.register_waits(timer)
+        system.open()
+
+        # when
+        for executable in [executable1, executable2, executable3]:
+            system.submit(executable)
+
+        # then
+        processor1.assign.assert_has_calls([call(KernelThread(executable1)), call(KernelThread(executable3))])
+        processor2.assign.assert_called_once_with(KernelThread(executable2))
+        for executable in [executable1, executable2, executable3]:
+            executable.register_waits.assert_called_once_with(timer)
+        self.assertFalse(system.work_is_done())
+
+    def test_submit_should_append_to_open_chains_in_fixed_pool_mode_till_system_is_closed(self):
+        # given
+        factory = proc_factory(yielding_is_on=False)
+        processor1 = proc_mock(factory)
+        processor2 = proc_mock(factory)
+        system = System(processors_count=2, processing_mode=ProcessingMode.FIXED_POOL_SIZE, proc_factory=factory)
+        executable1, executable2, executable3 = create_executables(3)
+
+        # when
+        system.open()
+        for executable in [executable1, executable2, executable3]:
+            system.submit(executable)
+
+        # then
+        processor1.assign.assert_called_once_with(KernelThread(ChainOfExecutables(executable1, executable3)))
+        processor2.assign.assert_called_once_with(KernelThread(ChainOfExecutables(executable2)))
+        self.assertFalse(system.work_is_done())
+
+    def test_tick_should_skip_processors_that_starved_and_log_them_idle(self):
+        # given
+        logger = Mock()
+        factory = ProcessorFactory()
+        system = System(
+            processors_count=3,
+            processing_mode=ProcessingMode.OVERLOADED_PROCESSORS,
+            proc_factory=factory,
+            logger=logger
+        )
+        system.publish(create_executables(2, ticks=2))
+
+        # when
+        system.tick(time_delta=TimeDelta(Duration(micros=10)))
+
+        # then
+        logger.log_processor_idle.assert_called_once_with(proc_number=2)
+        self.assertEqual([call(proc_number=0), call(proc_number=1)], logger.log_processor_tick.call_args_list)
+        self.assertFalse(system.work_is_done())
+
+        while not system.work_is_done():
+            system.tick(time_delta=TimeDelta(Duration(micros=10)))
+        logger.log_processor_tick.reset_mock()
+        system.tick(time_delta=TimeDelta(Duration(micros=10)))
+
+        logger.log_processor_tick.assert_not_called()
+        logger.log_processor_idle.assert_has_calls([call(proc_number=2), call(proc_number=0), call(proc_number=1)])
+
+    def test_partitions_should_split_executables_as_publish_does(self):
+        # given
+        system = System(
+            processors_count=2,
+            processing_mode=ProcessingMode.OVERLOADED_PROCESSORS,
+            proc_factory=ProcessorFactory()
+        )
+        executable1, executable2, executable3 = create_executables(3)
+
+        # when
+        partitions = system.partitions([executable1, executable2, executable3])
+
+        # then
+        self.assertEqual(
+            [[executable1, executable3], [executable2]],
+            [executables for _, executables in partitions]
+        )
+        self.assertEqual(system.processor_numbers(), [partition.processor_numbers()[0] for partition, _ in partitions])
+        for partition, _ in partitions:
+            self.assertEqual(ProcessingMode.OVERLOADED_PROCESSORS, partition.processing_mode)
+            self.assertEqual(1, len(partition.processor_numbers()))
+
     def test_work_is_done_should_return_false_if_processors_are_not_starving(self):
         # given
         factory = proc_factory(yielding_is_on=False)
@@ -137,7 +231,7 @@ def proc_factory(yielding_is_on: bool) -> ProcessorFactory:
     factory = ProcessorFactory()
     mocks = []
     factory.mocks = mocks
-    factory.new = lambda count, processing_interval, yielding: \
+    factory.new = lambda count, processing_interval, yielding, logger=None: \
         mocks \
             if count is len(mocks) and yielding == yielding_is_on \
             else None
@@ -146,7 +240,7 @@ def proc_factory(yielding_is_on: bool) -> ProcessorFactory:
 
 
 def proc_mock(factory: ProcessorFactory) -> Processor:
-    processor1 = Processor(processing_interval=Duration(20), proc_number=1, yielding=False)
+    processor1 = Processor(processing_interval=Duration(20), proc_number=1, yielding=False, logger=Mock())
     processor1.ticked = Mock()
     processor1.assign = Mock(wraps=processor1.assign)
     factory.mocks.append(processor1)
@@ -9,6 +9,7 @@ from src.saga.task import Task
 from src.sys.thread import KernelThread, ChainOfExecutables
 from src.sys.time.duration import Duration
 from src.sys.time.time import TimeDelta
+from src.sys.time.timer import WaitTimer
 from test.unit.sys.factories import create_executable
 
 
@@ -138,6 +139,38 @@ class TestKernelThread(TestCase):
         # then
         self.assertEqual(expected_result, thread.can_yield())
 
+    @parameterized.expand([
+        [0, False],
+        [1, False],
+        [2, True],
+        [3, False],
+        [4, False]
+    ])
+    @patch("src.sys.thread.thread_deallocation_cost")
+    @patch("src.sys.thread.thread_creation_cost")
+    def test_is_blocked_should_return_true_only_while_executable_has_nothing_to_run(
+            self,
+            ticks: int,
+            expected_result: bool,
+            thread_creation_cost_method,
+            thread_deallocation_cost_method,
+    ):
+        # given
+        given_logging_context_that_provides_logger()
+
+        thread_creation_cost_method.return_value = Duration(micros=1)
+        thread_deallocation_cost_method.return_value = Duration(micros=1)
+        executable = create_executable(ticks=1, waits=1)
+
+        thread = KernelThread(executable)
+
+        # when
+        for _ in range(ticks):
+            thread.ticked(time_delta=TimeDelta(Duration(micros=1)))
+
+        # then
+        self.assertEqual(expected_result, thread.is_blocked())
+
 
 class TestChainOfExecutables(TestCase):
     def test_is_finished_should_return_false_until_all_executables_are_finished(self):
@@ -165,6 +198,46 @@ class TestChainOfExecutables(TestCase):
         # then
         self.assertTrue(chain.is_finished())
 
+    def test_is_finished_should_return_false_for_open_chain_till_it_is_closed_and_drained(self):
+        # given
+        timer: WaitTimer = Mock()
+        ex1 = create_executable(ticks=1, identifier=1)
+        chain = ChainOfExecutables(closed=False)
+        chain.register_waits(timer)
+
+        # when
+        chain.append(ex1)
+
+        # then
+        ex1.register_waits.assert_called_once_with(timer)
+        self.assertFalse(chain.is_finished())
+
+        chain.ticked(TimeDelta(Duration(micros=1)))
+        self.assertFalse(chain.is_finished())
+        self.assertIsNone(chain.current_task())
+
+        chain.close()
+        self.assertTrue(chain.is_finished())
+        with self.assertRaises(ValueError):
+            chain.append(create_executable(ticks=1, identifier=2))
+
+    def test_register_waits_should_register_an_executable_only_when_it_becomes_current(self):
+        # given
+        timer: WaitTimer = Mock()
+        ex1 = create_executable(ticks=1, identifier=1)
+        ex2 = create_executable(ticks=1, identifier=2)
+        chain = ChainOfExecutables(ex1, ex2)
+
+        # when
+        chain.register_waits(timer)
+
+        # then
+        ex1.register_waits.assert_called_once_with(timer)
+        ex2.register_waits.assert_not_called()
+
+        chain.ticked(TimeDelta(Duration(micros=1)))
+        ex2.register_waits.assert_called_once_with(timer)
+
     def test_get_current_tasks_should_return_current_task_of_a_current_executable(self):
         # given
         ex1 = create_executable(ticks=2, identifier=1)
@@ -184,6 +257,26 @@ class TestChainOfExecutables(TestCase):
         # then
         self.assertEqual([expectedTask], actualTasks)
 
+    def test_current_task_should_be_provided_by_a_current_executable(self):
+        # given
+        ex1 = create_executable(ticks=1, identifier=1)
+        ex2 = create_executable(ticks=1, waits=1, identifier=2)
+
+        expectedTask: Task = Mock()
+        ex2.current_task = lambda: expectedTask
+
+        chain = ChainOfExecutables(ex1, ex2)
+
+        # when
+        chain.ticked(TimeDelta(Duration(micros=1)))
+
+        # then
+        self.assertEqual(expectedTask, chain.current_task())
+        self.assertTrue(chain.has_runnable_task())
+
+        chain.ticked(TimeDelta(Duration(micros=1)))
+        self.assertFalse(chain.has_runnable_task())
+
 
 def given_logging_context_that_provides_logger() -> Mock[TimeLogger]:
     logger: Mock[TimeLogger] = Mock()
@@ -1,6 +1,7 @@
 from typing import Any, List
 from unittest.case import TestCase
 
+import jsonpickle
 from parameterized import parameterized
 
 from src.sys.time.duration import Duration
@@ -212,3 +213,47 @@ class TestDuration(TestCase):
 
         # then
         self.assertEqual(expected, actual)
+
+    def test_add_should_not_modify_operands(self):
+        # given
+        duration = Duration(micros=5)
+        accumulated = duration
+
+        # when
+        accumulated += Duration(micros=3)
+
+        # then
+        self.assertEqual(Duration(micros=5), duration)
+        self.assertEqual(Duration(micros=8), accumulated)
+
+    def test_setting_micros_should_be_prohibited(self):
+        # given
+        duration = Duration.zero()
+
+        # when
+        try:
+            duration.micros = 5
+        # then
+        except AttributeError:
+            self.assertEqual(0, Duration.zero().micros)
+            return
+
+        self.fail("Should throw exception")
+
+    def test_equal_durations_should_have_equal_hashes(self):
+        # when
+        durations = {Duration(micros=7), Duration.of(7), Duration(micros=8)}
+
+        # then
+        self.assertEqual(2, len(durations))
+
+    def test_jsonpickle_should_restore_duration(self):
+        # given
+        encoded = '{"py/object": "src.sys.time.duration.Duration", "micros": 7}'
+
+        # when
+        decoded = jsonpickle.decode(encoded)
+
+        # then
+        self.assertEqual(Duration(micros=7), decoded)
+        self.assertEqual(Duration(micros=7), jsonpickle.decode(jsonpickle.encode(decoded)))
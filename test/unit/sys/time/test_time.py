@@ -27,3 +27,15 @@ class TestTimeDelta(TestCase):
 
         # then
         self.assertNotEqual(first_id, second_id)
+
+    def test_advance_should_provide_new_identifier(self):
+        # given
+        delta = TimeDelta(duration=Duration(micros=1))
+        identifier = delta.identifier
+
+        # when
+        delta.advance()
+
+        # then
+        self.assertGreater(delta.identifier, identifier)
+        self.assertEqual(Duration(micros=1), delta.duration)
@@ -0,0 +1,88 @@
+from typing import List
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from src.sys.time.duration import Duration
+from src.sys.time.timer import WaitTimer, Waiting, NotifyingTimer
+
+
+class TestWaitTimer(TestCase):
+    def test_wake_up_due_should_wake_up_only_those_whose_wait_ended(self):
+        # given
+        timer = WaitTimer()
+        waiting1, waiting2 = waitings(2)
+        timer.schedule(waiting1, Duration(micros=2))
+        timer.schedule(waiting2, Duration(micros=5))
+
+        # when
+        timer.shift(Duration(micros=1))
+        timer.wake_up_due()
+        timer.shift(Duration(micros=1))
+        timer.wake_up_due()
+
+        # then
+        waiting1.wake_up.assert_called_once_with()
+        waiting2.wake_up.assert_not_called()
+        self.assertEqual(1, len(timer))
+
+    def test_wake_up_due_should_wake_up_in_the_order_of_wait_ends(self):
+        # given
+        timer = WaitTimer()
+        woken: List[str] = []
+        waiting1, waiting2, waiting3 = waitings(3)
+        waiting1.wake_up = lambda: woken.append("1")
+        waiting2.wake_up = lambda: woken.append("2")
+        waiting3.wake_up = lambda: woken.append("3")
+
+        timer.schedule(waiting1, Duration(micros=7))
+        timer.schedule(waiting2, Duration(micros=3))
+        timer.shift(Duration(micros=1))
+        timer.schedule(waiting3, Duration(micros=2))
+
+        # when
+        timer.shift(Duration(micros=10))
+        timer.wake_up_due()
+
+        # then
+        self.assertEqual(["2", "3", "1"], woken)
+        self.assertEqual(0, len(timer))
+
+    def test_next_wake_up_in_should_return_time_till_the_earliest_wait_end(self):
+        # given
+        timer = WaitTimer()
+        waiting1, waiting2 = waitings(2)
+
+        # then
+        self.assertIsNone(timer.next_wake_up_in())
+
+        timer.schedule(waiting1, Duration(micros=8))
+        timer.schedule(waiting2, Duration(micros=5))
+        self.assertEqual(Duration(micros=5), timer.next_wake_up_in())
+
+        timer.shift(Duration(micros=3))
+        self.assertEqual(Duration(micros=2), timer.next_wake_up_in())
+        self.assertEqual(Duration(micros=3), timer.now)
+
+
+
+class TestNotifyingTimer(TestCase):
+    def test_wake_up_due_should_notify_after_waking_up_waitings_scheduled_through_it(self):
+        # given
+        timer = WaitTimer()
+        manager = Mock()
+        waiting1, waiting2 = waitings(2)
+        manager.attach_mock(waiting1.wake_up, "wake_up1")
+        NotifyingTimer(timer, on_wake=manager.notified).schedule(waiting1, Duration(micros=1))
+        timer.schedule(waiting2, Duration(micros=1))
+
+        # when
+        timer.shift(Duration(micros=1))
+        timer.wake_up_due()
+
+        # then
+        self.assertEqual([call.wake_up1(), call.notified()], manager.mock_calls)
+        waiting2.wake_up.assert_called_once_with()
+        self.assertEqual(0, len(timer))
+
+def waitings(count: int) -> List[Waiting]:
+    return [Mock(name=f"waiting{i}") for i in range(count)]
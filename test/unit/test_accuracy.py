@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from src.accuracy import TickAccuracy
+from src.log import Report, Percentage
+from src.sys.time.duration import Duration
+
+
+class TestTickAccuracy(TestCase):
+    def test_of_should_compute_relative_errors_against_exact_report(self):
+        # given
+        exact = create_report(duration=100, processing=50.0, waiting=40.0, overhead=10.0)
+        coarse = create_report(duration=110, processing=45.0, waiting=40.0, overhead=15.0)
+
+        # when
+        accuracy = TickAccuracy.of(tick_length=Duration(micros=10), exact=exact, coarse=coarse)
+
+        # then
+        self.assertEqual(Duration(micros=10), accuracy.tick_length)
+        self.assertAlmostEqual(0.1, accuracy.simulation_duration_error)
+        self.assertAlmostEqual(0.1, accuracy.processing_percentage_error)
+        self.assertAlmostEqual(0.0, accuracy.waiting_percentage_error)
+        self.assertAlmostEqual(0.5, accuracy.overhead_percentage_error)
+
+    def test_of_should_report_infinite_error_only_when_exact_value_is_zero_and_coarse_is_not(self):
+        # given
+        exact = create_report(duration=100, processing=60.0, waiting=40.0, overhead=0.0)
+        same = create_report(duration=100, processing=60.0, waiting=40.0, overhead=0.0)
+        with_overhead = create_report(duration=100, processing=60.0, waiting=39.0, overhead=1.0)
+
+        # when
+        same_accuracy = TickAccuracy.of(tick_length=Duration(micros=10), exact=exact, coarse=same)
+        overhead_accuracy = TickAccuracy.of(tick_length=Duration(micros=10), exact=exact, coarse=with_overhead)
+
+        # then
+        self.assertEqual(0.0, same_accuracy.overhead_percentage_error)
+        self.assertEqual(float("inf"), overhead_accuracy.overhead_percentage_error)
+
+
+def create_report(duration: int, processing: float, waiting: float, overhead: float) -> Report:
+    return Report(
+        log_name="test",
+        simulation_duration=Duration(micros=duration),
+        avg_processor_task_handling=Duration(micros=1),
+        processor_task_handling_percentage=Percentage(processing),
+        avg_processor_waiting=Duration(micros=1),
+        processor_waiting_percentage=Percentage(waiting),
+        avg_processor_overhead_work=Duration(micros=1),
+        processor_overhead_work_percentage=Percentage(overhead)
+    )
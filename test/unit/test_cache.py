@@ -0,0 +1,135 @@
+from os import utime
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import Optional
+from dataclasses import dataclass
+from unittest import TestCase
+
+from src.cache import ReportCache
+from src.log import Report, Percentage, SchedulingReport
+from src.sys.time.duration import Duration
+
+
+class TestReportCache(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, "cache")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_should_return_stored_report(self):
+        # given
+        cache = ReportCache(directory=self.path)
+        cache.put("key", create_report())
+
+        # when
+        actual = cache.get("key")
+
+        # then
+        self.assertEqual(create_report(), actual)
+        self.assertIsNone(cache.get("other"))
+
+    def test_get_should_return_stored_report_with_scheduling(self):
+        # given
+        cache = ReportCache(directory=self.path)
+        cache.put("key", create_report(scheduling=create_scheduling_report()))
+
+        # when
+        actual = cache.get("key")
+
+        # then
+        self.assertIsNotNone(actual)
+        self.assertEqual(create_report(scheduling=create_scheduling_report()), actual)
+        self.assertEqual(1, len(cache))
+
+    def test_get_should_discard_invalid_entries(self):
+        # given
+        cache = ReportCache(directory=self.path)
+        cache.put("key", "summary")
+        with open(join(self.path, "key.report.json"), mode="w") as file:
+            file.write("{broken")
+
+        # when
+        actual = cache.get("key")
+
+        # then
+        self.assertIsNone(actual)
+        self.assertEqual(0, len(cache))
+
+    def test_get_should_propagate_unexpected_decoding_errors(self):
+        # given
+        cache = ReportCache(directory=self.path)
+        cache.put("key", Frozen(value=1))
+
+        # when
+        try:
+            cache.get("key")
+        # then
+        except Exception:
+            self.assertEqual(1, len(cache))
+            return
+
+        self.fail("Should throw exception")
+
+    def test_put_should_evict_least_recently_used_entries(self):
+        # given
+        cache = ReportCache(directory=self.path, max_bytes=1024)
+        for i, key in enumerate(["a", "b"]):
+            cache.put(key, "x" * 400)
+            utime(join(self.path, f"{key}.report.json"), ns=(i, i))
+
+        # when
+        cache.get("a")
+        cache.put("c", "x" * 400)
+
+        # then
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual("x" * 400, cache.get("a"))
+        self.assertEqual("x" * 400, cache.get("c"))
+
+    def test_init_should_fail_if_size_is_not_positive(self):
+        # when
+        try:
+            ReportCache(directory=self.path, max_bytes=0)
+        # then
+        except ValueError:
+            return
+
+        self.fail("Should throw exception")
+
+
+@dataclass(frozen=True)
+class Frozen:
+    value: int
+
+
+def create_report(scheduling: Optional[SchedulingReport] = None) -> Report:
+    return Report(
+        log_name="test",
+        simulation_duration=Duration(micros=10),
+        avg_processor_task_handling=Duration(micros=5),
+        processor_task_handling_percentage=Percentage(50.0),
+        avg_processor_waiting=Duration(micros=3),
+        processor_waiting_percentage=Percentage(30.0),
+        avg_processor_overhead_work=Duration(micros=2),
+        processor_overhead_work_percentage=Percentage(20.0),
+        latency_p50=Duration(micros=4),
+        scheduling=scheduling
+    )
+
+
+def create_scheduling_report() -> SchedulingReport:
+    return SchedulingReport(
+        avg_run_queue_length=1.5,
+        max_run_queue_length=3,
+        voluntary_context_switches=2,
+        involuntary_context_switches=1,
+        scheduling_delay_p50=Duration.zero(),
+        scheduling_delay_p99=Duration(micros=11),
+        scheduling_delay_max=Duration(micros=11),
+        thread_lifetime_p50=Duration(micros=7),
+        thread_lifetime_p99=Duration(micros=11),
+        thread_lifetime_max=Duration(micros=11)
+    )
@@ -0,0 +1,122 @@
+from dataclasses import replace
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.cost import CostModel, SimulationCost, predicted_makespan
+
+
+class TestCostModel(TestCase):
+    def test_estimate_should_grow_with_simulated_work_without_history(self):
+        # given
+        model = CostModel()
+
+        # when
+        small = model.estimate(create_cost(number_of_sagas=50, processors=4, operation_micros=1_000))
+        large = model.estimate(create_cost(number_of_sagas=1500, processors=4, operation_micros=30_000))
+        more_processors = model.estimate(create_cost(number_of_sagas=1500, processors=80, operation_micros=30_000))
+
+        # then
+        self.assertLess(small, large)
+        self.assertLess(large, more_processors)
+
+    def test_estimate_should_shrink_with_coarser_ticks_without_history(self):
+        # given
+        model = CostModel()
+        fine = create_cost(number_of_sagas=50, processors=4, operation_micros=1_000)
+
+        # when
+        fine_estimate = model.estimate(fine)
+        coarse_estimate = model.estimate(replace(fine, tick_micros=10))
+
+        # then
+        self.assertLess(coarse_estimate, fine_estimate)
+
+    def test_estimate_should_rank_orchestrators_and_engines_without_history(self):
+        # given
+        model = CostModel()
+        cost = create_cost(number_of_sagas=50, processors=4, operation_micros=1_000)
+
+        # when
+        fixed_events = model.estimate(replace(cost, orchestrator="FIXED_POOL_SIZE"))
+        yielding_events = model.estimate(replace(cost, orchestrator="YIELDING_PROCESSORS"))
+        fixed_ticks = model.estimate(replace(cost, orchestrator="FIXED_POOL_SIZE", engine="TICKS"))
+
+        # then
+        self.assertLess(fixed_events, yielding_events)
+        self.assertLess(yielding_events, fixed_ticks)
+
+    def test_estimate_should_scale_prior_by_timings_recorded_for_other_orchestrators(self):
+        # given
+        model = CostModel()
+        recorded = replace(create_cost(number_of_sagas=50, processors=4, operation_micros=1_000), engine="TICKS")
+        model.record(recorded, seconds=recorded.prior_seconds() * 10)
+
+        estimated = create_cost(number_of_sagas=100, processors=4, operation_micros=2_000)
+
+        # when
+        actual = model.estimate(estimated)
+
+        # then
+        self.assertAlmostEqual(estimated.prior_seconds() * 10, actual)
+
+    def test_estimate_should_scale_prior_by_recorded_timings(self):
+        # given
+        model = CostModel()
+        recorded = create_cost(number_of_sagas=50, processors=4, operation_micros=1_000)
+        model.record(recorded, seconds=recorded.prior_seconds() * 10)
+
+        estimated = create_cost(number_of_sagas=100, processors=4, operation_micros=2_000)
+
+        # when
+        actual = model.estimate(estimated)
+
+        # then
+        self.assertAlmostEqual(estimated.prior_seconds() * 10, actual)
+
+    def test_estimate_should_fit_recorded_timings_of_the_same_orchestrator(self):
+        # given
+        model = CostModel()
+        for sagas in [10, 20, 40, 80, 160]:
+            for processors in [2, 4, 8]:
+                model.record(
+                    create_cost(number_of_sagas=sagas, processors=processors, operation_micros=sagas * 1_000),
+                    seconds=0.001 * sagas * processors
+                )
+
+        # when
+        actual = model.estimate(create_cost(number_of_sagas=320, processors=4, operation_micros=320_000))
+
+        # then
+        self.assertAlmostEqual(1.28, actual, delta=0.05)
+
+    def test_history_should_be_restored_from_file(self):
+        # given
+        with TemporaryDirectory() as directory:
+            path = join(directory, "out", "timings.jsonl")
+            cost = create_cost(number_of_sagas=50, processors=4, operation_micros=1_000)
+            CostModel(history_path=path).record(cost, seconds=3.0)
+
+            # when
+            actual = CostModel(history_path=path).estimate(cost)
+
+        # then
+        self.assertAlmostEqual(3.0, actual)
+
+
+class TestPredictedMakespan(TestCase):
+    def test_should_assign_longest_jobs_first_to_least_loaded_workers(self):
+        # then
+        self.assertEqual(7.0, predicted_makespan([3.0, 3.0, 2.0, 2.0, 2.0, 2.0], workers=2))
+        self.assertEqual(14.0, predicted_makespan([3.0, 3.0, 2.0, 2.0, 2.0, 2.0], workers=1))
+        self.assertEqual(0.0, predicted_makespan([], workers=4))
+
+
+def create_cost(number_of_sagas: int, processors: int, operation_micros: int) -> SimulationCost:
+    return SimulationCost(
+        orchestrator="coroutines",
+        engine="EVENTS",
+        number_of_sagas=number_of_sagas,
+        processors=processors,
+        operation_micros=operation_micros
+    )
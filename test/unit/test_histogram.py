@@ -0,0 +1,59 @@
+from random import Random
+from unittest import TestCase
+
+from src.histogram import LatencyHistogram
+from src.sys.time.duration import Duration
+
+
+class TestLatencyHistogram(TestCase):
+    def test_percentile_should_be_exact_for_small_values(self):
+        # given
+        histogram = LatencyHistogram()
+        for micros in range(1, 101):
+            histogram.record(Duration(micros=micros))
+
+        # then
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(Duration(micros=50), histogram.percentile(50))
+        self.assertEqual(Duration(micros=99), histogram.percentile(99))
+        self.assertEqual(Duration(micros=100), histogram.percentile(100))
+        self.assertEqual(Duration(micros=100), histogram.max)
+
+    def test_percentile_should_stay_within_relative_precision_for_large_values(self):
+        # given
+        rand = Random(3)
+        values = sorted(rand.randrange(1, 10 ** 9) for _ in range(10_000))
+        histogram = LatencyHistogram()
+        for micros in values:
+            histogram.record_micros(micros)
+
+        # then
+        for percentile in [50, 90, 99, 99.9]:
+            exact = values[int(-(-percentile * len(values) // 100)) - 1]
+            self.assertAlmostEqual(exact, histogram.percentile(percentile).micros, delta=exact / 128)
+        self.assertEqual(Duration(micros=values[-1]), histogram.max)
+        self.assertLess(len(histogram._counts), 3000)
+
+    def test_merge_should_count_values_of_both_histograms(self):
+        # given
+        first = LatencyHistogram()
+        second = LatencyHistogram()
+        together = LatencyHistogram()
+        for micros in [3, 500, 70_000]:
+            first.record_micros(micros)
+            together.record_micros(micros)
+        for micros in [9, 1_000_000]:
+            second.record_micros(micros)
+            together.record_micros(micros)
+
+        # when
+        first.merge(second)
+
+        # then
+        self.assertEqual(together, first)
+        self.assertEqual(5, first.count)
+
+    def test_percentile_should_be_none_for_empty_histogram(self):
+        # then
+        self.assertIsNone(LatencyHistogram().percentile(50))
+        self.assertIsNone(LatencyHistogram().max)
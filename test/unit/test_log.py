@@ -7,7 +7,9 @@ from unittest.case import TestCase
 from unittest.mock import patch, Mock, ANY, call
 from uuid import uuid4
 
-from src.log import TimeLogger, LogContext, Report, Percentage, ProcessorNumber, print_coloured
+from src.histogram import LatencyHistogram
+from src.log import TimeLogger, LogContext, Report, Percentage, ProcessorNumber, print_coloured, LoggingLevel, \
+    CountingLogger, NullLogger, ProcessorLog, SchedulingLog, SchedulingReport, TracingLogger
 from src.sys.time.duration import Duration
 
 
@@ -80,6 +82,54 @@ class TestLogContext(TestCase):
         # then
         logger.shift_time.assert_called_with()
 
+    def test_run_logging_should_provide_logger_of_the_requested_level(self):
+        # given
+        loggers: List[Any] = []
+
+        # when
+        for level in LoggingLevel:
+            LogContext.run_logging(
+                log_name="test",
+                action=lambda: loggers.append(LogContext.logger()),
+                report_publisher=lambda report: None,
+                level=level
+            )
+
+        # then
+        self.assertEqual([TimeLogger, CountingLogger, NullLogger], [type(logger) for logger in loggers])
+
+    def test_run_logging_should_not_publish_reports_without_logging(self):
+        # given
+        report_publisher: Mock[Callable[[Report], None]] = Mock()
+
+        # when
+        actual = LogContext.run_logging(
+            log_name="test",
+            action=lambda: log_processor_tick_and_return(proc_number=ProcessorNumber(2), to_return="expected"),
+            report_publisher=report_publisher,
+            level=LoggingLevel.NONE
+        )
+
+        # then
+        self.assertEqual("expected", actual)
+        report_publisher.assert_not_called()
+
+    def test_run_logging_should_provide_and_close_the_given_logger(self):
+        # given
+        logger: Mock[TimeLogger] = Mock()
+
+        # when
+        actual = LogContext.run_logging(
+            log_name="test",
+            action=lambda: log_processor_tick_and_return(proc_number=ProcessorNumber(2), to_return="expected"),
+            logger=logger
+        )
+
+        # then
+        logger.log_processor_tick.assert_called_with(proc_number=2)
+        logger.close.assert_called_once()
+        self.assertEqual("expected", actual)
+
 
 def log_processor_tick_and_return(proc_number: ProcessorNumber, to_return: Any) -> Any:
     LogContext.logger().log_processor_tick(proc_number=proc_number)
@@ -334,6 +384,405 @@ class TestTimeLogger(TestCase):
             ))
         ])
 
+    def test_publish_report_every_should_publish_at_the_tick_crossing_the_report_instant(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", publish_report_every=Duration(micros=4), report_publisher=reports.append)
+        logger.set_tick_length(Duration(micros=3))
+
+        # when
+        time_to_next_report = []
+        for _ in range(4):
+            logger.log_processor_tick(proc_number=1)
+            logger.shift_time()
+            time_to_next_report.append(logger.time_to_next_report())
+
+        # then
+        self.assertEqual(
+            [Duration(micros=4), Duration(micros=10), Duration(micros=13)],
+            [report.simulation_duration for report in reports]
+        )
+        self.assertEqual(
+            [Duration(micros=4), Duration(micros=1), Duration(micros=2), Duration(micros=3)],
+            time_to_next_report
+        )
+
+
+class TestLatencies(TestCase):
+    def test_close_should_report_latencies_of_sagas_from_their_start_till_the_end_of_the_tick_they_finished(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        logger.log_processor_tick(proc_number=1)
+        logger.log_saga_finished(started=Duration.zero())
+        logger.shift_time()
+        logger.set_tick_length(Duration(micros=10))
+        logger.log_processor_tick(proc_number=1)
+        logger.log_saga_finished(started=Duration.zero())
+        logger.log_saga_finished(started=Duration(micros=3))
+        logger.shift_time()
+        logger.close()
+
+        # then
+        self.assertEqual(
+            [Duration(micros=8), Duration(micros=11), Duration(micros=11), Duration(micros=11), Duration(micros=11)],
+            [reports[0].latency_p50, reports[0].latency_p90, reports[0].latency_p99, reports[0].latency_p999,
+             reports[0].latency_max]
+        )
+
+    def test_close_should_report_no_latencies_when_no_saga_finished(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        logger.log_processor_tick(proc_number=1)
+        logger.shift_time()
+        logger.close()
+
+        # then
+        self.assertIsNone(reports[0].latency_p50)
+        self.assertIsNone(reports[0].latency_max)
+
+    def test_merge_should_report_latencies_of_all_processors(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", report_publisher=reports.append)
+        first = LatencyHistogram()
+        first.record(Duration(micros=4))
+        second = LatencyHistogram()
+        second.record(Duration(micros=9))
+
+        # when
+        logger.merge([
+            ProcessorLog(processor_number=ProcessorNumber(1), duration=Duration(micros=5), sums={}, latencies=first),
+            ProcessorLog(processor_number=ProcessorNumber(2), duration=Duration(micros=9), sums={}, latencies=second)
+        ])
+        logger.close()
+
+        # then
+        self.assertEqual(Duration(micros=4), reports[0].latency_p50)
+        self.assertEqual(Duration(micros=9), reports[0].latency_max)
+
+
+class TestScheduling(TestCase):
+    def test_close_should_report_run_queue_context_switches_and_thread_lifetimes(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        logger.log_processor_tick(proc_number=1)
+        logger.log_thread_queued(proc_number=1, queue_length=1)
+        logger.log_thread_dispatched(proc_number=1, delay=Duration.zero())
+        logger.log_thread_queued(proc_number=1, queue_length=1)
+        logger.shift_time()
+        logger.set_tick_length(Duration(micros=10))
+        logger.log_processor_tick(proc_number=1)
+        logger.log_context_switch(proc_number=1, voluntary=True)
+        logger.log_thread_queued(proc_number=1, queue_length=2)
+        logger.log_thread_dispatched(proc_number=1, delay=Duration(micros=11))
+        logger.log_context_switch(proc_number=1, voluntary=False)
+        logger.log_thread_finished(proc_number=1, lifetime=Duration(micros=11))
+        logger.shift_time()
+        logger.close()
+
+        # then
+        self.assertEqual(
+            SchedulingReport(
+                avg_run_queue_length=1.0,
+                max_run_queue_length=2,
+                voluntary_context_switches=1,
+                involuntary_context_switches=1,
+                scheduling_delay_p50=Duration.zero(),
+                scheduling_delay_p99=Duration(micros=11),
+                scheduling_delay_max=Duration(micros=11),
+                thread_lifetime_p50=Duration(micros=11),
+                thread_lifetime_p99=Duration(micros=11),
+                thread_lifetime_max=Duration(micros=11)
+            ),
+            reports[0].scheduling
+        )
+
+    def test_close_should_report_no_scheduling_when_no_thread_was_queued(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        logger.log_processor_tick(proc_number=1)
+        logger.shift_time()
+        logger.close()
+
+        # then
+        self.assertIsNone(reports[0].scheduling)
+
+    def test_merge_should_average_run_queue_length_over_all_processors(self):
+        # given
+        reports: List[Report] = []
+        logger = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        logger.merge([
+            ProcessorLog(processor_number=ProcessorNumber(1), duration=Duration(micros=10), sums={},
+                         scheduling=SchedulingLog(max_queue_length=3, queued_micros=10, voluntary_switches=2)),
+            ProcessorLog(processor_number=ProcessorNumber(2), duration=Duration(micros=10), sums={},
+                         scheduling=SchedulingLog(max_queue_length=1, queued_micros=5, involuntary_switches=1))
+        ])
+        logger.close()
+
+        # then
+        self.assertEqual(0.75, reports[0].scheduling.avg_run_queue_length)
+        self.assertEqual(3, reports[0].scheduling.max_run_queue_length)
+        self.assertEqual(2, reports[0].scheduling.voluntary_context_switches)
+        self.assertEqual(1, reports[0].scheduling.involuntary_context_switches)
+
+
+class TestCountingLogger(TestCase):
+    def test_close_should_report_the_same_as_time_logger(self):
+        # given
+        reports: List[Report] = []
+        loggers = [
+            TimeLogger(name="logger", publish_report_every=Duration(micros=3), report_publisher=reports.append),
+            CountingLogger(name="logger", publish_report_every=Duration(micros=3), report_publisher=reports.append)
+        ]
+
+        # when
+        for logger in loggers:
+            logger.set_tick_length(Duration(micros=2))
+            logger.log_processor_tick(proc_number=5)
+            log_random_task_processing(logger)
+            logger.log_processor_tick(proc_number=3)
+            logger.shift_time()
+
+            logger.log_processor_tick(proc_number=5)
+            logger.log_processor_tick(proc_number=3)
+            logger.log_overhead_tick()
+            logger.shift_time()
+
+            logger.log_processor_tick(proc_number=5)
+            log_random_task_processing(logger)
+            logger.log_processor_tick(proc_number=3)
+            log_random_task_processing(logger)
+            logger.close()
+
+        # then
+        self.assertEqual(4, len(reports))
+        self.assertEqual(reports[:2], reports[2:])
+        self.assertEqual(Duration(micros=3), reports[1].avg_processor_task_handling)
+        self.assertEqual(Duration(micros=1), reports[1].avg_processor_overhead_work)
+
+
+class TestIdleProcessors(TestCase):
+    def test_idle_processor_should_report_the_same_as_ticking_it_without_work(self):
+        for logger_class in [TimeLogger, CountingLogger]:
+            # given
+            reports: List[Report] = []
+            ticked, idle = [
+                logger_class(name="logger", publish_report_every=Duration(micros=4), report_publisher=reports.append)
+                for _ in range(2)
+            ]
+
+            # when
+            for tick in range(6):
+                for logger in [ticked, idle]:
+                    logger.set_tick_length(Duration(micros=1 + tick % 2))
+                    logger.log_processor_tick(proc_number=5)
+                    log_random_task_processing(logger)
+
+                    if tick == 1:
+                        idle.log_processor_idle(proc_number=3)
+                    if tick == 4:
+                        idle.log_processor_active(proc_number=3)
+                    if logger is ticked or not 1 <= tick < 4:
+                        logger.log_processor_tick(proc_number=3)
+                        if tick == 0 or tick == 5:
+                            logger.log_overhead_tick()
+                    logger.shift_time()
+
+            ticked.close()
+            idle.close()
+
+            # then
+            self.assertEqual(6, len(reports))
+            self.assertEqual(reports[0::2], reports[1::2])
+            self.assertEqual(ticked.sums(), idle.sums())
+
+
+class TestMerge(TestCase):
+    def test_merge_should_report_the_same_as_ticking_processors_together(self):
+        # given
+        reports: List[Report] = []
+        together = TimeLogger(name="logger", report_publisher=reports.append)
+        apart = [
+            CountingLogger(name="logger", report_publisher=reports.append),
+            CountingLogger(name="logger", report_publisher=reports.append)
+        ]
+        merged = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        together.log_processor_tick(proc_number=1)
+        log_random_task_processing(together)
+        together.log_processor_tick(proc_number=2)
+        together.log_overhead_tick()
+        together.shift_time()
+        together.log_processor_tick(proc_number=1)
+        together.log_processor_tick(proc_number=2)
+        log_random_task_processing(together)
+        together.shift_time()
+        together.close()
+
+        apart[0].log_processor_tick(proc_number=1)
+        log_random_task_processing(apart[0])
+        apart[0].shift_time()
+
+        apart[1].log_processor_tick(proc_number=2)
+        apart[1].log_overhead_tick()
+        apart[1].shift_time()
+        apart[1].log_processor_tick(proc_number=2)
+        log_random_task_processing(apart[1])
+        apart[1].shift_time()
+
+        merged.merge([
+            ProcessorLog(processor_number=ProcessorNumber(1), duration=Duration(micros=1), sums=apart[0].sums()),
+            ProcessorLog(processor_number=ProcessorNumber(2), duration=Duration(micros=2), sums=apart[1].sums())
+        ])
+        merged.close()
+
+        # then
+        self.assertEqual(reports[0], reports[1])
+
+    def test_processor_log_of_should_count_the_rest_of_duration_as_waiting(self):
+        # given
+        reports: List[Report] = []
+        ticked = CountingLogger(name="logger", report_publisher=reports.append)
+        merged = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        ticked.log_processor_tick(proc_number=1)
+        ticked.log_overhead_tick()
+        ticked.shift_time()
+        ticked.log_processor_tick(proc_number=1)
+        log_random_task_processing(ticked)
+        ticked.shift_time()
+        ticked.log_processor_tick(proc_number=1)
+        ticked.shift_time()
+        ticked.close()
+
+        merged.merge([ProcessorLog.of(
+            processor_number=ProcessorNumber(1),
+            duration=Duration(micros=3),
+            processing=Duration(micros=1),
+            overhead=Duration(micros=1)
+        )])
+        merged.close()
+
+        # then
+        self.assertEqual(reports[0], reports[1])
+
+
+class TestTracingLogger(TestCase):
+    def test_close_should_write_spans_of_the_same_action_and_saga_in_consecutive_ticks(self):
+        # given
+        writer = Mock()
+        logger = TracingLogger(logger=NullLogger(), writer=writer)
+
+        # when
+        logger.set_tick_length(Duration(micros=2))
+        for _ in range(2):
+            logger.log_processor_tick(proc_number=ProcessorNumber(1))
+            logger.log_task_processing(name="task", identifier=uuid4(), saga="saga1")
+            logger.log_processor_tick(proc_number=ProcessorNumber(2))
+            logger.log_overhead_tick()
+            logger.shift_time()
+        logger.log_processor_tick(proc_number=ProcessorNumber(1))
+        logger.log_task_processing(name="task", identifier=uuid4(), saga="saga2")
+        logger.log_processor_tick(proc_number=ProcessorNumber(2))
+        logger.shift_time()
+        logger.close()
+
+        # then
+        self.assertEqual(
+            [
+                call.write_span(1, "processing", 0, 4, "saga1"),
+                call.write_span(2, "overhead", 0, 4, None),
+                call.write_span(1, "processing", 4, 2, "saga2"),
+                call.write_span(2, "waiting", 4, 2, None),
+                call.close()
+            ],
+            writer.method_calls
+        )
+
+    def test_close_should_not_join_spans_of_processor_that_was_idle_between_them(self):
+        # given
+        writer = Mock()
+        logger = TracingLogger(logger=NullLogger(), writer=writer)
+
+        # when
+        logger.log_processor_tick(proc_number=ProcessorNumber(1))
+        logger.log_overhead_tick()
+        logger.shift_time()
+        logger.log_processor_idle(proc_number=ProcessorNumber(1))
+        logger.shift_time()
+        logger.log_processor_active(proc_number=ProcessorNumber(1))
+        logger.log_processor_tick(proc_number=ProcessorNumber(1))
+        logger.log_overhead_tick()
+        logger.shift_time()
+        logger.close()
+
+        # then
+        self.assertEqual(
+            [call.write_span(1, "overhead", 0, 1, None), call.write_span(1, "overhead", 2, 1, None), call.close()],
+            writer.method_calls
+        )
+
+    def test_should_log_everything_to_the_traced_logger(self):
+        # given
+        reports: List[Report] = []
+        traced = TracingLogger(logger=TimeLogger(name="logger", report_publisher=reports.append), writer=Mock())
+        untraced = TimeLogger(name="logger", report_publisher=reports.append)
+
+        # when
+        for logger in [traced, untraced]:
+            logger.log_processor_tick(proc_number=ProcessorNumber(1))
+            logger.log_thread_queued(proc_number=ProcessorNumber(1), queue_length=1)
+            logger.log_thread_dispatched(proc_number=ProcessorNumber(1), delay=Duration.zero())
+            logger.log_task_processing(name="task", identifier=uuid4(), saga="saga")
+            logger.log_saga_finished(started=Duration.zero())
+            logger.log_processor_tick(proc_number=ProcessorNumber(2))
+            logger.log_overhead_tick()
+            logger.shift_time()
+            logger.merge([ProcessorLog(processor_number=ProcessorNumber(3), duration=Duration(micros=2), sums={})])
+            logger.close()
+
+        # then
+        self.assertEqual(reports[0], reports[1])
+
+    @patch("src.log.TimeLogger")
+    def test_run_logging_should_trace_to_given_writer(self, time_logger_class):
+        # given
+        logger: Mock[TimeLogger] = Mock()
+        time_logger_class.return_value = logger
+        writer = Mock()
+
+        # when
+        LogContext.run_logging(
+            log_name="test",
+            action=lambda: [
+                log_processor_tick_and_return(proc_number=ProcessorNumber(2), to_return="expected"),
+                LogContext.shift_time()
+            ],
+            trace=writer
+        )
+
+        # then
+        logger.log_processor_tick.assert_called_with(proc_number=2)
+        writer.write_span.assert_called_once_with(2, "waiting", 0, 1, None)
+        writer.close.assert_called_once()
+        logger.close.assert_called_once()
+
 
 def log_random_task_processing(logger: TimeLogger):
     logger.log_task_processing(name=f"task{uuid4()}", identifier=uuid4())
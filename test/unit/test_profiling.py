@@ -0,0 +1,67 @@
+from os.path import exists, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.profiling import profiled, profile_summary
+
+
+class TestProfiling(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.profile_path = join(self.directory.name, "simulation.prof")
+        self.snapshot_path = join(self.directory.name, "simulation.snapshot")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_profiled_should_return_result_of_action_and_leave_its_profile(self):
+        # when
+        result = profiled(action=allocate_numbers, profile_path=self.profile_path)
+
+        # then
+        self.assertEqual(1000, len(result))
+        self.assertTrue(exists(self.profile_path))
+        self.assertFalse(exists(self.snapshot_path))
+
+    def test_profiled_should_leave_profile_when_action_fails(self):
+        # when
+        with self.assertRaises(ValueError):
+            profiled(action=fail, profile_path=self.profile_path, snapshot_path=self.snapshot_path)
+
+        # then
+        self.assertTrue(exists(self.profile_path))
+        self.assertTrue(exists(self.snapshot_path))
+
+    def test_profile_summary_should_list_top_functions_and_allocation_sites(self):
+        # given
+        kept = profiled(action=allocate_numbers, profile_path=self.profile_path, snapshot_path=self.snapshot_path)
+
+        # when
+        summary = profile_summary(self.profile_path, self.snapshot_path, top=3)
+
+        # then
+        lines = summary.split("\n")
+        self.assertEqual(8, len(lines))
+        self.assertTrue(lines[0].startswith("Top functions by cumulative time"))
+        self.assertIn("(allocate_numbers)", summary)
+        self.assertTrue(lines[4].startswith("Top allocation sites"))
+        self.assertIn(__file__, lines[5])
+        self.assertEqual(1000, len(kept))
+
+    def test_profile_summary_should_list_only_functions_without_snapshot(self):
+        # given
+        profiled(action=allocate_numbers, profile_path=self.profile_path)
+
+        # when
+        summary = profile_summary(self.profile_path)
+
+        # then
+        self.assertNotIn("allocation", summary)
+
+
+def allocate_numbers():
+    return [str(number) for number in range(1000)]
+
+
+def fail():
+    raise ValueError("failed")
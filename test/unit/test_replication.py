@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from src.replication import Estimate, ReplicatedReport, replications_needed
+from test.unit.test_accuracy import create_report
+
+
+class TestEstimate(TestCase):
+    def test_of_should_compute_the_95_percent_interval_of_the_mean(self):
+        # when
+        estimate = Estimate.of([10.0, 12.0, 14.0])
+
+        # then
+        self.assertAlmostEqual(12.0, estimate.mean)
+        self.assertAlmostEqual(12.0 - 4.303 * 2 / 3 ** 0.5, estimate.low)
+        self.assertAlmostEqual(12.0 + 4.303 * 2 / 3 ** 0.5, estimate.high)
+        self.assertAlmostEqual(2 * 4.303 * 2 / 3 ** 0.5 / 12.0, estimate.relative_width)
+
+    def test_of_should_leave_the_interval_unbounded_for_a_single_sample(self):
+        # when
+        estimate = Estimate.of([10.0])
+
+        # then
+        self.assertEqual(10.0, estimate.mean)
+        self.assertEqual(float("inf"), estimate.relative_width)
+
+    def test_of_should_reject_no_samples(self):
+        # when / then
+        with self.assertRaises(ValueError):
+            Estimate.of([])
+
+
+class TestReplicatedReport(TestCase):
+    def test_of_should_estimate_every_measure_across_replications(self):
+        # given
+        reports = [
+            create_report(duration=100, processing=50.0, waiting=40.0, overhead=10.0),
+            create_report(duration=110, processing=60.0, waiting=30.0, overhead=10.0)
+        ]
+
+        # when
+        replicated = ReplicatedReport.of(log_name="test", reports=reports)
+
+        # then
+        self.assertEqual("test", replicated.log_name)
+        self.assertEqual(2, replicated.replications)
+        self.assertAlmostEqual(105.0, replicated.simulation_duration.mean)
+        self.assertAlmostEqual(55.0, replicated.processor_task_handling_percentage.mean)
+        self.assertAlmostEqual(35.0, replicated.processor_waiting_percentage.mean)
+        self.assertEqual(Estimate(mean=10.0, low=10.0, high=10.0), replicated.processor_overhead_work_percentage)
+
+
+class TestReplicationsNeeded(TestCase):
+    def test_should_keep_replications_when_interval_is_narrow_enough(self):
+        # then
+        self.assertEqual(3, replications_needed(Estimate(mean=100, low=99, high=101), 3, relative_width=0.05))
+
+    def test_should_scale_replications_with_the_square_of_the_width_ratio(self):
+        # then
+        self.assertEqual(12, replications_needed(Estimate(mean=100, low=95, high=105), 3, relative_width=0.05))
+
+    def test_should_add_a_replication_while_interval_is_unbounded(self):
+        # then
+        self.assertEqual(2, replications_needed(Estimate.of([100.0]), 1, relative_width=0.05))
@@ -0,0 +1,53 @@
+from json import load
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.trace import ChromeTraceWriter
+
+
+class TestChromeTraceWriter(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, "trace.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_close_should_leave_trace_events_of_spans_and_names_of_processors(self):
+        # given
+        writer = ChromeTraceWriter(path=self.path, buffer_size=1)
+
+        # when
+        writer.write_span(processor=1, action="processing", start=0, duration=5, saga="saga\"1")
+        writer.write_span(processor=1, action="overhead", start=5, duration=2, saga=None)
+        writer.close()
+
+        # then
+        with open(self.path) as file:
+            events = load(file)["traceEvents"]
+        self.assertEqual(
+            [
+                {"name": "thread_name", "ph": "M", "pid": 0, "tid": 1, "args": {"name": "processor 1"}},
+                {"name": "saga\"1", "cat": "processing", "ph": "X", "pid": 0, "tid": 1, "ts": 0, "dur": 5},
+                {"name": "overhead", "cat": "overhead", "ph": "X", "pid": 0, "tid": 1, "ts": 5, "dur": 2}
+            ],
+            events
+        )
+
+    def test_close_should_write_empty_trace_once(self):
+        # given
+        writer = ChromeTraceWriter(path=self.path)
+
+        # when
+        writer.close()
+        writer.close()
+
+        # then
+        with open(self.path) as file:
+            self.assertEqual([], load(file)["traceEvents"])
+
+    def test_should_reject_not_positive_buffer_size(self):
+        # when / then
+        with self.assertRaises(ValueError):
+            ChromeTraceWriter(path=self.path, buffer_size=0)